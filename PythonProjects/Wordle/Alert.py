@@ -2,6 +2,7 @@
 
 from typing import Tuple
 from Button import Button
+from HitIndex import HitIndex
 from Style import Style
 
 from Surface import Surface
@@ -13,7 +14,7 @@ from colors import *
 
 class Alert:
 
-    def __init__(self, surface: Surface, text: Text, type: str="Simple"):
+    def __init__(self, surface: Surface, text: Text, type: str="Simple", closable: bool=True):
         """Initializes Alert
 
         Args:
@@ -21,6 +22,7 @@ class Alert:
             surface (Surface): The surface of the alert used to display
             text (Text): The text that will be displayed on the alert
             type (str, optional): The type of the alert: "Simple", "Success", "Danger", "Warning". Defaults to "Simple".
+            closable (bool, optional): Whether the alert has a close button. Defaults to True.
         """
 
         self.surface = surface
@@ -46,14 +48,46 @@ class Alert:
             self.color = (255, 198, 122)
             self.secondaryColor = (175, 108, 22)
 
-        self.closeButton = Button(Surface((self.surface.width * 9 / 10 - 20, self.surface.height / 2 - 20), (40, 40), self.color),
-                                 Style(Text((20, 15), "HelveticaNeueBold.ttf", 40, "x", self.secondaryColor), borderColor=self.secondaryColor, borderRadius=5),
-                                 
-                                  hoverStyle=Style(Text((20, 14), "HelveticaNeueBold.ttf", 44, "x", self.color), fillColor=self.secondaryColor, borderColor=self.color, borderRadius=5))
+        if (closable):
+            self.closeButton = Button(Surface((self.surface.width * 9 / 10 - 20, self.surface.height / 2 - 20), (40, 40), self.color),
+                                     Style(Text((20, 15), "HelveticaNeueBold.ttf", 40, "x", self.secondaryColor), borderColor=self.secondaryColor, borderRadius=5),
+                                     
+                                      hoverStyle=Style(Text((20, 14), "HelveticaNeueBold.ttf", 44, "x", self.color), fillColor=self.secondaryColor, borderColor=self.color, borderRadius=5))
+        else:
+            # an alert that goes away on its own has an empty close button
+            self.closeButton = Button(Surface((0, 0), (0, 0), self.color), Style())
 
         self.rect = Rect(0, 0, self.surface.size[0], self.surface.size[1])
         """The rect of the alert used for rendering"""
 
+        self.dirty = True
+        """Whether the alert looked different the last time it was rendered"""
+
+        self.rendered = False
+        """Whether the alert has been rendered before"""
+
+        self.visible = True
+        """Whether the alert is shown"""
+
+    def show(self, message: str=None, fontSize: int=None):
+        """Shows the alert again, changing its message
+
+        Args:
+            message (str, optional): The message to show. Defaults to None to keep the message.
+            fontSize (int, optional): The size of the message. Defaults to None to keep the size.
+        """
+        if (fontSize != None and fontSize != self.text.fontSize):
+            self.text.resize(fontSize)
+        if (message != None):
+            self.text.text = message
+
+        self.visible = True
+        self.rendered = False
+
+    def hide(self):
+        """Hides the alert so it can be shown again later"""
+        self.visible = False
+
     def render(self, mousePos: Tuple[int, int]=(-1, -1)):
         """Renders the alert
 
@@ -61,13 +95,27 @@ class Alert:
             mousePos (Tuple[int, int], optional): Where the mouse is on the window. Defaults to (-1, -1).
         """
 
+        # a hidden alert has nothing to draw
+        if (not self.visible):
+            self.dirty = False
+            return
+
+        self.closeButton.render((mousePos[0] - self.surface.pos[0], mousePos[1] - self.surface.pos[1]))
+
+        # the alert changed if it just appeared or the close button changed
+        self.dirty = not self.rendered or self.closeButton.dirty
+        self.rendered = True
+
+        # the surface still has the last drawing when nothing changed
+        if (not self.dirty):
+            return
+
         # clear the surface
         self.surface.clear()
 
         pygame.draw.rect(self.surface.display, self.color, self.rect, 0, 10)
         pygame.draw.rect(self.surface.display, self.secondaryColor, (0, 0, 10, self.surface.height), border_top_left_radius=10, border_bottom_left_radius=10)
 
-        self.closeButton.render((mousePos[0] - self.surface.pos[0], mousePos[1] - self.surface.pos[1]))
         self.surface.display.blit(self.closeButton.surface.display, self.closeButton.surface.pos)
 
         self.surface.display.blit(self.text.display, self.text.rect)
@@ -82,6 +130,15 @@ class Alert:
         if (self.closeButton.mouseIsHovering((mousePos[0] - self.surface.pos[0], mousePos[1] - self.surface.pos[1]))):
             return True
         return False
+
+    def register(self, index: HitIndex):
+        """Adds the close button to a screen's hit index so clicks on it can be found
+
+        Args:
+            index (HitIndex): The hit index of the screen
+        """
+        index.add(self, (self.surface.pos[0] + self.closeButton.surface.pos[0], self.surface.pos[1] + self.closeButton.surface.pos[1]),
+                  self.closeButton.surface.size)
         
 
         
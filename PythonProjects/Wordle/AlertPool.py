@@ -0,0 +1,41 @@
+from typing import Tuple
+from Alert import Alert
+from Surface import Surface
+from Text import Text
+from colors import BLACK
+
+
+class AlertPool:
+	"""The alerts at the top of the screens, built once for each type and shown again with a new message
+	"""
+
+	types = ("Simple", "Success", "Danger", "Warning")
+	"""The types of alert in the pool"""
+
+	def __init__(self, pos: Tuple[int, int], size: Tuple[int, int], textPos: Tuple[int, int], font: str, backgroundColor: Tuple[int, int, int]):
+		"""Initializes the AlertPool and builds an alert of each type
+
+		Args:
+			pos (Tuple[int, int]): The position of the alerts on the screen
+			size (Tuple[int, int]): The size of the alerts
+			textPos (Tuple[int, int]): Where the message is centered on an alert
+			font (str): The font of the messages
+			backgroundColor (Tuple[int, int, int]): The background color behind the rounded corners of an alert
+		"""
+		self.alerts = {type: Alert(Surface(pos, size, backgroundColor), Text(textPos, font, 18, "", BLACK), type) for type in self.types}
+		"""The alert of each type. alerts[type] = alert"""
+
+	def get(self, type: str, message: str, fontSize: int=18) -> Alert:
+		"""Shows the alert of a type with a new message
+
+		Args:
+			type (str): The type of alert: "Simple", "Success", "Danger" or "Warning"
+			message (str): The message to show
+			fontSize (int, optional): The size of the message. Defaults to 18.
+
+		Returns:
+			Alert: The alert
+		"""
+		alert = self.alerts[type]
+		alert.show(message, fontSize)
+		return alert
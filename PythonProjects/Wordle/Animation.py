@@ -0,0 +1,47 @@
+from typing import Callable
+
+
+class Animation:
+	"""Something that happens over time on a Timeline, like a tile flipping or a delay before a screen is shown
+	"""
+	def __init__(self, start: int, duration: int, onUpdate: Callable[[float], None]=None, onDone: Callable[[], None]=None):
+		"""Initializes the Animation
+
+		Args:
+			start (int): When the animation starts in milliseconds since pygame started
+			duration (int): How many milliseconds the animation lasts
+			onUpdate (Callable[[float], None], optional): Called every frame while the animation runs with how far through it is, from 0 to 1. Defaults to None.
+			onDone (Callable[[], None], optional): Called once the animation ends. Defaults to None.
+		"""
+		self.start = start
+		"""When the animation starts in milliseconds since pygame started"""
+
+		self.duration = duration
+		"""How many milliseconds the animation lasts"""
+
+		self.onUpdate = onUpdate
+		"""Called every frame while the animation runs with how far through it is, from 0 to 1"""
+
+		self.onDone = onDone
+		"""Called once the animation ends"""
+
+		self.done = False
+		"""Whether the animation ended or was cancelled"""
+
+	@property
+	def end(self) -> int:
+		"""When the animation ends in milliseconds since pygame started"""
+		return self.start + self.duration
+
+	def progress(self, now: int) -> float:
+		"""Determines how far through the animation a time is
+
+		Args:
+			now (int): The time in milliseconds since pygame started
+
+		Returns:
+			float: 0 before the animation starts up to 1 once it ends
+		"""
+		if (self.duration <= 0):
+			return 1.0 if now >= self.start else 0.0
+		return min(1.0, max(0.0, (now - self.start) / self.duration))
@@ -1,6 +1,7 @@
 from typing import Tuple
 import pygame
 from pygame.locals import *
+from HitIndex import HitIndex
 from Style import Style
 from Surface import Surface
 		
@@ -25,6 +26,12 @@ class Button:
 		self.rect = Rect(0, 0, self.surface.size[0], self.surface.size[1])
 		"""The Rect of the button used for rendering"""
 
+		self.dirty = True
+		"""Whether the button looked different the last time it was rendered"""
+
+		self.lastState = None
+		"""What the button looked like the last time it was rendered"""
+
 	def render(self, mousePos: Tuple[int, int]=(-1, -1)):
 		"""Renders the Button
 
@@ -32,11 +39,25 @@ class Button:
 			mousePos (Tuple[int, int], optional): Where the mouse is on the screen. Defaults to (-1, -1).
 		"""
 
+		hovering = self.hoverStyle != None and self.mouseIsHovering(mousePos)
+
+		# check to see if the button looks different than last time
+		style = self.hoverStyle if hovering else self.style
+		state = (style, style.fillColor, style.borderColor, style.borderWidth, style.borderRadius,
+				style.text.display if style.text != None else None, tuple(style.text.rect) if style.text != None else None)
+		self.dirty = state != self.lastState
+		self.lastState = state
+
+		# the surface still has the last drawing when nothing changed
+		if (not self.dirty):
+			return
+
 		# clear the surface
 		self.surface.clear()
+
 		# If we want to hover and the mouse is hovering over the button
 		# Changes the style of the button
-		if (self.hoverStyle != None and self.mouseIsHovering(mousePos)):
+		if (hovering):
 
 			# fills the button
 			if (self.hoverStyle.fillColor != None):
@@ -84,4 +105,13 @@ class Button:
 		if (self.surface.pos[0] <= mousePos[0] <= self.surface.pos[0] + self.surface.size[0] and self.surface.pos[1] <= mousePos[1] <= self.surface.pos[1] + self.surface.size[1]):
 			return True
 
-		return False
\ No newline at end of file
+		return False
+
+	def register(self, index: HitIndex, offset: Tuple[int, int]=(0, 0)):
+		"""Adds the button to a screen's hit index so clicks on it can be found
+
+		Args:
+			index (HitIndex): The hit index of the screen
+			offset (Tuple[int, int], optional): The position of the surface the button is on. Defaults to (0, 0).
+		"""
+		index.add(self, (self.surface.pos[0] + offset[0], self.surface.pos[1] + offset[1]), self.surface.size)
\ No newline at end of file
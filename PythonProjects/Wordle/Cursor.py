@@ -27,6 +27,12 @@ class Cursor:
 
         self.rect = Rect(text.rect.topright, (width, text.rect.height))
 
+        self.dirty = True
+        """Whether the cursor looked different the last time it was rendered"""
+
+        self.lastState = None
+        """What the cursor looked like the last time it was rendered"""
+
     def move(self, text: Text):
         """Moves the cursor to the correct spot with the text
 
@@ -42,5 +48,28 @@ class Cursor:
         Args:
             surface (pygame.Surface): The surface to render on
         """
-        if (time.time() % 1 > 0.5):
+        visible = self.isVisible()
+
+        # check to see if the cursor blinked or moved since last time
+        state = (visible, self.rect.topleft)
+        self.dirty = state != self.lastState
+        self.lastState = state
+
+        if (visible):
             pygame.draw.rect(surface, self.color, self.rect)
+
+    def isVisible(self) -> bool:
+        """Determines whether the cursor is showing or hidden in the blink
+
+        Returns:
+            bool: Whether the cursor is showing
+        """
+        return time.time() % 1 > 0.5
+
+    def nextBlink(self) -> float:
+        """Determines how long until the cursor shows or hides
+
+        Returns:
+            float: The seconds until the cursor blinks
+        """
+        return 0.5 - time.time() % 0.5
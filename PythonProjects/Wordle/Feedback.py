@@ -0,0 +1,98 @@
+class Feedback:
+	"""Scores guesses against the secret word
+
+	The feedback for a guess is a pattern: a base 3 number with one digit for each letter, the first letter being the lowest digit.
+	"""
+
+	gray = 0
+	"""The letter isn't in the word"""
+	yellow = 1
+	"""The letter is in the word but in a different spot"""
+	green = 2
+	"""The letter is in the correct spot"""
+
+	@staticmethod
+	def states(guess: str, answer: str) -> list[int]:
+		"""Scores each letter of a guess
+
+		Args:
+			guess (str): The guessed word
+			answer (str): The word the player is trying to guess
+
+		Returns:
+			list[int]: The state of each letter. Feedback.green, Feedback.yellow or Feedback.gray
+		"""
+		states = [Feedback.gray] * len(guess)
+		remaining = {}
+
+		# turn the letters in the correct spot green and count the letters that are left over
+		for j in range(0, len(guess)):
+			if (guess[j] == answer[j]):
+				states[j] = Feedback.green
+			else:
+				remaining[answer[j]] = remaining.get(answer[j], 0) + 1
+
+		# turn the letters that are somewhere else in the word yellow
+		for j in range(0, len(guess)):
+			if (states[j] != Feedback.green and remaining.get(guess[j], 0) > 0):
+				states[j] = Feedback.yellow
+				remaining[guess[j]] -= 1
+
+		return states
+
+	@staticmethod
+	def encode(states: list[int]) -> int:
+		"""Turns the state of each letter into a pattern
+
+		Args:
+			states (list[int]): The state of each letter
+
+		Returns:
+			int: The pattern
+		"""
+		pattern = 0
+		for state in reversed(states):
+			pattern = pattern * 3 + state
+		return pattern
+
+	@staticmethod
+	def decode(pattern: int, wordLength: int=5) -> list[int]:
+		"""Turns a pattern back into the state of each letter
+
+		Args:
+			pattern (int): The pattern
+			wordLength (int, optional): The number of letters in the word. Defaults to 5.
+
+		Returns:
+			list[int]: The state of each letter
+		"""
+		states = []
+		for _ in range(wordLength):
+			states.append(pattern % 3)
+			pattern //= 3
+		return states
+
+	@staticmethod
+	def score(guess: str, answer: str) -> int:
+		"""Scores a guess
+
+		Args:
+			guess (str): The guessed word
+			answer (str): The word the player is trying to guess
+
+		Returns:
+			int: The pattern for the guess
+		"""
+		return Feedback.encode(Feedback.states(guess, answer))
+
+	@staticmethod
+	def solved(wordLength: int=5) -> int:
+		"""Returns the pattern of a correct guess
+
+		Args:
+			wordLength (int, optional): The number of letters in the word. Defaults to 5.
+
+		Returns:
+			int: The pattern with every letter green
+		"""
+		return 3 ** wordLength - 1
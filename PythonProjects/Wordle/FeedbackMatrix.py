@@ -0,0 +1,233 @@
+import argparse
+from typing import Iterable
+import numpy as np
+from Feedback import Feedback
+from WordIndex import WordIndex
+
+
+class FeedbackMatrix:
+	"""The feedback pattern of every guess against every answer, scored with NumPy
+
+	matrix[i, j] is the pattern for guesses[i] against answers[j]. Patterns are encoded the same way as Feedback.
+	"""
+	def __init__(self, guesses: np.ndarray, answers: np.ndarray, matrix: np.ndarray=None):
+		"""Initializes the FeedbackMatrix, scoring every guess if the matrix isn't given
+
+		Args:
+			guesses (np.ndarray): The letters of the guesses. One row of letter codes for each word
+			answers (np.ndarray): The letters of the answers. One row of letter codes for each word
+			matrix (np.ndarray, optional): The already scored patterns. Defaults to None.
+		"""
+		self.guesses = guesses
+		"""The letters of the guesses. One row of letter codes for each word"""
+
+		self.answers = answers
+		"""The letters of the answers. One row of letter codes for each word"""
+
+		self.matrix = matrix if matrix is not None else self.scoreMany(guesses, answers)
+		"""The pattern for every guess against every answer. matrix[guess, answer] = pattern"""
+
+		self.guessIndices = {word: index for index, word in enumerate(self.words(guesses))}
+		"""Where each guess is in the matrix. guessIndices[word] = row"""
+
+	@classmethod
+	def build(cls, guesses: Iterable[str], answers: Iterable[str]=None) -> "FeedbackMatrix":
+		"""Scores every guess against every answer
+
+		Args:
+			guesses (Iterable[str]): The words that can be guessed
+			answers (Iterable[str], optional): The words that can be the secret word. Defaults to the guesses.
+
+		Returns:
+			FeedbackMatrix: The scored matrix
+		"""
+		guessLetters = cls.toArray(guesses)
+		answerLetters = guessLetters if answers is None else cls.toArray(answers)
+		return cls(guessLetters, answerLetters)
+
+	@staticmethod
+	def toArray(words: Iterable[str]) -> np.ndarray:
+		"""Packs words into an array of letter codes
+
+		Args:
+			words (Iterable[str]): The words to pack. A WordIndex is packed without decoding its words
+
+		Returns:
+			np.ndarray: A uint8 array with one row for each word
+		"""
+		if (isinstance(words, WordIndex)):
+			return np.frombuffer(bytes(words.codes), dtype=np.uint8).reshape(len(words), words.wordLength)
+
+		words = [word.lower() for word in words]
+		wordLength = len(words[0]) if words else 5
+		return np.frombuffer("".join(words).encode("ascii"), dtype=np.uint8).reshape(len(words), wordLength)
+
+	@staticmethod
+	def words(letters: np.ndarray) -> list[str]:
+		"""Unpacks an array of letter codes back into words
+
+		Args:
+			letters (np.ndarray): The letter codes with one row for each word
+
+		Returns:
+			list[str]: The words
+		"""
+		wordLength = letters.shape[1]
+		packed = letters.tobytes().decode("ascii")
+		return [packed[i:i + wordLength] for i in range(0, len(packed), wordLength)]
+
+	@staticmethod
+	def patternType(wordLength: int) -> np.dtype:
+		"""Returns the smallest integer type that holds every pattern
+
+		Args:
+			wordLength (int): The number of letters in the words
+
+		Returns:
+			np.dtype: uint8 for words up to 5 letters, otherwise uint16
+		"""
+		return np.dtype(np.uint8) if 3 ** wordLength <= 256 else np.dtype(np.uint16)
+
+	@staticmethod
+	def scoreMany(guesses: np.ndarray, answers: np.ndarray, chunkSize: int=256) -> np.ndarray:
+		"""Scores a batch of guesses against every answer
+
+		Args:
+			guesses (np.ndarray): The letters of the guesses. One row of letter codes for each word
+			answers (np.ndarray): The letters of the answers. One row of letter codes for each word
+			chunkSize (int, optional): How many guesses to score at once. Bigger is faster but uses more memory. Defaults to 256.
+
+		Returns:
+			np.ndarray: The patterns. result[guess, answer] = pattern
+		"""
+		wordLength = answers.shape[1]
+		patterns = np.empty((len(guesses), len(answers)), dtype=FeedbackMatrix.patternType(wordLength))
+
+		# counts[letter, a] is how many times the letter is in answer a
+		counts = np.zeros((256, len(answers)), dtype=np.int8)
+		for k in range(wordLength):
+			np.add.at(counts, (answers[:, k], np.arange(len(answers))), 1)
+
+		for start in range(0, len(guesses), chunkSize):
+			chunk = guesses[start:start + chunkSize]
+
+			# green[j][g, a] is whether letter j of guess g is in the same spot in answer a
+			green = [chunk[:, j, None] == answers[None, :, j] for j in range(wordLength)]
+			chunkPatterns = np.zeros((len(chunk), len(answers)), dtype=np.int32)
+
+			for j in range(wordLength):
+				# available is how many times letter j of the guess is in the answer outside of the green spots
+				# used is how many earlier letters of the guess are the same letter and not green
+				available = counts[chunk[:, j]].copy()
+				used = np.zeros_like(available)
+				for k in range(wordLength):
+					sameLetter = (chunk[:, k] == chunk[:, j])[:, None]
+					available -= green[k] & sameLetter
+					if (k < j):
+						used += ~green[k] & sameLetter
+
+				# a letter is yellow while there are copies of it left over in the answer
+				yellow = ~green[j] & (used < available)
+				chunkPatterns += (green[j] * Feedback.green + yellow * Feedback.yellow) * 3 ** j
+
+			patterns[start:start + chunkSize] = chunkPatterns
+
+		return patterns
+
+	@staticmethod
+	def scoreAll(guess: str, answers: np.ndarray) -> np.ndarray:
+		"""Scores one guess against every answer
+
+		Args:
+			guess (str): The guessed word
+			answers (np.ndarray): The letters of the answers. One row of letter codes for each word
+
+		Returns:
+			np.ndarray: The pattern for each answer
+		"""
+		return FeedbackMatrix.scoreMany(FeedbackMatrix.toArray([guess]), answers)[0]
+
+	def row(self, guess: str) -> np.ndarray:
+		"""Returns the patterns of a guess against every answer
+
+		Args:
+			guess (str): The guessed word
+
+		Returns:
+			np.ndarray: The pattern for each answer
+		"""
+		index = self.guessIndices.get(guess.lower())
+		if (index == None):
+			return self.scoreAll(guess, self.answers)
+		return self.matrix[index]
+
+	def save(self, path: str):
+		"""Writes the matrix and its words to a .npz file
+
+		Args:
+			path (str): The path to write to
+		"""
+		with open(path, "wb") as file:
+			np.savez(file, guesses=self.guesses, answers=self.answers, matrix=self.matrix)
+
+	@classmethod
+	def load(cls, path: str) -> "FeedbackMatrix":
+		"""Reads a matrix written by save
+
+		Args:
+			path (str): The path to read from
+
+		Raises:
+			ValueError: If the matrix doesn't match the size of its words
+
+		Returns:
+			FeedbackMatrix: The loaded matrix
+		"""
+		with np.load(path) as data:
+			guesses, answers, matrix = data["guesses"], data["answers"], data["matrix"]
+
+		if (matrix.shape != (len(guesses), len(answers))):
+			raise ValueError(f"{path} has a {matrix.shape} matrix for {len(guesses)} guesses and {len(answers)} answers")
+
+		return cls(guesses, answers, matrix)
+
+	@classmethod
+	def open(cls, path: str, guesses: Iterable[str], answers: Iterable[str]=None) -> "FeedbackMatrix":
+		"""Loads the matrix from a file if it was built for the same words, otherwise builds it and saves it there
+
+		Args:
+			path (str): The path of the saved matrix
+			guesses (Iterable[str]): The words that can be guessed
+			answers (Iterable[str], optional): The words that can be the secret word. Defaults to the guesses.
+
+		Returns:
+			FeedbackMatrix: The matrix for the words
+		"""
+		guessLetters = cls.toArray(guesses)
+		answerLetters = guessLetters if answers is None else cls.toArray(answers)
+
+		try:
+			feedback = cls.load(path)
+			if (np.array_equal(feedback.guesses, guessLetters) and np.array_equal(feedback.answers, answerLetters)):
+				return feedback
+		except (OSError, ValueError, KeyError):
+			pass
+
+		feedback = cls(guessLetters, answerLetters)
+		try:
+			feedback.save(path)
+		except OSError:
+			pass
+		return feedback
+
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Scores every word in a word list against every other word and saves the matrix")
+	parser.add_argument("words", help="the text word list with one word on each line")
+	parser.add_argument("output", nargs="?", default="FeedbackMatrix.npz", help="where to write the matrix")
+	parser.add_argument("--length", type=int, default=5, help="the number of letters in every word")
+	arguments = parser.parse_args()
+
+	feedback = FeedbackMatrix.build(WordIndex.open(arguments.words, arguments.length))
+	feedback.save(arguments.output)
+	print(f"Scored {feedback.matrix.size} guesses into {arguments.output}")
@@ -0,0 +1,54 @@
+import pygame
+
+
+class FontRegistry:
+	"""Loads each font once per process and shares it between everything that uses it
+	"""
+
+	fonts = {}
+	"""The loaded fonts. fonts[(font, fontSize)] = pygame.font.Font"""
+
+	hits = 0
+	"""The number of times a font was already loaded"""
+
+	misses = 0
+	"""The number of times a font had to be loaded"""
+
+	@classmethod
+	def get(cls, font: str, fontSize: int) -> pygame.font.Font:
+		"""Returns the font with the given size, loading it the first time it is asked for
+
+		Args:
+			font (str): The path to the font file. None for the default font
+			fontSize (int): The size of the font
+
+		Returns:
+			pygame.font.Font: The loaded font
+		"""
+		key = (font, fontSize)
+		loadedFont = cls.fonts.get(key)
+
+		if (loadedFont == None):
+			cls.misses += 1
+			loadedFont = pygame.font.Font(font, fontSize)
+			cls.fonts[key] = loadedFont
+		else:
+			cls.hits += 1
+
+		return loadedFont
+
+	@classmethod
+	def stats(cls) -> dict[str, int]:
+		"""Returns how well the registry is doing
+
+		Returns:
+			dict[str, int]: The number of hits, misses and loaded fonts
+		"""
+		return {"hits": cls.hits, "misses": cls.misses, "fonts": len(cls.fonts)}
+
+	@classmethod
+	def clear(cls):
+		"""Forgets all of the loaded fonts and resets the counters"""
+		cls.fonts.clear()
+		cls.hits = 0
+		cls.misses = 0
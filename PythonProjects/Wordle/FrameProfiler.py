@@ -0,0 +1,186 @@
+from collections import deque
+from typing import Tuple
+import json
+import time
+import pygame
+from pygame.locals import *
+from FontRegistry import FontRegistry
+from colors import WHITE
+
+
+class FrameProfiler:
+	"""Times the stages of each frame and keeps the rolling percentiles of each stage
+
+	The main loop calls begin at the start of a frame, mark at the end of each stage and end once the frame is shown.
+	Every frame can be saved as a row of a .csv file or as spans of a .json trace that chrome://tracing
+	and Perfetto can load. When the profiler is disabled every call returns straight away.
+	"""
+
+	stages = ("events", "update", "render", "blit", "overlay", "present")
+	"""The stages of a frame in the order they happen"""
+
+	def __init__(self, enabled: bool=False, path: str=None, samples: int=600, refreshEvery: int=30, font: str=None):
+		"""Initializes the FrameProfiler
+
+		Args:
+			enabled (bool, optional): Whether to time the frames. Defaults to False.
+			path (str, optional): Where to save every frame. A .csv file or a .json trace. Defaults to None to not save them.
+			samples (int, optional): How many of the latest frames the percentiles are taken over. Defaults to 600.
+			refreshEvery (int, optional): How many frames pass between updates of the percentiles. Defaults to 30.
+			font (str, optional): The font of the overlay. Defaults to None for the default font.
+		"""
+		self.enabled = enabled
+		"""Whether to time the frames"""
+
+		self.refreshEvery = refreshEvery
+		"""How many frames pass between updates of the percentiles"""
+
+		self.font = font
+		"""The font of the overlay"""
+
+		self.showOverlay = False
+		"""Whether the percentiles are drawn on the window"""
+
+		self.frame = 0
+		"""The number of frames that have been timed"""
+
+		self.history = {stage: deque(maxlen=samples) for stage in self.stages + ("total",)}
+		"""The latest seconds of each stage and of the whole frame. history[stage] = deque"""
+
+		self.summary = {}
+		"""The last percentiles in milliseconds. summary[stage] = (p50, p95, p99)"""
+
+		self.overlay = None
+		"""The rendered percentiles. None until they are drawn after they change"""
+
+		self.spans = []
+		"""The stages of the current frame. spans = [(stage, start, seconds)]"""
+
+		self.start = 0.0
+		"""When the current frame started"""
+
+		self.last = 0.0
+		"""When the last stage of the current frame ended"""
+
+		self.origin = time.perf_counter()
+		"""When the profiler was made. The saved times are measured from it"""
+
+		self.file = None
+		"""The file every frame is saved to. None if they aren't saved"""
+
+		self.trace = path != None and path.endswith(".json")
+		"""Whether the frames are saved as a trace instead of a .csv file"""
+
+		if (enabled and path != None):
+			self.file = open(path, "w")
+			# a trace viewer doesn't need the closing bracket so the spans can be written as they happen
+			self.file.write("[\n" if self.trace else ",".join(("frame", "start") + self.stages + ("total",)) + "\n")
+
+	def begin(self):
+		"""Starts timing a frame"""
+		if (not self.enabled):
+			return
+		self.start = self.last = time.perf_counter()
+		self.spans = []
+
+	def mark(self, stage: str):
+		"""Ends a stage of the current frame
+
+		Args:
+			stage (str): The stage that just ended. One of stages
+		"""
+		if (not self.enabled):
+			return
+		now = time.perf_counter()
+		self.spans.append((stage, self.last, now - self.last))
+		self.last = now
+
+	def end(self):
+		"""Ends the current frame, adding it to the percentiles and saving it"""
+		if (not self.enabled):
+			return
+		seconds = dict.fromkeys(self.stages, 0.0)
+		for stage, start, duration in self.spans:
+			seconds[stage] += duration
+		seconds["total"] = self.last - self.start
+
+		for stage, duration in seconds.items():
+			self.history[stage].append(duration)
+
+		if (self.file != None):
+			self.save(seconds)
+
+		self.frame += 1
+		if (self.frame % self.refreshEvery == 0):
+			self.summary = self.percentiles()
+			self.overlay = None
+
+	def save(self, seconds: dict[str, float]):
+		"""Writes the current frame to the file
+
+		Args:
+			seconds (dict[str, float]): The seconds of each stage and of the whole frame
+		"""
+		if (self.trace):
+			events = [{"name": f"frame {self.frame}", "ph": "X", "pid": 1, "tid": 1,
+						"ts": round((self.start - self.origin) * 1e6, 1), "dur": round(seconds["total"] * 1e6, 1)}]
+			events += [{"name": stage, "ph": "X", "pid": 1, "tid": 1, "ts": round((start - self.origin) * 1e6, 1), "dur": round(duration * 1e6, 1)}
+						for stage, start, duration in self.spans]
+			self.file.write("".join(json.dumps(event) + ",\n" for event in events))
+		else:
+			values = [self.frame, round((self.start - self.origin) * 1000, 3)] + [round(seconds[stage] * 1000, 3) for stage in self.stages + ("total",)]
+			self.file.write(",".join(str(value) for value in values) + "\n")
+
+	def percentiles(self) -> dict[str, Tuple[float, float, float]]:
+		"""Works out the percentiles of each stage over the latest frames
+
+		Returns:
+			dict[str, Tuple[float, float, float]]: The p50, p95 and p99 in milliseconds. percentiles()[stage] = (p50, p95, p99)
+		"""
+		summary = {}
+		for stage, history in self.history.items():
+			if (not history):
+				continue
+			ordered = sorted(history)
+			last = len(ordered) - 1
+			summary[stage] = tuple(ordered[round(last * percent)] * 1000 for percent in (0.5, 0.95, 0.99))
+		return summary
+
+	def toggleOverlay(self):
+		"""Shows or hides the percentiles on the window"""
+		self.showOverlay = not self.showOverlay
+
+	def drawOverlay(self, display: pygame.Surface) -> Rect:
+		"""Draws the percentiles in the corner of the window
+
+		Args:
+			display (pygame.Surface): The surface of the window
+
+		Returns:
+			Rect: Where the overlay was drawn or None if it isn't shown
+		"""
+		if (not self.enabled or not self.showOverlay):
+			return None
+
+		# only render the percentiles again after they change
+		if (self.overlay == None):
+			font = FontRegistry.get(self.font, 12)
+			rows = [("stage", "p50", "p95", "p99 ms")]
+			rows += [(stage, f"{p50:.2f}", f"{p95:.2f}", f"{p99:.2f}") for stage, (p50, p95, p99) in self.summary.items()]
+
+			lineHeight = font.get_linesize()
+			self.overlay = pygame.Surface((200, lineHeight * len(rows) + 10), pygame.SRCALPHA)
+			self.overlay.fill((0, 0, 0, 190))
+
+			# the font isn't monospaced so each column starts at its own x
+			for i, row in enumerate(rows):
+				for x, cell in zip((5, 65, 110, 155), row):
+					self.overlay.blit(font.render(cell, True, WHITE), (x, 5 + i * lineHeight))
+
+		return display.blit(self.overlay, (5, 55))
+
+	def close(self):
+		"""Closes the file the frames are saved to"""
+		if (self.file != None):
+			self.file.close()
+			self.file = None
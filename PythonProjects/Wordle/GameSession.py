@@ -0,0 +1,137 @@
+import random
+import time
+from typing import Container, Sequence
+from Feedback import Feedback
+
+
+class GameSession:
+	"""One game of Wordle with all of the rules and none of the rendering
+	"""
+	def __init__(self, secretWord: str, acceptedWords: Container[str], maxGuesses: int=6):
+		"""Initializes the GameSession
+
+		Args:
+			secretWord (str): The word the player is trying to guess
+			acceptedWords (Container[str]): The words that can be guessed
+			maxGuesses (int, optional): The number of guesses the player gets. Defaults to 6.
+		"""
+		self.secretWord = secretWord.upper()
+		"""The word the player is trying to guess"""
+
+		self.acceptedWords = acceptedWords
+		"""The words that can be guessed"""
+
+		self.maxGuesses = maxGuesses
+		"""The number of guesses the player gets"""
+
+		self.guesses = []
+		"""The words that have been guessed"""
+
+		self.feedback = []
+		"""The pattern each guess got"""
+
+		self.states = []
+		"""The state of each letter of each guess. Feedback.green, Feedback.yellow or Feedback.gray"""
+
+		self.greenLetters = ""
+		"""The letters that have been in the correct spot"""
+
+		self.yellowLetters = ""
+		"""The letters that have been in the word but in a different spot"""
+
+		self.blackLetters = ""
+		"""The letters that have been guessed where there wasn't one left in the word"""
+
+		self.startTime = time.time()
+		"""When the game started"""
+
+		self.endTime = None
+		"""When the game ended"""
+
+	@classmethod
+	def random(cls, words: Sequence[str], rng: random.Random=random, maxGuesses: int=6) -> "GameSession":
+		"""Starts a game with a random secret word
+
+		Args:
+			words (Sequence[str]): The words that can be guessed and can be the secret word
+			rng (random.Random, optional): The random number generator to use. Defaults to the random module.
+			maxGuesses (int, optional): The number of guesses the player gets. Defaults to 6.
+
+		Returns:
+			GameSession: The new game
+		"""
+		return cls(rng.choice(words), words, maxGuesses)
+
+	def isValid(self, word: str) -> bool:
+		"""Determines whether a word can be guessed
+
+		Args:
+			word (str): The word to check
+
+		Returns:
+			bool: Whether the word is the right length and an accepted word
+		"""
+		return len(word) == len(self.secretWord) and word.lower() in self.acceptedWords
+
+	def guess(self, word: str) -> int:
+		"""Guesses a word
+
+		Args:
+			word (str): The word to guess
+
+		Raises:
+			ValueError: If the game is over or the word can't be guessed
+
+		Returns:
+			int: The pattern the guess got
+		"""
+		if (self.isOver):
+			raise ValueError("The game is over")
+		if (not self.isValid(word)):
+			raise ValueError(f"{word} is not in the word list")
+
+		word = word.upper()
+		states = Feedback.states(word, self.secretWord)
+		pattern = Feedback.encode(states)
+
+		self.guesses.append(word)
+		self.feedback.append(pattern)
+		self.states.append(states)
+
+		# keep track of what the guess showed about each letter
+		for letter, state in zip(word, states):
+			if (state == Feedback.green and letter not in self.greenLetters):
+				self.greenLetters += letter
+			elif (state == Feedback.yellow and letter not in self.yellowLetters):
+				self.yellowLetters += letter
+			elif (state == Feedback.gray and letter not in self.blackLetters):
+				self.blackLetters += letter
+
+		if (self.isOver):
+			self.endTime = time.time()
+
+		return pattern
+
+	@property
+	def isWon(self) -> bool:
+		"""Whether the secret word has been guessed"""
+		return len(self.guesses) > 0 and self.guesses[-1] == self.secretWord
+
+	@property
+	def isOver(self) -> bool:
+		"""Whether the game has ended"""
+		return self.isWon or len(self.guesses) >= self.maxGuesses
+
+	@property
+	def result(self) -> str:
+		"""The result of the game: "win", "lose" or None if it isn't over"""
+		if (self.isWon):
+			return "win"
+		if (self.isOver):
+			return "lose"
+		return None
+
+	@property
+	def duration(self) -> float:
+		"""How many seconds the game has taken"""
+		return (self.endTime or time.time()) - self.startTime
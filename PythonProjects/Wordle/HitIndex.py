@@ -0,0 +1,74 @@
+from typing import Tuple
+
+
+class HitIndex:
+	"""Finds the widget under the mouse on a screen
+
+	The screen is split into a uniform grid and each widget is listed in the cells it covers,
+	so finding the widget at a point only checks the few widgets in that point's cell.
+	When widgets overlap the one added last is on top.
+	"""
+	def __init__(self, cellSize: int=50):
+		"""Initializes the HitIndex
+
+		Args:
+			cellSize (int, optional): The width and height of a cell of the grid. Defaults to 50.
+		"""
+		self.cellSize = cellSize
+		"""The width and height of a cell of the grid"""
+
+		self.cells = {}
+		"""The widgets in each cell from the bottom up. cells[(column, row)] = [(widget, left, top, right, bottom)]"""
+
+		self.widgets = {}
+		"""The cells each widget is listed in. widgets[id(widget)] = [(column, row)]"""
+
+	def add(self, widget: object, pos: Tuple[float, float], size: Tuple[float, float]):
+		"""Adds a widget on top of the others
+
+		Args:
+			widget (object): What to return when the mouse is over the area. Usually the widget itself
+			pos (Tuple[float, float]): The position of the area on the screen
+			size (Tuple[float, float]): The width and height of the area
+		"""
+		self.remove(widget)
+
+		# the edges count as part of the widget, the same as mouseIsHovering
+		entry = (widget, pos[0], pos[1], pos[0] + size[0], pos[1] + size[1])
+		cells = [(column, row) for column in range(int(entry[1] // self.cellSize), int(entry[3] // self.cellSize) + 1)
+				for row in range(int(entry[2] // self.cellSize), int(entry[4] // self.cellSize) + 1)]
+		for cell in cells:
+			self.cells.setdefault(cell, []).append(entry)
+		self.widgets[id(widget)] = cells
+
+	def remove(self, widget: object):
+		"""Removes a widget if it was added
+
+		Args:
+			widget (object): The widget
+		"""
+		for cell in self.widgets.pop(id(widget), []):
+			self.cells[cell] = [entry for entry in self.cells[cell] if entry[0] is not widget]
+
+	def clear(self):
+		"""Removes every widget"""
+		self.cells.clear()
+		self.widgets.clear()
+
+	def at(self, mousePos: Tuple[int, int]) -> object:
+		"""Finds the top widget under the mouse
+
+		Args:
+			mousePos (Tuple[int, int]): The position of the mouse on the screen
+
+		Returns:
+			object: The widget or None if the mouse isn't over one
+		"""
+		entries = self.cells.get((int(mousePos[0] // self.cellSize), int(mousePos[1] // self.cellSize)))
+		if (entries == None):
+			return None
+
+		for widget, left, top, right, bottom in reversed(entries):
+			if (left <= mousePos[0] <= right and top <= mousePos[1] <= bottom):
+				return widget
+		return None
@@ -0,0 +1,121 @@
+from typing import Tuple
+import pygame
+from pygame.locals import *
+from Button import Button
+from Feedback import Feedback
+from HitIndex import HitIndex
+from Style import Style
+from Surface import Surface
+from Text import Text
+from colors import *
+
+
+class Keyboard:
+	"""The on screen keyboard at the bottom of the window
+
+	Every key is rendered once for each state and whether the mouse is over it, so drawing the keyboard
+	only blits the finished sprites. The state of the keys only changes when a guess is entered.
+	"""
+
+	colors = {None: (LIGHTGRAY, GRAY), Feedback.gray: (DARKGRAY, DARKERGRAY),
+			Feedback.yellow: (YELLOW, DARKYELLOW), Feedback.green: (GREEN, DARKGREEN)}
+	"""The fill color of a key for each state. colors[state] = (color, hover color)"""
+
+	def __init__(self, size: Tuple[int, int], keyboardHeight: int, margin: Tuple[int, int], font: str, backgroundColor: Tuple[int, int, int]):
+		"""Initializes the Keyboard and renders every key
+
+		Args:
+			size (Tuple[int, int]): The size of the window the keyboard is at the bottom of
+			keyboardHeight (int): The height of the keyboard
+			margin (Tuple[int, int]): The space between the keys. margin[0] is x and margin[1] is y.
+			font (str): The font the letters on the keys are
+			backgroundColor (Tuple[int, int, int]): The background color behind the rounded corners of a key
+		"""
+		width, height = size
+		keyHeight = (keyboardHeight - margin[1] * 3) / 3
+		keyWidth = (width - margin[0] * 11) / 10
+
+		self.keys = {}
+		"""Where each key is. keys[key] = (pos, size)"""
+
+		for i, letter in enumerate("QWERTYUIOP"):
+			self.keys[letter] = ((i * keyWidth + (i + 1) * margin[0], height - keyboardHeight), (keyWidth, keyHeight))
+
+		for i, letter in enumerate("ASDFGHJKL"):
+			self.keys[letter] = ((i * keyWidth + ((i + 1) * margin[0] + margin[0] / 2) + (keyWidth / 2), height - keyboardHeight * 2 / 3), (keyWidth, keyHeight))
+
+		self.keys["ENTER"] = ((margin[0] + 2, height - keyboardHeight / 3), (keyWidth * 3 / 2, keyHeight))
+		for i, letter in enumerate("ZXCVBNM"):
+			self.keys[letter] = ((i * keyWidth + ((i + 1) * margin[0] + margin[0] * 3 / 2) + keyWidth * 3 / 2, height - keyboardHeight / 3), (keyWidth, keyHeight))
+		self.keys["BACK"] = ((keyWidth * 17 / 2 + margin[0] * 9 + 3, height - keyboardHeight / 3), (keyWidth * 3 / 2, keyHeight))
+
+		self.sprites = {}
+		"""The rendered keys. sprites[(key, state, hovering)] = surface"""
+
+		for key, (pos, keySize) in self.keys.items():
+			# the longer keys have smaller text
+			fontSize = 12 if len(key) > 1 else 14
+			center = (keySize[0] / 2, keySize[1] / 2)
+			for state, (color, hoverColor) in self.colors.items():
+				button = Button(Surface((0, 0), keySize, backgroundColor),
+								Style(Text(center, font, fontSize, key, WHITE), borderRadius=3, fillColor=color),
+								hoverStyle=Style(Text(center, font, fontSize + 1, key, WHITE), borderRadius=3, fillColor=hoverColor))
+				button.render()
+				self.sprites[(key, state, False)] = button.surface.display.copy()
+				button.render((0, 0))
+				self.sprites[(key, state, True)] = button.surface.display.copy()
+
+		self.states = {}
+		"""The state of each letter that has been guessed. states[letter] = Feedback.green, Feedback.yellow or Feedback.gray"""
+
+		self.lastLooks = {}
+		"""What each key looked like the last time it was rendered. lastLooks[key] = (state, hovering)"""
+
+	def reset(self):
+		"""Clears the state of every key for a new game"""
+		self.states.clear()
+		self.lastLooks.clear()
+
+	def push(self, word: str, states: list[int]):
+		"""Colors the keys of a guess that was entered
+
+		Args:
+			word (str): The guessed word
+			states (list[int]): The state of each letter. Feedback.green, Feedback.yellow or Feedback.gray
+		"""
+		for letter, state in zip(word, states):
+			# a key keeps the best state its letter has had
+			if (self.states.get(letter, -1) < state):
+				self.states[letter] = state
+
+	def register(self, index: HitIndex):
+		"""Adds the keys to a screen's hit index. The index finds a key as its name, like "A" or "ENTER"
+
+		Args:
+			index (HitIndex): The hit index of the screen
+		"""
+		for key, (pos, size) in self.keys.items():
+			index.add(key, pos, size)
+
+	def render(self, display: pygame.Surface, hovered: object, redrawAll: bool=True) -> list[Rect]:
+		"""Draws the keyboard
+
+		Args:
+			display (pygame.Surface): The surface to draw the keyboard on
+			hovered (object): What the screen's hit index found under the mouse
+			redrawAll (bool, optional): Whether to draw every key or only the ones that look different than last time. Defaults to True.
+
+		Returns:
+			list[Rect]: Where the keys that look different than last time are
+		"""
+		changed = []
+		for key, (pos, size) in self.keys.items():
+			look = (self.states.get(key), key == hovered)
+			if (self.lastLooks.get(key) != look):
+				self.lastLooks[key] = look
+				changed.append(Rect(pos[0], pos[1], size[0], size[1]))
+			elif (not redrawAll):
+				continue
+
+			display.blit(self.sprites[(key, *look)], pos)
+		return changed
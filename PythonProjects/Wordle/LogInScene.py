@@ -0,0 +1,280 @@
+from typing import Tuple
+import pygame
+from Button import Button
+from Style import Style
+from Surface import Surface
+from Text import Text
+from TextBox import TextBox
+from colors import *
+from Scene import Scene
+
+
+class LogInScene(Scene):
+	"""The screen to log in to an existing account
+	"""
+	def enter(self):
+		"""Creates the widgets of the screen"""
+		# create the log in screen
+		self.logInScreen = Surface((0, 0), self.wordle.size, self.wordle.backgroundColor)
+		
+
+		# Create the header for the screen
+
+		# create the header
+		self.header = Surface((0, 0), (self.wordle.width, 50), CYBERGRAPE)
+
+		# create the button to go back to the home page that doubles as the title
+		self.titleButton = Button(Surface((self.header.width / 2 - 75, 2), (150, 50), CYBERGRAPE),
+								Style(Text((150 / 2, 50 / 2), self.wordle.font, 25, "WORDLE", WHITE),
+								fillColor=CYBERGRAPE))
+
+
+
+		# Create the title for the screen
+		self.title = Text((self.wordle.width / 2, 125), self.wordle.font, 75, "LOG IN", WHITE)
+
+		# Create the Username label for the screen
+		self.usernameLbl = Text((self.wordle.width / 4 + 20, 225), self.wordle.font, 30, "USERNAME", WHITE)
+
+		# Create the username text box for the screen
+		self.usernameTxt = TextBox(Surface((self.wordle.width / 4 - 30, 250), (300, 35), self.wordle.backgroundColor),
+								Style(Text((10, 35 / 2), self.wordle.font, 20, "", WHITE),
+                    			borderColor=TURQUOISE, borderRadius=5),
+
+                   		 		selectedStyle=Style(borderColor=TURQUOISE, borderWidth=4, borderRadius=5))
+
+		# Create the Password label for the screen
+		self.passwordLbl = Text((self.wordle.width / 4 + 20, 325), self.wordle.font, 30, "PASSWORD", WHITE)
+
+		# Create the password text box for the screen
+		self.passwordTxt = TextBox(Surface((self.wordle.width / 4 - 30, 350), (300, 35), self.wordle.backgroundColor),
+                        		Style(Text((10, 35 / 2), self.wordle.font, 20, "", WHITE),
+								borderColor=TURQUOISE, borderRadius=5),
+
+                        		selectedStyle=Style(borderColor=TURQUOISE, borderWidth=4, borderRadius=5), hidden=True)
+
+		# Create the login button for the screen
+		self.logInButton = Button(Surface((self.wordle.width / 2 + 20, 415), (150, 50), self.wordle.backgroundColor),
+                       			Style(Text((75, 25), self.wordle.font, 25, "LOG IN", DENIM),
+                                borderColor=DENIM, borderRadius=5),
+
+								hoverStyle=Style(Text((75, 25), self.wordle.font, 26, "LOG IN", WHITE),
+                         fillColor=DENIM, borderRadius=5))
+
+
+		# the keyboard is shared with the game so clear the colors of the last guesses
+		self.keyboard = self.wordle.keyboard
+		self.keyboard.reset()
+		
+		# the widgets that can be clicked, from the bottom up
+		self.titleButton.register(self.hits, self.header.pos)
+		self.usernameTxt.register(self.hits)
+		self.passwordTxt.register(self.hits)
+		self.logInButton.register(self.hits)
+		self.keyboard.register(self.hits)
+
+
+		# the password being checked in the background
+		self.verification = None
+
+		# the whole window changes when the screen is shown
+		self.wordle.window.invalidate()
+
+	def update(self, events: list[pygame.event.Event], mousePos: Tuple[int, int]):
+		"""Handles the events of a frame
+
+		Args:
+			events (list[pygame.event.Event]): The events since the last frame
+			mousePos (Tuple[int, int]): The position of the mouse
+		"""
+
+		# log in once the password has been checked
+		if (self.verification != None and self.verification.done()):
+			success, error, type, fontSize = self.verification.result()
+			self.verification = None
+			self.wordle.window.invalidate()
+			if (success):
+				self.switch("Play")
+				return
+			# Show a message window
+			self.showAlert(self.wordle.messageAlert(error, type, fontSize))
+
+		# loop through the events
+		for event in events:
+
+			# input can change anything on the screen so update all of it
+			if event.type == pygame.MOUSEBUTTONDOWN or event.type == pygame.KEYDOWN:
+				self.wordle.window.invalidate()
+
+			# Checks for the MOUSEDOWN event
+			if event.type == pygame.MOUSEBUTTONDOWN:
+				hit = self.hits.at(mousePos)
+
+				# if the mouse clicked the Title button go back to start
+				if (hit is self.titleButton):
+					self.switch("Start")
+					return
+
+				# if the mouse clicked the log in button
+				elif (hit is self.logInButton):
+					
+					# check the password in the background so the screen keeps rendering
+					if (self.verification == None):
+						self.verification = self.wordle.verifyLogin(self.usernameTxt.style.text.text, self.passwordTxt.style.text.text)
+
+				elif (hit is self.alert):
+					self.hideAlert()
+
+
+				# check to see if the user clicked on the keyboard
+				keyboardClicked = hit in self.keyboard.keys
+				if (keyboardClicked):
+					key = hit
+					# if the key is the enter button encrement the current word
+					if (key == "ENTER"):
+						# jump to the password text box
+						if (self.usernameTxt.isSelected):
+							self.usernameTxt.isSelected = False
+							self.passwordTxt.isSelected = True
+						# attempt to log in
+						elif(self.passwordTxt.isSelected):
+							# check the password in the background so the screen keeps rendering
+							if (self.verification == None):
+								self.verification = self.wordle.verifyLogin(
+								self.usernameTxt.style.text.text, self.passwordTxt.style.text.text)
+					# if the key is the back button delete the last character of the current word
+					elif (key == "BACK"):
+						# if username text box is selected -> backspace
+						if (self.usernameTxt.isSelected):
+							self.usernameTxt.backSpace()
+						# if password text box is selected -> backspace
+						elif (self.passwordTxt.isSelected):
+							self.passwordTxt.backSpace()
+					# else just add the word if the length is less than 5
+					else:
+						# if the username text box is selected -> insert the character 
+						if (self.usernameTxt.isSelected):
+							self.usernameTxt.insert(key)
+						# if the password text box is selected -> insert the character
+						elif (self.passwordTxt.isSelected):
+							self.passwordTxt.insert(key)
+
+				if not keyboardClicked:
+					# check if the mouse hit the username text box
+					self.usernameTxt.isSelected = hit is self.usernameTxt
+
+					# check if th mouse hit the password text box
+					self.passwordTxt.isSelected = hit is self.passwordTxt
+
+
+			# Checks for the KEYDOWN event
+			if event.type == pygame.KEYDOWN:
+				# if the return key is pressed
+				if event.key == pygame.K_RETURN:
+					# jump to the password text box
+					if (self.usernameTxt.isSelected):
+						self.usernameTxt.isSelected = False
+						self.passwordTxt.isSelected = True
+					# attempt to log in
+					elif(self.passwordTxt.isSelected):
+						# check the password in the background so the screen keeps rendering
+						if (self.verification == None):
+							self.verification = self.wordle.verifyLogin(self.usernameTxt.style.text.text, self.passwordTxt.style.text.text)
+
+				# if the tab key is pressed
+				elif event.key == pygame.K_TAB:
+					# jump to the password text box
+					if (self.usernameTxt.isSelected):
+						self.usernameTxt.isSelected = False
+						self.passwordTxt.isSelected = True
+					# jump to the username text box
+					else:
+						self.passwordTxt.isSelected = False
+						self.usernameTxt.isSelected = True
+
+				# if the key is the backspace
+				elif event.key == pygame.K_BACKSPACE:
+					# if username text box is selected -> backspace
+					if (self.usernameTxt.isSelected):
+						self.usernameTxt.backSpace()
+					# if password text box is selected -> backspace
+					elif (self.passwordTxt.isSelected):
+						self.passwordTxt.backSpace()
+				else:
+					# if the username text box is selevted -> insert the character
+					if (self.usernameTxt.isSelected):
+						self.usernameTxt.insert(event.unicode)
+					# if the password text box is selevted -> insert the character
+					elif (self.passwordTxt.isSelected):
+						self.passwordTxt.insert(event.unicode)
+
+	def nextChange(self) -> float:
+		"""Determines how long the screen looks the same when there is no input
+
+		Returns:
+			float: The seconds until the cursor of the selected text box blinks or None if none is selected
+		"""
+		return next((box.nextChange() for box in (self.usernameTxt, self.passwordTxt) if box.isSelected), None)
+
+	def render(self, mousePos: Tuple[int, int]):
+		"""Draws the screen
+
+		Args:
+			mousePos (Tuple[int, int]): The position of the mouse
+		"""
+		redrawAll = self.wordle.window.redrawAll
+
+		# the background and labels only change when all of the screen is drawn
+		if (redrawAll):
+			# clear the screen
+			self.logInScreen.clear()
+
+			# create the rectangles
+			pygame.draw.rect(self.logInScreen.display, LIGHTGREEN, (-33, 69, 320, 700), 2, 10)
+			pygame.draw.rect(self.logInScreen.display, ORCHID, (130, 200, 600, 600), 2, 10)
+			pygame.draw.rect(self.logInScreen.display, CYBERGRAPE, (-33, 500, 600, 300), 2, 10)
+
+			# render the header
+			self.logInScreen.display.blit(self.header.display, self.header.pos)
+
+			# render the title
+			self.logInScreen.display.blit(self.title.display, self.title.rect)
+
+			# render the username label
+			self.logInScreen.display.blit(self.usernameLbl.display, self.usernameLbl.rect)
+
+			# render the password label
+			self.logInScreen.display.blit(self.passwordLbl.display, self.passwordLbl.rect)
+
+		# render the title button on the header
+		self.titleButton.render()
+		self.draw(self.titleButton, self.logInScreen, self.header)
+
+		# render the username Text box
+		self.usernameTxt.render()
+		self.draw(self.usernameTxt, self.logInScreen)
+		
+		# render the password Text Box
+		self.passwordTxt.render()
+		self.draw(self.passwordTxt, self.logInScreen)
+
+		# render the login button
+		self.logInButton.render(mousePos)
+		self.draw(self.logInButton, self.logInScreen)
+
+		# render the keyboard
+		for rect in self.keyboard.render(self.logInScreen.display, self.hits.at(mousePos), redrawAll):
+			self.wordle.window.markDirty(rect)
+		
+
+
+		# render the alert
+		if (self.alert != None):
+			self.alert.render(mousePos)
+			self.draw(self.alert, self.logInScreen)
+
+		# the widgets are drawn, the rest is blitting the screen onto the window
+		self.wordle.profiler.mark("render")
+
+		# render the screen
+		self.wordle.window.blitScreen(self.logInScreen.display)
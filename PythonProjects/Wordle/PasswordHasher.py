@@ -0,0 +1,266 @@
+import argparse
+import base64
+import hashlib
+import hmac
+import json
+import os
+import threading
+import time
+
+
+class PasswordHasher:
+	"""Hashes passwords with a salted key derivation function whose cost can be tuned
+
+	A hash is stored as its settings, salt and key joined by $, for example scrypt$16384$8$1$salt$key
+	or pbkdf2_sha256$600000$salt$key, so hashes made with older settings can still be checked and upgraded.
+	Passwords that were checked recently are remembered so logging in again doesn't pay for the hash twice.
+	"""
+	def __init__(self, algorithm: str="scrypt", cost: int=2 ** 14, sessionSeconds: float=900):
+		"""Initializes the PasswordHasher
+
+		Args:
+			algorithm (str, optional): "scrypt" or "pbkdf2_sha256". Defaults to "scrypt".
+			cost (int, optional): The scrypt n or the number of PBKDF2 iterations. Defaults to 2 ** 14.
+			sessionSeconds (float, optional): How long a checked password is remembered. Defaults to 900.
+		"""
+		if (algorithm == "scrypt" and not hasattr(hashlib, "scrypt")):
+			# fall back to PBKDF2 with roughly the same work when OpenSSL doesn't have scrypt
+			algorithm, cost = "pbkdf2_sha256", cost * 40
+
+		self.algorithm = algorithm
+		"""The key derivation function. "scrypt" or "pbkdf2_sha256\""""
+
+		self.cost = cost
+		"""The scrypt n or the number of PBKDF2 iterations"""
+
+		self.sessionSeconds = sessionSeconds
+		"""How long a checked password is remembered"""
+
+		self.sessionKey = os.urandom(32)
+		"""The key the remembered passwords are signed with. It only lives as long as the game"""
+
+		self.sessions = {}
+		"""The passwords that were checked recently. sessions[hash] = (signed password, expiry)"""
+
+		self.dummy = None
+		"""The hash of a random password. None until it is first needed"""
+
+		self.lock = threading.Lock()
+		"""Held while the sessions are used"""
+
+	@classmethod
+	def open(cls, path: str) -> "PasswordHasher":
+		"""Creates a PasswordHasher with the settings saved by the benchmark, or the defaults if there aren't any
+
+		Args:
+			path (str): The path of the saved settings
+
+		Returns:
+			PasswordHasher: The hasher
+		"""
+		try:
+			with open(path) as file:
+				settings = json.load(file)
+			return cls(settings["algorithm"], settings["cost"])
+		except (OSError, ValueError, KeyError):
+			return cls()
+
+	@staticmethod
+	def derive(password: str, salt: bytes, algorithm: str, cost: int) -> bytes:
+		"""Derives the key for a password
+
+		Args:
+			password (str): The password
+			salt (bytes): The salt
+			algorithm (str): "scrypt" or "pbkdf2_sha256"
+			cost (int): The scrypt n or the number of PBKDF2 iterations
+
+		Raises:
+			ValueError: If the algorithm isn't supported
+
+		Returns:
+			bytes: The 32 byte key
+		"""
+		if (algorithm == "scrypt"):
+			return hashlib.scrypt(password.encode(), salt=salt, n=cost, r=8, p=1, maxmem=256 * cost * 8 + 2 ** 20, dklen=32)
+		if (algorithm == "pbkdf2_sha256"):
+			return hashlib.pbkdf2_hmac("sha256", password.encode(), salt, cost, dklen=32)
+		raise ValueError(f"{algorithm} isn't a supported algorithm")
+
+	@staticmethod
+	def encode(data: bytes) -> str:
+		"""Encodes bytes for a stored hash
+
+		Args:
+			data (bytes): The bytes
+
+		Returns:
+			str: The bytes in base 64 without padding
+		"""
+		return base64.b64encode(data).decode("ascii").rstrip("=")
+
+	@staticmethod
+	def decode(data: str) -> bytes:
+		"""Decodes bytes from a stored hash
+
+		Args:
+			data (str): The bytes in base 64 without padding
+
+		Returns:
+			bytes: The bytes
+		"""
+		return base64.b64decode(data + "=" * (-len(data) % 4))
+
+	@staticmethod
+	def parse(stored: str) -> tuple:
+		"""Splits a stored hash into its settings, salt and key
+
+		Args:
+			stored (str): The stored hash
+
+		Returns:
+			tuple: The algorithm, cost, salt and key or None if it isn't a hash
+		"""
+		parts = stored.split("$")
+		try:
+			if (parts[0] == "scrypt" and len(parts) == 6 and parts[2:4] == ["8", "1"]):
+				return parts[0], int(parts[1]), PasswordHasher.decode(parts[4]), PasswordHasher.decode(parts[5])
+			if (parts[0] == "pbkdf2_sha256" and len(parts) == 4):
+				return parts[0], int(parts[1]), PasswordHasher.decode(parts[2]), PasswordHasher.decode(parts[3])
+		except ValueError:
+			pass
+		return None
+
+	@property
+	def dummyHash(self) -> str:
+		"""The hash of a random password with the current settings. Checking a password against it takes as long as checking a real one"""
+		if (self.dummy == None):
+			self.dummy = self.hash(self.encode(os.urandom(16)))
+		return self.dummy
+
+	def hash(self, password: str, replaces: str=None) -> str:
+		"""Hashes a password with a new salt
+
+		Args:
+			password (str): The password
+			replaces (str, optional): The stored password the hash replaces. Its session moves to the new hash. Defaults to None.
+
+		Returns:
+			str: The hash to store
+		"""
+		salt = os.urandom(16)
+		key = self.encode(self.derive(password, salt, self.algorithm, self.cost))
+		if (self.algorithm == "scrypt"):
+			stored = f"scrypt${self.cost}$8$1${self.encode(salt)}${key}"
+		else:
+			stored = f"{self.algorithm}${self.cost}${self.encode(salt)}${key}"
+
+		if (replaces != None):
+			with self.lock:
+				session = self.sessions.pop(replaces, None)
+				if (session != None):
+					self.sessions[stored] = session
+		return stored
+
+	def isHashed(self, stored: str) -> bool:
+		"""Determines whether a stored password is a hash or plaintext from before passwords were hashed
+
+		Args:
+			stored (str): The stored password
+
+		Returns:
+			bool: Whether it is a hash
+		"""
+		return self.parse(stored) != None
+
+	def needsRehash(self, stored: str) -> bool:
+		"""Determines whether a stored password should be hashed again with the current settings
+
+		Args:
+			stored (str): The stored password
+
+		Returns:
+			bool: Whether it is plaintext or was hashed with different settings
+		"""
+		parsed = self.parse(stored)
+		return parsed == None or parsed[:2] != (self.algorithm, self.cost)
+
+	def verify(self, password: str, stored: str) -> bool:
+		"""Checks a password against a stored hash, or against plaintext from before passwords were hashed
+
+		Args:
+			password (str): The password that was entered
+			stored (str): The stored password
+
+		Returns:
+			bool: Whether the password is right
+		"""
+		signed = hmac.new(self.sessionKey, password.encode(), "sha256").digest()
+		now = time.monotonic()
+		with self.lock:
+			# forget the passwords that were checked too long ago
+			self.sessions = {key: session for key, session in self.sessions.items() if session[1] > now}
+			session = self.sessions.get(stored)
+		if (session != None and hmac.compare_digest(session[0], signed)):
+			return True
+
+		parsed = self.parse(stored)
+		if (parsed == None):
+			matches = hmac.compare_digest(password.encode(), stored.encode())
+		else:
+			algorithm, cost, salt, key = parsed
+			matches = hmac.compare_digest(self.derive(password, salt, algorithm, cost), key)
+
+		if (matches):
+			with self.lock:
+				self.sessions[stored] = (signed, time.monotonic() + self.sessionSeconds)
+		return matches
+
+	def calibrate(self, targetSeconds: float=0.1) -> int:
+		"""Finds the cost that makes one verify take about as long as the target on this computer
+
+		Args:
+			targetSeconds (float, optional): How long one verify should take. Defaults to 0.1.
+
+		Returns:
+			int: The cost for the hasher's algorithm
+		"""
+		salt = os.urandom(16)
+
+		def timeCost(cost: int) -> float:
+			start = time.perf_counter()
+			self.derive("benchmark", salt, self.algorithm, cost)
+			return time.perf_counter() - start
+
+		if (self.algorithm == "scrypt"):
+			# scrypt's n has to be a power of 2, so pick the one closest to the target
+			cost = 2 ** 10
+			seconds = timeCost(cost)
+			while (seconds * 2 <= targetSeconds * 1.5):
+				cost *= 2
+				seconds = timeCost(cost)
+			return cost
+
+		# PBKDF2 takes time in proportion to the iterations
+		seconds = min(timeCost(100000) for _ in range(3))
+		return max(10000, int(100000 * targetSeconds / seconds) // 1000 * 1000)
+
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Picks the password hashing cost that makes one verify take about the target time")
+	parser.add_argument("--algorithm", default="scrypt", choices=["scrypt", "pbkdf2_sha256"], help="the key derivation function")
+	parser.add_argument("--target", type=float, default=0.1, help="how many seconds one verify should take")
+	parser.add_argument("--output", default="PasswordCost.json", help="where to save the settings the game uses")
+	arguments = parser.parse_args()
+
+	hasher = PasswordHasher(arguments.algorithm)
+	hasher.cost = hasher.calibrate(arguments.target)
+
+	stored = hasher.hash("benchmark")
+	start = time.perf_counter()
+	PasswordHasher(hasher.algorithm, hasher.cost).verify("benchmark", stored)
+	seconds = time.perf_counter() - start
+
+	with open(arguments.output, "w") as file:
+		json.dump({"algorithm": hasher.algorithm, "cost": hasher.cost}, file)
+	print(f"{hasher.algorithm} with a cost of {hasher.cost} takes {seconds * 1000:.0f} ms to verify, saved to {arguments.output}")
@@ -0,0 +1,475 @@
+from typing import Tuple
+import pygame
+from Button import Button
+from GameSession import GameSession
+from Style import Style
+from Surface import Surface
+from Text import Text
+from colors import *
+from Scene import Scene
+
+
+class PlayScene(Scene):
+	"""The game of Wordle with the end screen that shows the statistics
+	"""
+
+	flipSeconds = 0.3
+	"""How long a tile takes to flip over when a guess is entered"""
+
+	flipDelay = 0.2
+	"""How long each tile of a guess waits after the one before it starts flipping"""
+
+	revealSeconds = flipDelay * 4 + flipSeconds
+	"""How long all the tiles of a guess take to flip over"""
+
+	endScreenDelay = 1
+	"""How many seconds the board stays after the last guess is revealed before the end screen is shown"""
+
+	fadeSeconds = 0.3
+	"""How long the end screen takes to fade in"""
+
+	alertSeconds = 2
+	"""How many seconds the not a word alert is shown"""
+	def enter(self):
+		"""Creates the widgets of the screen"""
+		# create the game in screen
+		self.gameScreen = Surface((0, 0), self.wordle.size, self.wordle.backgroundColor)
+		self.gameover = False
+		self.win = False
+
+		# Create the header for the screen
+
+		# create the header
+		self.header = Surface((0, 0), (self.wordle.width, 50), CYBERGRAPE)
+
+		# create the button to go back to the home page that doubles as the title
+		self.titleButton = Button(Surface((self.header.width / 2 - 75, 2), (150, 50), CYBERGRAPE),
+                       Style(Text((150 / 2, 50 / 2), self.wordle.font, 25, "WORDLE", WHITE),
+                             fillColor=CYBERGRAPE))
+
+		# create the button that suggests the next guess
+		self.hintButton = Button(Surface((self.header.width - 70, 10), (60, 30), CYBERGRAPE),
+								Style(Text((30, 15), self.wordle.font, 15, "HINT", WHITE), borderColor=WHITE, borderRadius=5),
+								hoverStyle=Style(Text((30, 15), self.wordle.font, 16, "HINT", CYBERGRAPE), fillColor=WHITE, borderRadius=5))
+
+		# the words for the game
+		self.game = GameSession.random(self.wordle.acceptedWordsList)
+		self.secretWord = self.game.secretWord
+		self.words = [""] * 6
+		self.currentWord = 0
+		self.boardColors = [None] * 6
+		self.scoredWords = 0
+
+		# what each tile looked like the last time it was drawn. tileLooks[(row, column)] = (tile, height)
+		self.tileLooks = {}
+
+		# how far the tiles of each guess that is flipping over are. revealing[row] = progress
+		self.revealing = {}
+
+		# the keyboard is shared by every game so only its colors are cleared
+		self.keyboard = self.wordle.keyboard
+		self.keyboard.reset()
+
+
+		# the widgets that can be clicked, from the bottom up
+		self.titleButton.register(self.hits, self.header.pos)
+		self.hintButton.register(self.hits, self.header.pos)
+		self.keyboard.register(self.hits)
+
+
+		# the not a word alert is shared by every game so it starts hidden
+		self.notAWordAlert = self.wordle.notAWordAlert
+		self.notAWordAlert.hide()
+		self.alertExpiry = None
+
+
+		# create the endscreen
+		self.endScreen = Surface((self.wordle.width / 2 - 150, self.wordle.height / 2 - 270), (300, 540), self.wordle.backgroundColor)
+
+		# where the end screen is on the window
+		self.endRect = pygame.Rect(self.endScreen.pos, (self.endScreen.width, self.endScreen.height))
+
+		# how far the end screen has faded in, from 0 to 1, and how far it had when it was last drawn
+		self.endProgress = 0
+		self.endShown = 0
+
+		# darkens the rest of the screen behind the end screen
+		self.layOver = None
+
+		# what is under the end screen, drawn again before each step of the fade
+		self.backdrop = None
+
+		self.statsTxt = Text((150, 125), self.wordle.font, 15, "STATISTICS", WHITE)
+
+		self.winPercent = Text((100 - 5, 175), self.wordle.font, 35, "100", WHITE)
+		self.winPercentTxt = Text((100 - 2, 200), self.wordle.font, 10, "WIN %", LIGHTGRAY)
+
+		self.played = Text((200 + 5, 175), self.wordle.font, 35, "5", WHITE)
+		self.playedTxt = Text((200 + 7, 200), self.wordle.font, 10, "played", LIGHTGRAY)
+
+		self.gamesWon = Text((100 - 5, 245), self.wordle.font, 35, "5", WHITE)
+		self.gamesWonTxt = Text((100 - 3, 270), self.wordle.font, 10, "games won", LIGHTGRAY)
+
+
+		self.gamesLost = Text((200 + 5, 245), self.wordle.font, 35, "0", WHITE)
+		self.gamesLostTxt = Text((200 + 7, 270), self.wordle.font, 10, "games lost", LIGHTGRAY)
+
+		self.currentStreak = Text((100 - 5, 315), self.wordle.font, 35, "0", WHITE)
+		self.currentStreakTxt = Text((100 - 3, 340), self.wordle.font, 10, "current streak", LIGHTGRAY)
+
+		self.maxStreak = Text((200 + 5, 315), self.wordle.font, 35, "0", WHITE)
+		self.maxStreakTxt = Text((200 + 7, 340), self.wordle.font, 10, "max streak", LIGHTGRAY)
+
+		self.distributionTxt = Text((150, 375), self.wordle.font, 15, "GUESS DISTRIBUTION", WHITE)
+		self.distribution = []
+
+
+		# display the play agian button
+		self.playAgainBtn = Button(Surface((10, 480), (125, 50), self.wordle.backgroundColor),
+								Style(Text((125 / 2, 25), self.wordle.font, 15, "PLAY AGAIN", DENIM), borderColor=DENIM, borderRadius=5),
+								hoverStyle=Style(Text((125 / 2, 25), self.wordle.font, 17, "PLAY AGAIN", WHITE), fillColor=DENIM, borderRadius=5))
+		
+
+		# display the exit button
+		self.exitBtn = Button(Surface((165, 480), (125, 50), self.wordle.backgroundColor),
+								Style(Text((125 / 2, 25), self.wordle.font, 15, "EXIT", LIGHTRED), borderColor=LIGHTRED, borderRadius=5),
+								hoverStyle=Style(Text((125 / 2, 25), self.wordle.font, 17, "EXIT", WHITE), fillColor=LIGHTRED, borderRadius=5))
+		
+
+		# the whole window changes when the screen is shown
+		self.wordle.window.invalidate()
+
+	def update(self, events: list[pygame.event.Event], mousePos: Tuple[int, int]):
+		"""Handles the events of a frame
+
+		Args:
+			events (list[pygame.event.Event]): The events since the last frame
+			mousePos (Tuple[int, int]): The position of the mouse
+		"""
+		# loop through the events
+		for event in events:
+
+			# input can change anything on the screen so update all of it
+			if event.type == pygame.MOUSEBUTTONDOWN or event.type == pygame.KEYDOWN:
+				self.wordle.window.invalidate()
+
+			# Checks for the MOUSEDOWN event
+			if event.type == pygame.MOUSEBUTTONDOWN:
+				hit = self.hits.at(mousePos)
+
+				# if the mouse clicked the Title button go back to start
+				if (hit is self.titleButton):
+					self.switch("Start")
+					return
+
+				# if the mouse clicked the hint button show the suggested guess
+				elif (not self.game.isOver and hit is self.hintButton):
+					self.showAlert(self.wordle.getHint(self.game))
+
+				# if the mouse clicked the close button on the alert
+				elif (hit is self.alert):
+					self.hideAlert()
+				
+				# Check to see if the mouse clicked on the keyboard
+				elif (not self.game.isOver and hit in self.keyboard.keys):
+					key = hit
+
+					# if the key is the enter button encrement the current word
+					if (key == "ENTER"):
+						self.submit()
+					# if the key is the back button delete the last character of the current word
+					elif (key == "BACK"):
+						self.words[self.currentWord] = self.words[self.currentWord][:-1]
+					# else just add the word if the length is less than 5
+					elif (len(self.words[self.currentWord]) < 5):
+						self.words[self.currentWord] += key
+
+				# Check to see if the mouse clicked the play again button
+				elif (hit is self.playAgainBtn):
+					self.switch("Play")
+					return
+				
+				# Check to see if the mouse clicked the eixt button
+				elif (hit is self.exitBtn):
+					self.switch("Start")
+					return
+
+			# Checks for the KEYDOWN event
+			if event.type == pygame.KEYDOWN and not self.game.isOver:
+				# if the return key is pressed
+				if event.key == pygame.K_RETURN:
+					self.submit()
+				# if the backspace key is pressed
+				elif event.key == pygame.K_BACKSPACE:
+					self.words[self.currentWord] = self.words[self.currentWord][:-1]
+				# else just add to the word if the length is less than 5
+				elif (len(self.words[self.currentWord]) < 5):
+					self.words[self.currentWord] += event.unicode.upper()
+
+	def submit(self):
+		"""Enters the current word as a guess, or shows an alert if it isn't in the word list"""
+		if (len(self.words[self.currentWord]) == 5):
+			if (self.game.isValid(self.words[self.currentWord])):
+				self.game.guess(self.words[self.currentWord])
+				row = self.currentWord
+				self.currentWord += 1
+
+				# flip the tiles over and color the keyboard once they all have
+				self.revealing[row] = 0
+				self.timeline.add(self.revealSeconds, lambda progress: self.revealRow(row, progress), lambda: self.revealed(row))
+
+				if (self.game.isOver):
+					self.finish()
+			else:
+				self.notAWordAlert.show()
+				self.timeline.cancel(self.alertExpiry)
+				self.alertExpiry = self.timeline.after(self.alertSeconds, self.expireAlert)
+
+	def revealRow(self, row: int, progress: float):
+		"""Moves the tiles of a guess that is flipping over
+
+		Args:
+			row (int): The row of the guess
+			progress (float): How far the whole row is, from 0 to 1
+		"""
+		self.revealing[row] = progress
+
+	def revealed(self, row: int):
+		"""Colors the keyboard once the tiles of a guess have flipped over
+
+		Args:
+			row (int): The row of the guess
+		"""
+		del self.revealing[row]
+		self.keyboard.push(self.words[row], self.game.states[row])
+
+	def expireAlert(self):
+		"""Hides the not a word alert after it has been shown long enough"""
+		self.notAWordAlert.hide()
+		self.alertExpiry = None
+
+		# update where the not a word alert was
+		self.wordle.window.invalidate()
+
+	def finish(self):
+		"""Records the game that just ended and shows the end screen after the last guess is revealed"""
+		# update the statistics
+		if (self.game.isWon):
+			self.win = True
+			self.wordle.user.win(len(self.game.guesses))
+		else:
+			self.wordle.user.lose()
+		self.wordle.stats.record(self.wordle.user.username, self.game)
+		self.winPercent.text = str(self.wordle.user.winPercent)
+		self.played.text = str(self.wordle.user.played)
+		self.gamesWon.text = str(self.wordle.user.gamesWon)
+		self.gamesLost.text = str(self.wordle.user.gamesLost)
+		self.currentStreak.text = str(self.wordle.user.currentStreak)
+		self.maxStreak.text = str(self.wordle.user.maxStreak)
+		self.distribution = self.wordle.distributionBars(395, len(self.game.guesses) if self.win else None)
+
+		self.timeline.after(self.revealSeconds + self.endScreenDelay, self.showEndScreen)
+
+	def showEndScreen(self):
+		"""Draws the end screen once and fades it in over the board"""
+		self.gameover = True
+		self.wordle.window.invalidate()
+
+		self.layOver = pygame.Surface((self.wordle.width, self.wordle.height), pygame.SRCALPHA)
+		self.layOver.fill((0, 0, 0, 128))
+
+		# everything but the buttons stays the same so it is drawn once
+		self.endScreen.clear()
+
+		# display the title
+		if (self.win):
+			title = Text((self.endScreen.width / 2, 60), self.wordle.font, 50, "VICTORY!", LIGHTGREEN)
+		else:
+			title = Text((self.endScreen.width / 2, 50), self.wordle.font, 50, "DEFEAT", (255, 0, 0))
+			word = Text((self.endScreen.width / 2, 80), self.wordle.font, 15, f"The word was {self.secretWord}", GRAY)
+			self.endScreen.display.blit(word.display, word.rect)
+
+		pygame.draw.line(self.endScreen.display, LIGHTGRAY, (30, 105), (self.endScreen.width - 30, 105))
+
+		# display the statistics
+		self.endScreen.display.blit(self.statsTxt.display, self.statsTxt.rect)
+
+		self.endScreen.display.blit(self.winPercent.display, self.winPercent.rect)
+		self.endScreen.display.blit(self.winPercentTxt.display, self.winPercentTxt.rect)
+
+		self.endScreen.display.blit(self.played.display, self.played.rect)
+		self.endScreen.display.blit(self.playedTxt.display, self.playedTxt.rect)
+
+		self.endScreen.display.blit(self.gamesWon.display, self.gamesWon.rect)
+		self.endScreen.display.blit(self.gamesWonTxt.display, self.gamesWonTxt.rect)
+
+		self.endScreen.display.blit(self.gamesLost.display, self.gamesLost.rect)
+		self.endScreen.display.blit(self.gamesLostTxt.display, self.gamesLostTxt.rect)
+
+		self.endScreen.display.blit(self.currentStreak.display, self.currentStreak.rect)
+		self.endScreen.display.blit(self.currentStreakTxt.display, self.currentStreakTxt.rect)
+
+		self.endScreen.display.blit(self.maxStreak.display, self.maxStreak.rect)
+		self.endScreen.display.blit(self.maxStreakTxt.display, self.maxStreakTxt.rect)
+
+		# display how many guesses the user's wins have taken
+		self.endScreen.display.blit(self.distributionTxt.display, self.distributionTxt.rect)
+		for label, bar, color, count in self.distribution:
+			self.endScreen.display.blit(label.display, label.rect)
+			pygame.draw.rect(self.endScreen.display, color, bar)
+			self.endScreen.display.blit(count.display, count.rect)
+
+		self.endScreen.display.blit(title.display, title.rect)
+
+		# the end screen covers the board so its buttons go on top
+		self.playAgainBtn.register(self.hits, self.endScreen.pos)
+		self.exitBtn.register(self.hits, self.endScreen.pos)
+
+		self.timeline.add(self.fadeSeconds, self.fadeInEndScreen)
+
+	def fadeInEndScreen(self, progress: float):
+		"""Moves the end screen fading in
+
+		Args:
+			progress (float): How far the fade is, from 0 to 1
+		"""
+		self.endProgress = progress
+
+	def render(self, mousePos: Tuple[int, int]):
+		"""Draws the screen
+
+		Args:
+			mousePos (Tuple[int, int]): The position of the mouse
+		"""
+		redrawAll = self.wordle.window.redrawAll
+
+		# the background only changes when all of the screen is drawn
+		if (redrawAll):
+			# clear the screen
+			self.gameScreen.clear()
+			self.renderBackground()
+
+			# render the header
+			self.gameScreen.display.blit(self.header.display, self.header.pos)
+
+		# the end screen covers the board once the game is over so it only changes when all of the screen is drawn
+		if (redrawAll or not self.gameover):
+			# render the buttons on the header
+			self.titleButton.render()
+			self.draw(self.titleButton, self.gameScreen, self.header)
+			self.hintButton.render(mousePos)
+			self.draw(self.hintButton, self.gameScreen, self.header)
+
+			self.renderBoard(redrawAll)
+
+			# render the keyboard
+			for rect in self.keyboard.render(self.gameScreen.display, self.hits.at(mousePos), redrawAll):
+				self.wordle.window.markDirty(rect)
+		
+
+		# display the end screen if game over
+		if (self.gameover):
+			endMousePos = (mousePos[0] - self.endScreen.pos[0], mousePos[1] - self.endScreen.pos[1])
+			self.playAgainBtn.render(endMousePos)
+			self.exitBtn.render(endMousePos)
+
+			if (redrawAll):
+				# darken the rest of the screen and keep what is under the end screen to fade it in over
+				self.gameScreen.display.blit(self.layOver, (0, 0))
+				self.backdrop = self.gameScreen.display.subsurface(self.endRect).copy()
+
+			# the end screen changes all over while it fades in, otherwise only its buttons change
+			if (redrawAll or self.endShown != self.endProgress):
+				self.endScreen.display.blit(self.playAgainBtn.surface.display, self.playAgainBtn.surface.pos)
+				self.endScreen.display.blit(self.exitBtn.surface.display, self.exitBtn.surface.pos)
+				self.gameScreen.display.blit(self.backdrop, self.endScreen.pos)
+				self.endScreen.display.set_alpha(round(255 * self.endProgress))
+				self.gameScreen.display.blit(self.endScreen.display, self.endScreen.pos)
+				self.wordle.window.markDirty(self.endRect)
+				self.endShown = self.endProgress
+			else:
+				self.draw(self.playAgainBtn, self.gameScreen, self.endScreen)
+				self.draw(self.exitBtn, self.gameScreen, self.endScreen)
+
+		# render the alert
+		if (self.alert != None):
+			self.alert.render(mousePos)
+			self.draw(self.alert, self.gameScreen)
+
+		# render the not a word alert until it expires
+		if (self.notAWordAlert.visible):
+			self.notAWordAlert.render(mousePos)
+			self.draw(self.notAWordAlert, self.gameScreen)
+
+
+		# the widgets are drawn, the rest is blitting the screen onto the window
+		self.wordle.profiler.mark("render")
+
+		# render the screen
+		self.wordle.window.blitScreen(self.gameScreen.display)
+
+	def renderBackground(self):
+		"""Draws the aesthetic lines behind the board"""
+		pygame.draw.rect(self.gameScreen.display, LIGHTGREEN,
+		                 (250, 400, 280, 700), 2, 10)
+		pygame.draw.rect(self.gameScreen.display, ORCHID, 
+						 (-100, 150, 275, 600), 2, 10)
+		pygame.draw.rect(self.gameScreen.display, CYBERGRAPE,
+		                 (-33, 500, 600, 300), 2, 10)
+		pygame.draw.rect(self.gameScreen.display, DENIM,
+                     (100, -30, 600, 280), 2, 10)
+
+	def renderBoard(self, redrawAll: bool):
+		"""Draws the tiles of the board
+
+		Args:
+			redrawAll (bool): Whether to draw every tile or only the ones that look different than last time
+		"""
+		# color each entered word once
+		while (self.scoredWords < self.currentWord):
+			self.boardColors[self.scoredWords] = self.wordle.tileColors(self.game.states[self.scoredWords])
+			self.scoredWords += 1
+
+		# render the word boxes
+		for i in range(0, len(self.words)):
+			textColor = WHITE
+			if i == self.currentWord and len(self.words[i]) == 5 and not self.game.isValid(self.words[i]):
+				textColor = LIGHTRED
+
+			for j in range(0, 5):
+				# the entered words use their colors and the rest are empty boxes
+				if (i < self.currentWord):
+					tile = self.wordle.tileCache.get(self.words[i][j], self.boardColors[i][j])
+				else:
+					text = self.words[i][j] if j < len(self.words[i]) else ""
+					tile = self.wordle.tileCache.get(text, self.wordle.backgroundColor, textColor)
+				height = tile.get_height()
+
+				# each tile of a guess being revealed starts flipping after the one before it and shows its color halfway over
+				if (i in self.revealing):
+					progress = min(1, max(0, (self.revealing[i] * self.revealSeconds - j * self.flipDelay) / self.flipSeconds))
+					if (progress < 0.5):
+						tile = self.wordle.tileCache.get(self.words[i][j], self.wordle.backgroundColor)
+					if (0 < progress < 1):
+						height = max(1, round(tile.get_height() * abs(1 - 2 * progress)))
+
+				# skip the tiles that look the same as last time
+				look = (tile, height)
+				if (self.tileLooks.get((i, j)) == look and not redrawAll):
+					continue
+				self.tileLooks[(i, j)] = look
+
+				x = self.wordle.boardPadding + j * (self.wordle.boxSize + self.wordle.boardMargin)
+				y = i * (self.wordle.boxSize + self.wordle.boardMargin) + 75
+				if (not redrawAll):
+					# a flipping tile doesn't cover all of the last one so the background behind it is drawn again
+					rect = pygame.Rect(x, y, self.wordle.boxSize + 1, self.wordle.boxSize + 1)
+					self.gameScreen.display.set_clip(rect)
+					self.gameScreen.clear()
+					self.renderBackground()
+					self.gameScreen.display.set_clip(None)
+					self.wordle.window.markDirty(rect)
+
+				if (height != tile.get_height()):
+					tile = pygame.transform.scale(tile, (tile.get_width(), height))
+				self.gameScreen.display.blit(tile, (x, y + (self.wordle.boxSize - height) / 2))
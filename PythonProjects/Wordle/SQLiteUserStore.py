@@ -0,0 +1,270 @@
+import argparse
+import json
+import sqlite3
+import threading
+from typing import Callable
+from UserStore import UserStore
+
+
+class SQLiteUserStore(UserStore):
+	"""The users stored in a SQLite database
+
+	The database runs in WAL mode so readers don't wait on the writer, usernames have a unique index
+	and every statement is parameterized so SQLite can reuse the compiled statements.
+	"""
+
+	columns = ("username", "password", "winPercent", "played", "gamesWon", "gamesLost", "distribution", "currentStreak", "maxStreak")
+	"""The fields of a user's document in the order of the table's columns"""
+
+	gameColumns = ("username", "word", "guesses", "seconds", "result", "finished")
+	"""The fields of a game's history row in the order of the table's columns"""
+
+	def __init__(self, path: str):
+		"""Initializes the SQLiteUserStore, creating the tables if they don't exist
+
+		Args:
+			path (str): The path of the database file
+		"""
+		self.path = path
+		"""The path of the database file"""
+
+		self.lock = threading.RLock()
+		"""Held while the connection is used, since the journal compacts from another thread"""
+
+		self.connection = sqlite3.connect(path, check_same_thread=False, cached_statements=64)
+		"""The connection to the database"""
+		self.connection.row_factory = sqlite3.Row
+
+		with self.lock, self.connection:
+			self.connection.execute("PRAGMA journal_mode=WAL")
+			self.connection.execute("PRAGMA synchronous=NORMAL")
+			self.connection.execute("""CREATE TABLE IF NOT EXISTS users (
+				id INTEGER PRIMARY KEY,
+				username TEXT NOT NULL,
+				password TEXT NOT NULL,
+				winPercent INTEGER NOT NULL DEFAULT 0,
+				played INTEGER NOT NULL DEFAULT 0,
+				gamesWon INTEGER NOT NULL DEFAULT 0,
+				gamesLost INTEGER NOT NULL DEFAULT 0)""")
+			self.connection.execute("CREATE UNIQUE INDEX IF NOT EXISTS usersUsername ON users (username)")
+
+			# add the aggregate columns to databases made before they existed
+			existing = {row["name"] for row in self.connection.execute("PRAGMA table_info(users)")}
+			for column, definition in (("distribution", "TEXT NOT NULL DEFAULT '[0, 0, 0, 0, 0, 0]'"),
+										("currentStreak", "INTEGER NOT NULL DEFAULT 0"), ("maxStreak", "INTEGER NOT NULL DEFAULT 0")):
+				if (column not in existing):
+					self.connection.execute(f"ALTER TABLE users ADD COLUMN {column} {definition}")
+
+			self.connection.execute("""CREATE TABLE IF NOT EXISTS games (
+				id INTEGER PRIMARY KEY,
+				username TEXT NOT NULL,
+				word TEXT NOT NULL,
+				guesses INTEGER NOT NULL,
+				seconds REAL NOT NULL,
+				result TEXT NOT NULL,
+				finished INTEGER NOT NULL)""")
+			self.connection.execute("CREATE INDEX IF NOT EXISTS gamesUsername ON games (username)")
+			self.connection.execute("""CREATE TABLE IF NOT EXISTS words (
+				word TEXT PRIMARY KEY,
+				plays INTEGER NOT NULL DEFAULT 0,
+				wins INTEGER NOT NULL DEFAULT 0,
+				guesses INTEGER NOT NULL DEFAULT 0)""")
+			self.connection.execute("CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+
+	def toUser(self, row: sqlite3.Row) -> dict:
+		"""Turns a row of the users table into a user's document
+
+		Args:
+			row (sqlite3.Row): The row
+
+		Returns:
+			dict: The user's document
+		"""
+		user = {column: row[column] for column in self.columns}
+		user["distribution"] = json.loads(user["distribution"])
+		return user
+
+	def toRow(self, user: dict) -> tuple:
+		"""Turns a user's document into the values of the users table's columns
+
+		Args:
+			user (dict): The user's document
+
+		Returns:
+			tuple: The values in the order of the columns
+		"""
+		values = {**user, "distribution": json.dumps(user.get("distribution", [0] * 6))}
+		return tuple(values.get(column, 0) for column in self.columns)
+
+	def find(self, username: str) -> dict:
+		"""Finds a user by their username
+
+		Args:
+			username (str): The username of the user
+
+		Returns:
+			dict: A copy of the user's document or None if there isn't a user with the username
+		"""
+		with self.lock:
+			row = self.connection.execute("SELECT * FROM users WHERE username = ?", (username,)).fetchone()
+		return self.toUser(row) if row != None else None
+
+	def exists(self, username: str) -> bool:
+		"""Determines whether a username is taken
+
+		Args:
+			username (str): The username to check
+
+		Returns:
+			bool: Whether there is a user with the username
+		"""
+		with self.lock:
+			return self.connection.execute("SELECT 1 FROM users WHERE username = ?", (username,)).fetchone() != None
+
+	def insert(self, user: dict):
+		"""Adds a new user
+
+		Args:
+			user (dict): The user's document
+
+		Raises:
+			ValueError: If the username is already taken
+		"""
+		try:
+			with self.lock, self.connection:
+				self.connection.execute(f"INSERT INTO users ({', '.join(self.columns)}) VALUES ({', '.join('?' * len(self.columns))})", self.toRow(user))
+		except sqlite3.IntegrityError:
+			raise ValueError(f"{user['username']} is already taken")
+
+	def updateMany(self, changes: dict[str, Callable[[dict], None]], metadata: dict=None, games: list[dict]=None,
+					wordChanges: dict[str, Callable[[dict], None]]=None):
+		"""Changes some of the users in one transaction
+
+		Args:
+			changes (dict[str, Callable[[dict], None]]): The function that changes each user's document. changes[username] = function
+			metadata (dict, optional): Values to store with the users in the same transaction. Defaults to None.
+			games (list[dict], optional): History rows to add in the same transaction. Defaults to None.
+			wordChanges (dict[str, Callable[[dict], None]], optional): The function that changes the stats of each word. Defaults to None.
+		"""
+		with self.lock, self.connection:
+			updates = []
+			for username, change in changes.items():
+				row = self.connection.execute("SELECT * FROM users WHERE username = ?", (username,)).fetchone()
+				if (row == None):
+					continue
+				user = self.toUser(row)
+				change(user)
+				updates.append(self.toRow(user)[1:] + (username,))
+
+			self.connection.executemany(f"UPDATE users SET {', '.join(column + ' = ?' for column in self.columns[1:])} WHERE username = ?", updates)
+			if (metadata != None):
+				self.connection.executemany("INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+											[(key, json.dumps(value)) for key, value in metadata.items()])
+
+			if (games):
+				self.connection.executemany(f"INSERT INTO games ({', '.join(self.gameColumns)}) VALUES ({', '.join('?' * len(self.gameColumns))})",
+											[tuple(game[column] for column in self.gameColumns) for game in games])
+
+			for word, change in (wordChanges or {}).items():
+				row = self.connection.execute("SELECT plays, wins, guesses FROM words WHERE word = ?", (word,)).fetchone()
+				stats = dict(row) if row != None else {"plays": 0, "wins": 0, "guesses": 0}
+				change(stats)
+				self.connection.execute("INSERT OR REPLACE INTO words (word, plays, wins, guesses) VALUES (?, ?, ?, ?)",
+										(word, stats["plays"], stats["wins"], stats["guesses"]))
+
+	def games(self, username: str=None) -> list[dict]:
+		"""Returns the history of finished games
+
+		Args:
+			username (str, optional): Only return the games of this user. Defaults to None for every game.
+
+		Returns:
+			list[dict]: The games in the order they were added. Each has a username, word, guesses, seconds, result and finished
+		"""
+		with self.lock:
+			if (username == None):
+				rows = self.connection.execute("SELECT * FROM games ORDER BY id").fetchall()
+			else:
+				rows = self.connection.execute("SELECT * FROM games WHERE username = ? ORDER BY id", (username,)).fetchall()
+		return [{column: row[column] for column in self.gameColumns} for row in rows]
+
+	def wordStats(self) -> dict[str, dict]:
+		"""Returns the running stats of every secret word that has been played
+
+		Returns:
+			dict[str, dict]: The plays, wins and total guesses of the wins for each word. wordStats()[word] = stats
+		"""
+		with self.lock:
+			rows = self.connection.execute("SELECT * FROM words").fetchall()
+		return {row["word"]: {"plays": row["plays"], "wins": row["wins"], "guesses": row["guesses"]} for row in rows}
+
+	def metadata(self) -> dict:
+		"""Returns the values stored with the users
+
+		Returns:
+			dict: The values written by updateMany
+		"""
+		with self.lock:
+			return {row["key"]: json.loads(row["value"]) for row in self.connection.execute("SELECT key, value FROM metadata")}
+
+	def all(self) -> list[dict]:
+		"""Returns every user
+
+		Returns:
+			list[dict]: A copy of every user's document
+		"""
+		with self.lock:
+			return [self.toUser(row) for row in self.connection.execute("SELECT * FROM users ORDER BY id")]
+
+	def importUsers(self, users: list[dict], games: list[dict]=None, wordStats: dict[str, dict]=None) -> int:
+		"""Copies users from another store, skipping the usernames that are already taken
+
+		Args:
+			users (list[dict]): The users' documents
+			games (list[dict], optional): The history of the users' games to copy too. Defaults to None.
+			wordStats (dict[str, dict], optional): The running stats of the words to copy too. Defaults to None.
+
+		Returns:
+			int: The number of users that were added
+		"""
+		with self.lock, self.connection:
+			before = self.connection.total_changes
+			self.connection.executemany(f"INSERT OR IGNORE INTO users ({', '.join(self.columns)}) VALUES ({', '.join('?' * len(self.columns))})",
+										[self.toRow(user) for user in users])
+			added = self.connection.total_changes - before
+
+			# the history only belongs to a fresh database, otherwise it would be copied twice
+			if (games and added == len(users)):
+				self.connection.executemany(f"INSERT INTO games ({', '.join(self.gameColumns)}) VALUES ({', '.join('?' * len(self.gameColumns))})",
+											[tuple(game[column] for column in self.gameColumns) for game in games])
+				self.connection.executemany("INSERT OR REPLACE INTO words (word, plays, wins, guesses) VALUES (?, ?, ?, ?)",
+											[(word, stats["plays"], stats["wins"], stats["guesses"]) for word, stats in (wordStats or {}).items()])
+			return added
+
+	def close(self):
+		"""Closes the connection"""
+		with self.lock:
+			self.connection.close()
+
+
+if __name__ == "__main__":
+	from tinydb import TinyDB
+	from StatsJournal import StatsJournal
+	from UserRepository import UserRepository
+
+	parser = argparse.ArgumentParser(description="Copies the users from the TinyDB database into a SQLite database")
+	parser.add_argument("source", nargs="?", default="db.json", help="the TinyDB database to copy from")
+	parser.add_argument("destination", nargs="?", default="db.sqlite3", help="the SQLite database to copy to")
+	parser.add_argument("--journal", default="db.journal", help="the stats journal of the TinyDB database, compacted before copying")
+	parser.add_argument("--history", default="db.history", help="the history of the games of the TinyDB database")
+	arguments = parser.parse_args()
+
+	# fold the results that are still in the journal into the users first
+	source = UserRepository(TinyDB(arguments.source), arguments.history)
+	StatsJournal(source, arguments.journal).close()
+
+	destination = SQLiteUserStore(arguments.destination)
+	added = destination.importUsers(source.all(), source.games(), source.wordStats())
+	print(f"Copied {added} of {len(source.all())} users from {arguments.source} into {arguments.destination}")
+	source.close()
+	destination.close()
@@ -0,0 +1,117 @@
+from typing import Tuple
+import pygame
+from Alert import Alert
+from HitIndex import HitIndex
+from Surface import Surface
+from Timeline import Timeline
+
+
+class Scene:
+	"""A screen of the game
+
+	The SceneManager calls enter when the scene is shown, update and render every frame
+	and exit when another scene takes its place. It also updates the scene's timeline before each update.
+	"""
+	def __init__(self, wordle):
+		"""Initializes the Scene
+
+		Args:
+			wordle (Wordle): The game the scene is part of
+		"""
+		self.wordle = wordle
+		"""The game the scene is part of"""
+
+		self.next = None
+		"""The name of the scene to switch to after this frame. None to stay on this scene"""
+
+		self.hits = HitIndex()
+		"""The widgets that can be clicked on the screen. The widgets register themselves in enter"""
+
+		self.alert = None
+		"""The alert that is shown on the screen. None if there isn't one"""
+
+		self.timeline = Timeline()
+		"""The animations and delays of the screen"""
+
+	def enter(self):
+		"""Creates the widgets of the screen"""
+		pass
+
+	def update(self, events: list[pygame.event.Event], mousePos: Tuple[int, int]):
+		"""Handles the events of a frame
+
+		Args:
+			events (list[pygame.event.Event]): The events since the last frame
+			mousePos (Tuple[int, int]): The position of the mouse
+		"""
+		pass
+
+	def render(self, mousePos: Tuple[int, int]):
+		"""Draws the screen
+
+		Args:
+			mousePos (Tuple[int, int]): The position of the mouse
+		"""
+		pass
+
+	def nextChange(self) -> float:
+		"""Determines how long the screen looks the same when there is no input
+
+		The SceneManager sleeps that long instead of drawing frames that look the same.
+		The animations on the timeline don't have to be counted, the SceneManager checks them too.
+
+		Returns:
+			float: The seconds until the screen changes on its own or None if it only changes with input
+		"""
+		return None
+
+	def exit(self):
+		"""Lets go of the widgets of the screen so they can be freed"""
+		# the alerts are shared by every screen so the next one starts without one
+		self.hideAlert()
+		self.timeline.clear()
+		self.__dict__.clear()
+
+	def draw(self, widget, screen: Surface, parent: Surface=None):
+		"""Blits a rendered widget onto the screen if it changed, something under it changed or all of the screen is being drawn
+
+		Args:
+			widget (Button | TextBox | Alert): The widget that was rendered
+			screen (Surface): The screen of the scene
+			parent (Surface, optional): The surface on the screen the widget is on, like the header. Defaults to None for the screen itself.
+		"""
+		window = self.wordle.window
+		offset = parent.pos if parent != None else (0, 0)
+		rect = pygame.Rect(widget.surface.pos[0] + offset[0], widget.surface.pos[1] + offset[1], widget.surface.width, widget.surface.height)
+		if (widget.dirty or window.redrawAll or rect.collidelist(window.dirty) != -1):
+			# a widget is cut off at the edges of the surface it is on
+			screen.display.set_clip(pygame.Rect(parent.pos, parent.size) if parent != None else None)
+			screen.display.blit(widget.surface.display, rect)
+			screen.display.set_clip(None)
+			self.wordle.markDirty(widget, offset)
+
+	def showAlert(self, alert: Alert):
+		"""Shows an alert in place of the one that is being shown
+
+		Args:
+			alert (Alert): The alert to show
+		"""
+		if (self.alert != None):
+			self.hits.remove(self.alert)
+		self.alert = alert
+		self.alert.register(self.hits)
+
+	def hideAlert(self):
+		"""Hides the alert that is being shown"""
+		if (self.alert != None):
+			self.hits.remove(self.alert)
+			self.alert.hide()
+			self.alert = None
+
+	def switch(self, name: str):
+		"""Switches to another scene after this frame
+
+		Args:
+			name (str): The name of the scene to switch to
+		"""
+		self.next = name
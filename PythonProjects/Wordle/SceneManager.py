@@ -0,0 +1,188 @@
+from concurrent.futures import Future
+from typing import Tuple
+import math
+import pygame
+from FrameProfiler import FrameProfiler
+from Window import Window
+
+
+class SceneManager:
+	"""Runs the main loop of the game, showing one scene at a time
+
+	Only the current scene is kept alive, so switching screens frees the old one
+	instead of piling every screen up on the call stack. When there is no input the loop
+	sleeps until the scene changes on its own, like a cursor blinking, instead of drawing the same frame again.
+	"""
+	wakeEvent = pygame.event.custom_type()
+	"""The event posted when work on another thread finishes, so the loop wakes up to show the result"""
+
+	def __init__(self, window: Window, clock: pygame.time.Clock, scenes: dict[str, type], fps: int=60, profiler: FrameProfiler=None):
+		"""Initializes the SceneManager
+
+		Args:
+			window (Window): The window the scenes are drawn on
+			clock (pygame.time.Clock): The clock that keeps track of the time between each frame
+			scenes (dict[str, type]): The scene classes by name. scenes[name] = class
+			fps (int, optional): The most frames to run each second. Defaults to 60.
+			profiler (FrameProfiler, optional): Times the stages of each frame. Defaults to None for one that is disabled.
+		"""
+		self.window = window
+		"""The window the scenes are drawn on"""
+
+		self.clock = clock
+		"""The clock that keeps track of the time between each frame"""
+
+		self.scenes = scenes
+		"""The scene classes by name. scenes[name] = class"""
+
+		self.fps = fps
+		"""The most frames to run each second"""
+
+		self.scene = None
+		"""The scene that is being shown"""
+
+		self.profiler = profiler if profiler != None else FrameProfiler()
+		"""Times the stages of each frame"""
+
+		self.redraw = True
+		"""Whether the scene has to be drawn next frame even if there is no input"""
+
+		self.overlay = None
+		"""Where the frame timings were drawn on the window last frame. None if they weren't"""
+
+	def show(self, wordle, name: str):
+		"""Replaces the current scene with a new one
+
+		Args:
+			wordle (Wordle): The game the scene is part of
+			name (str): The name of the scene to show
+		"""
+		if (self.scene != None):
+			self.scene.exit()
+			self.scene = None
+
+		self.scene = self.scenes[name](wordle)
+		self.scene.enter()
+		self.redraw = True
+
+	def run(self, wordle, name: str):
+		"""Shows a scene and runs the game until the window is closed
+
+		Args:
+			wordle (Wordle): The game the scenes are part of
+			name (str): The name of the first scene to show
+		"""
+		self.show(wordle, name)
+
+		while True:
+			# run at 60 fps
+			self.clock.tick(self.fps)
+
+			events = pygame.event.get()
+			if (not events and not self.redraw):
+				events = self.wait()
+			self.profiler.begin()
+
+			# get the position of the mouse for later use
+			mousePos = pygame.mouse.get_pos()
+
+			if (not self.frame(wordle, events, mousePos)):
+				return
+
+	def wait(self) -> list[pygame.event.Event]:
+		"""Sleeps until there is input or the scene changes on its own
+
+		Returns:
+			list[pygame.event.Event]: The events that woke the loop. Empty if the scene has to be drawn
+		"""
+		timeouts = [timeout for timeout in (self.scene.nextChange(), self.scene.timeline.nextChange()) if timeout != None]
+		timeout = min(timeouts) if timeouts else None
+		if (timeout == None):
+			event = pygame.event.wait()
+		elif (timeout > 0):
+			# a timeout of 0 would wait forever so always wait at least a millisecond
+			event = pygame.event.wait(max(1, math.ceil(timeout * 1000)))
+		else:
+			return []
+
+		if (event.type == pygame.NOEVENT):
+			return []
+		return [event] + pygame.event.get()
+
+	def wakeWhenDone(self, future: Future) -> Future:
+		"""Wakes the loop up when work on another thread finishes, like checking a password
+
+		Args:
+			future (Future): The work
+
+		Returns:
+			Future: The same work
+		"""
+		def wake(future: Future):
+			try:
+				pygame.event.post(pygame.event.Event(self.wakeEvent))
+			except pygame.error:
+				# the window was closed before the work finished
+				pass
+
+		future.add_done_callback(wake)
+		return future
+
+	def frame(self, wordle, events: list[pygame.event.Event], mousePos: Tuple[int, int]) -> bool:
+		"""Runs one frame of the current scene
+
+		Args:
+			wordle (Wordle): The game the scenes are part of
+			events (list[pygame.event.Event]): The events since the last frame
+			mousePos (Tuple[int, int]): The position of the mouse
+
+		Returns:
+			bool: Whether the game keeps running. False once the window is closed
+		"""
+		# F3 shows the frame timings when profiling
+		if (self.profiler.enabled and any(event.type == pygame.KEYDOWN and event.key == pygame.K_F3 for event in events)):
+			self.profiler.toggleOverlay()
+			self.window.invalidate()
+			events = [event for event in events if not (event.type == pygame.KEYDOWN and event.key == pygame.K_F3)]
+		# the window was covered so all of it has to be shown again
+		if (any(event.type == pygame.WINDOWEXPOSED for event in events)):
+			self.window.invalidate()
+		self.profiler.mark("events")
+
+		# Check for QUIT event
+		if (any(event.type == pygame.QUIT for event in events)):
+			self.scene.exit()
+			self.scene = None
+			return False
+
+		# move the animations to this frame before the scene handles the events
+		self.scene.timeline.update()
+		self.scene.update(events, mousePos)
+
+		# the scene asked for another screen so show it from the next frame
+		if (self.scene.next != None):
+			self.show(wordle, self.scene.next)
+			self.profiler.mark("update")
+			self.profiler.end()
+			return True
+		self.profiler.mark("update")
+
+		# the scene copies its screen over where the timings were so they are drawn on a clean window
+		if (self.overlay != None):
+			self.window.markDirty(self.overlay)
+
+		# the scene marks the end of rendering its widgets before it blits its screen onto the window
+		self.scene.render(mousePos)
+		self.profiler.mark("blit")
+
+		self.overlay = self.profiler.drawOverlay(self.window.display)
+		if (self.overlay != None):
+			self.window.markDirty(self.overlay)
+		self.profiler.mark("overlay")
+
+		# update
+		self.window.update()
+		self.redraw = False
+		self.profiler.mark("present")
+		self.profiler.end()
+		return True
@@ -0,0 +1,328 @@
+from typing import Tuple
+import pygame
+from Button import Button
+from Style import Style
+from Surface import Surface
+from Text import Text
+from TextBox import TextBox
+from colors import *
+from Scene import Scene
+
+
+class SignUpScene(Scene):
+	"""The screen to create a new account
+	"""
+	def enter(self):
+		"""Creates the widgets of the screen"""
+		# create the log in screen
+		self.signUpScreen = Surface((0, 0), self.wordle.size, self.wordle.backgroundColor)
+		
+		# Create the header for the screen
+
+		# create the header
+		self.header = Surface((0, 0), (self.wordle.width, 50), CYBERGRAPE)
+
+		# create the button to go back to the home page that doubles as the title
+		self.titleButton = Button(Surface((self.header.width / 2 - 75, 2), (150, 50), CYBERGRAPE),
+								Style(Text((150 / 2, 50 / 2), self.wordle.font, 25, "WORDLE", WHITE),
+								fillColor=CYBERGRAPE))
+
+
+
+		# Create the title for the screen
+		self.title = Text((self.wordle.width / 2, 100), self.wordle.font, 75, "SIGN UP", WHITE)
+
+
+
+		# Create the Username label for the screen
+		self.usernameLbl = Text((self.wordle.width / 4 + 20, 180), self.wordle.font, 25, "USERNAME", WHITE)
+
+		# Create the username text box for the screen
+		self.usernameTxt = TextBox(Surface((self.wordle.width / 4 - 30, 200), (300, 30), self.wordle.backgroundColor),
+								Style(Text((10, 30 / 2), self.wordle.font, 15, "", WHITE),
+                    			borderColor=LIGHTGREEN, borderRadius=5),
+
+                   		 		selectedStyle=Style(borderColor=LIGHTGREEN, borderWidth=4, borderRadius=5))
+
+
+
+
+		# Create the Password label for the screen
+		self.passwordLbl = Text((self.wordle.width / 4 + 20, 270), self.wordle.font, 25, "PASSWORD", WHITE)
+
+		# Create the password text box for the screen
+		self.passwordTxt = TextBox(Surface((self.wordle.width / 4 - 30, 290), (300, 30), self.wordle.backgroundColor),
+                        		Style(Text((10, 30 / 2), self.wordle.font, 15, "", WHITE),
+                                borderColor=LIGHTGREEN, borderRadius=5),
+
+                        		selectedStyle=Style(borderColor=LIGHTGREEN, borderWidth=4, borderRadius=5), hidden=True)
+
+		# Create the verify Password label for the screen
+		self.verifyPasswordLbl = Text((self.wordle.width / 4 + 70, 360), self.wordle.font, 25, "VERIFY PASSWORD", WHITE)
+
+		# Create the verify password text box for the screen
+		self.verifyPasswordTxt = TextBox(Surface((self.wordle.width / 4 - 30, 380), (300, 30), self.wordle.backgroundColor),
+                        		Style(Text((10, 30 / 2), self.wordle.font, 15, "", WHITE),
+                                borderColor=LIGHTGREEN, borderRadius=5),
+
+                       			selectedStyle=Style(borderColor=LIGHTGREEN, borderWidth=4, borderRadius=5), hidden=True)
+
+		# Create the login button for the screen
+		self.signUpButton = Button(Surface((self.wordle.width / 2 + 20, 440), (150, 50), self.wordle.backgroundColor),
+                       			Style(Text((75, 25), self.wordle.font, 25, "SIGN UP", ORCHID),
+                                borderColor=ORCHID, borderRadius=5),
+
+								hoverStyle=Style(Text((75, 25), self.wordle.font, 26, "SIGN UP", WHITE),
+                         		fillColor=ORCHID, borderRadius=5))
+
+
+		# the keyboard is shared with the game so clear the colors of the last guesses
+		self.keyboard = self.wordle.keyboard
+		self.keyboard.reset()
+
+		# the widgets that can be clicked, from the bottom up
+		self.titleButton.register(self.hits, self.header.pos)
+		self.usernameTxt.register(self.hits)
+		self.passwordTxt.register(self.hits)
+		self.verifyPasswordTxt.register(self.hits)
+		self.signUpButton.register(self.hits)
+		self.keyboard.register(self.hits)
+
+
+		# the password being checked in the background
+		self.newUser = None
+
+		# the whole window changes when the screen is shown
+		self.wordle.window.invalidate()
+
+	def update(self, events: list[pygame.event.Event], mousePos: Tuple[int, int]):
+		"""Handles the events of a frame
+
+		Args:
+			events (list[pygame.event.Event]): The events since the last frame
+			mousePos (Tuple[int, int]): The position of the mouse
+		"""
+
+		# sign up once the password has been hashed
+		if (self.newUser != None and self.newUser.done()):
+			success, error, type, fontSize = self.newUser.result()
+			self.newUser = None
+			self.wordle.window.invalidate()
+			if (success):
+				self.switch("Play")
+				return
+			# Show a message window
+			self.showAlert(self.wordle.messageAlert(error, type, fontSize))
+
+		# loop through the events
+		for event in events:
+
+			# input can change anything on the screen so update all of it
+			if event.type == pygame.MOUSEBUTTONDOWN or event.type == pygame.KEYDOWN:
+				self.wordle.window.invalidate()
+
+			# Checks for the MOUSEDOWN event
+			if event.type == pygame.MOUSEBUTTONDOWN:
+				hit = self.hits.at(mousePos)
+
+				# if the mouse clicked the log in button
+				if (hit is self.titleButton):
+					self.switch("Start")
+					return
+				elif (hit is self.signUpButton):
+
+					# check the password in the background so the screen keeps rendering
+					if (self.newUser == None):
+						self.newUser = self.wordle.createNewUser(self.usernameTxt.style.text.text, self.passwordTxt.style.text.text, self.verifyPasswordTxt.style.text.text)
+
+				# if the mouse clicks the close button on the alert
+				elif (hit is self.alert):
+					self.hideAlert()
+
+				# check to see if the user clicked on the keyboard
+				keyboardClicked = hit in self.keyboard.keys
+				if (keyboardClicked):
+					key = hit
+					# if the key is the enter button encrement the current word
+					if (key == "ENTER"):
+						# jump to the password text box
+						if (self.usernameTxt.isSelected):
+							self.usernameTxt.isSelected = False
+							self.verifyPasswordTxt.isSelected = False
+							self.passwordTxt.isSelected = True
+						# jump to the verify password text box
+						elif(self.passwordTxt.isSelected):
+							self.passwordTxt.isSelected = False
+							self.verifyPasswordTxt.isSelected = True
+						# Sign up
+						else:
+							# check the password in the background so the screen keeps rendering
+							if (self.newUser == None):
+								self.newUser = self.wordle.createNewUser(
+								self.usernameTxt.style.text.text, self.passwordTxt.style.text.text, self.verifyPasswordTxt.style.text.text)
+					# if the key is the back button delete the last character of the current word
+					elif (key == "BACK"):
+						# if username text box is selected -> backspace
+						if (self.usernameTxt.isSelected):
+							self.usernameTxt.backSpace()
+						# if password text box is selected -> backspace
+						elif (self.passwordTxt.isSelected):
+							self.passwordTxt.backSpace()
+						# if verify password text box is selected -> backspace
+						elif (self.verifyPasswordTxt.isSelected):
+							self.verifyPasswordTxt.backSpace()
+					# else just add the word if the length is less than 5
+					else:
+						# if the username text box is selevted -> insert the character
+						if (self.usernameTxt.isSelected):
+							self.usernameTxt.insert(key)
+						# if the password text box is selevted -> insert the character
+						elif (self.passwordTxt.isSelected):
+							self.passwordTxt.insert(key)
+						# if verify password text box is selected -> insert the character
+						elif (self.verifyPasswordTxt.isSelected):
+							self.verifyPasswordTxt.insert(key)
+
+				if not keyboardClicked:
+					# check if the mouse hit the username text box
+					self.usernameTxt.isSelected = hit is self.usernameTxt
+
+					# check if th mouse hit the password text box
+					self.passwordTxt.isSelected = hit is self.passwordTxt
+
+					# check if the mouse hit the verify password text box
+					self.verifyPasswordTxt.isSelected = hit is self.verifyPasswordTxt
+
+
+			# Checks for the KEYDOWN event
+			if event.type == pygame.KEYDOWN:
+				# if the return key is pressed
+				if event.key == pygame.K_RETURN:
+					# jump to the password text box
+					if (self.usernameTxt.isSelected):
+						self.usernameTxt.isSelected = False
+						self.verifyPasswordTxt.isSelected = False
+						self.passwordTxt.isSelected = True
+					# jump to the verify password text box
+					elif(self.passwordTxt.isSelected):
+						self.passwordTxt.isSelected = False
+						self.verifyPasswordTxt.isSelected = True
+					# Sign up
+					else:
+						# check the password in the background so the screen keeps rendering
+						if (self.newUser == None):
+							self.newUser = self.wordle.createNewUser(self.usernameTxt.style.text.text, self.passwordTxt.style.text.text, self.verifyPasswordTxt.style.text.text)
+						
+				# if the tab key is pressed
+				elif event.key == pygame.K_TAB:
+					# jump to the password text box
+					if (self.usernameTxt.isSelected):
+						self.usernameTxt.isSelected = False
+						self.passwordTxt.isSelected = True
+					elif (self.passwordTxt.isSelected):
+						self.usernameTxt.isSelected = False
+						self.passwordTxt.isSelected = False
+						self.verifyPasswordTxt.isSelected = True
+					# jump to the username text box
+					else:
+						self.verifyPasswordTxt.isSelected = False
+						self.passwordTxt.isSelected = False
+						self.usernameTxt.isSelected = True
+
+				# if the key is the backspace
+				elif event.key == pygame.K_BACKSPACE:
+					# if username text box is selected -> backspace
+					if (self.usernameTxt.isSelected):
+						self.usernameTxt.backSpace()
+					# if password text box is selected -> backspace
+					elif (self.passwordTxt.isSelected):
+						self.passwordTxt.backSpace()
+					# if verify password text box is selected -> backspace
+					elif (self.verifyPasswordTxt.isSelected):
+						self.verifyPasswordTxt.backSpace()
+				else:
+					# if the username text box is selevted -> insert the character
+					if (self.usernameTxt.isSelected):
+						self.usernameTxt.insert(event.unicode)
+					# if the password text box is selevted -> insert the character
+					elif (self.passwordTxt.isSelected):
+						self.passwordTxt.insert(event.unicode)
+					# if verify password text box is selected -> insert the character
+					elif (self.verifyPasswordTxt.isSelected):
+						self.verifyPasswordTxt.insert(event.unicode)
+
+	def nextChange(self) -> float:
+		"""Determines how long the screen looks the same when there is no input
+
+		Returns:
+			float: The seconds until the cursor of the selected text box blinks or None if none is selected
+		"""
+		return next((box.nextChange() for box in (self.usernameTxt, self.passwordTxt, self.verifyPasswordTxt) if box.isSelected), None)
+
+	def render(self, mousePos: Tuple[int, int]):
+		"""Draws the screen
+
+		Args:
+			mousePos (Tuple[int, int]): The position of the mouse
+		"""
+		redrawAll = self.wordle.window.redrawAll
+
+		# the background and labels only change when all of the screen is drawn
+		if (redrawAll):
+			# clear the screen
+			self.signUpScreen.clear()
+
+			# create the rectangles
+			pygame.draw.rect(self.signUpScreen.display, TURQUOISE, (-33, 69, 320, 700), 2, 10)
+			pygame.draw.rect(self.signUpScreen.display, DENIM, (130, 200, 600, 600), 2, 10)
+			pygame.draw.rect(self.signUpScreen.display, CYBERGRAPE, (-33, 500, 600, 300), 2, 10)
+
+			# render the header
+			self.signUpScreen.display.blit(self.header.display, self.header.pos)
+
+			# render the title
+			self.signUpScreen.display.blit(self.title.display, self.title.rect)
+
+			# render the username label
+			self.signUpScreen.display.blit(self.usernameLbl.display, self.usernameLbl.rect)
+
+			# render the password label
+			self.signUpScreen.display.blit(self.passwordLbl.display, self.passwordLbl.rect)
+
+			# render the verify password label
+			self.signUpScreen.display.blit(self.verifyPasswordLbl.display, self.verifyPasswordLbl.rect)
+
+		# render the title button on the header
+		self.titleButton.render()
+		self.draw(self.titleButton, self.signUpScreen, self.header)
+
+		# render the username Text box
+		self.usernameTxt.render()
+		self.draw(self.usernameTxt, self.signUpScreen)
+
+		# render the password Text Box
+		self.passwordTxt.render()
+		self.draw(self.passwordTxt, self.signUpScreen)
+
+		# render the verify password Text Box
+		self.verifyPasswordTxt.render()
+		self.draw(self.verifyPasswordTxt, self.signUpScreen)
+
+		# render the login button
+		self.signUpButton.render(mousePos)
+		self.draw(self.signUpButton, self.signUpScreen)
+
+		# render the keyboard
+		for rect in self.keyboard.render(self.signUpScreen.display, self.hits.at(mousePos), redrawAll):
+			self.wordle.window.markDirty(rect)
+
+		# render the alert
+		if (self.alert != None):
+			self.alert.render(mousePos)
+			self.draw(self.alert, self.signUpScreen)
+
+		# the widgets are drawn, the rest is blitting the screen onto the window
+		self.wordle.profiler.mark("render")
+
+		# render the screen
+		self.wordle.window.blitScreen(self.signUpScreen.display)
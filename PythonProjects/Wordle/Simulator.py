@@ -0,0 +1,209 @@
+import argparse
+import csv
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Tuple
+from Feedback import Feedback
+from GameSession import GameSession
+from WordIndex import WordIndex
+
+
+class SolverStrategy:
+	"""Plays the guess the Solver expects to tell the most about the secret word
+	"""
+	def __init__(self, words: WordIndex):
+		"""Initializes the SolverStrategy
+
+		Args:
+			words (WordIndex): The words that can be guessed and can be the secret word
+		"""
+		from Solver import Solver
+
+		self.solver = Solver.open(words)
+		"""The solver that picks the guesses"""
+
+	def startGame(self, seed: int):
+		"""Gets ready for a new game. The solver always picks the same guesses so there is nothing to do
+
+		Args:
+			seed (int): The seed of the game
+		"""
+
+	def nextGuess(self, game: GameSession) -> str:
+		"""Picks the next guess
+
+		Args:
+			game (GameSession): The game being played
+
+		Returns:
+			str: The word to guess
+		"""
+		return self.solver.suggest(list(zip(game.guesses, game.feedback)))
+
+
+class RandomStrategy:
+	"""Plays a random word that agrees with everything the game has shown so far
+	"""
+	def __init__(self, words: WordIndex, seed: int=None):
+		"""Initializes the RandomStrategy
+
+		Args:
+			words (WordIndex): The words that can be guessed and can be the secret word
+			seed (int, optional): The seed for picking the words. Defaults to None for a different game every run.
+		"""
+		self.words = list(words)
+		"""The words that can be guessed"""
+
+		self.rng = random.Random(seed)
+		"""The random number generator used to pick the words"""
+
+	def startGame(self, seed: int):
+		"""Gets ready for a new game, seeding the picks so the game plays the same way every run
+
+		Args:
+			seed (int): The seed of the game
+		"""
+		self.rng.seed(seed)
+
+	def nextGuess(self, game: GameSession) -> str:
+		"""Picks the next guess
+
+		Args:
+			game (GameSession): The game being played
+
+		Returns:
+			str: The word to guess
+		"""
+		candidates = self.words
+		for guess, pattern in zip(game.guesses, game.feedback):
+			guess = guess.lower()
+			candidates = [word for word in candidates if Feedback.score(guess, word) == pattern]
+		return self.rng.choice(candidates)
+
+
+strategies = {"solver": SolverStrategy, "random": RandomStrategy}
+"""The strategies that can be simulated. strategies[name] = class"""
+
+workerWords = None
+"""The words used by the worker process"""
+workerStrategy = None
+"""The strategy used by the worker process"""
+
+
+def startWorker(wordsPath: str, strategyName: str):
+	"""Loads the words and the strategy once for each worker process
+
+	Args:
+		wordsPath (str): The path to the text word list
+		strategyName (str): The name of the strategy to play with
+	"""
+	global workerWords, workerStrategy
+	workerWords = WordIndex.open(wordsPath)
+	workerStrategy = strategies[strategyName](workerWords)
+
+
+def playWords(games: list[Tuple[int, str]], maxGuesses: int, seed: int) -> list[Tuple[str, int, bool, float]]:
+	"""Plays a game for each secret word in the worker process
+
+	Args:
+		games (list[Tuple[int, str]]): The number of each game and its secret word
+		maxGuesses (int): The number of guesses the strategy gets
+		seed (int): The seed of the simulation. Each game gets its own seed from it and its number
+
+	Returns:
+		list[Tuple[str, int, bool, float]]: The secret word, the number of guesses, whether it was won and the seconds it took for each game
+	"""
+	results = []
+	for number, secretWord in games:
+		start = time.perf_counter()
+		# the same game plays the same way no matter which worker gets it
+		workerStrategy.startGame(hash((seed, number)))
+		game = GameSession(secretWord, workerWords, maxGuesses)
+		while (not game.isOver):
+			game.guess(workerStrategy.nextGuess(game))
+		results.append((secretWord.lower(), len(game.guesses), game.isWon, time.perf_counter() - start))
+	return results
+
+
+def simulate(wordsPath: str, strategyName: str="solver", sample: int=None, seed: int=0, workers: int=None, maxGuesses: int=6) -> Tuple[dict, list]:
+	"""Plays every word in the word list, or a sample of them, as the secret word
+
+	Args:
+		wordsPath (str): The path to the text word list
+		strategyName (str, optional): The name of the strategy to play with. Defaults to "solver".
+		sample (int, optional): How many secret words to sample. Defaults to None for every word.
+		seed (int, optional): The seed for sampling the secret words and for the strategy's picks. Defaults to 0.
+		workers (int, optional): The number of processes to play with. Defaults to the number of CPUs.
+		maxGuesses (int, optional): The number of guesses the strategy gets. Defaults to 6.
+
+	Returns:
+		Tuple[dict, list]: The summary of the games and the result of each game
+	"""
+	words = WordIndex.open(wordsPath)
+	secretWords = list(words)
+	if (sample != None and sample < len(secretWords)):
+		secretWords = random.Random(seed).sample(secretWords, sample)
+
+	# build the caches once here so the workers only have to load them
+	strategies[strategyName](words)
+
+	workers = workers or os.cpu_count() or 1
+	games = list(enumerate(secretWords))
+	chunkSize = max(1, len(games) // (workers * 8))
+	chunks = [games[i:i + chunkSize] for i in range(0, len(games), chunkSize)]
+
+	start = time.perf_counter()
+	results = []
+	with ProcessPoolExecutor(workers, initializer=startWorker, initargs=(wordsPath, strategyName)) as executor:
+		for chunkResults in executor.map(playWords, chunks, [maxGuesses] * len(chunks), [seed] * len(chunks)):
+			results.extend(chunkResults)
+	elapsed = time.perf_counter() - start
+
+	# count how many games took each number of guesses
+	distribution = {str(guesses): 0 for guesses in range(1, maxGuesses + 1)}
+	distribution["X"] = 0
+	for _, guesses, won, _ in results:
+		distribution[str(guesses) if won else "X"] += 1
+
+	wins = [guesses for _, guesses, won, _ in results if won]
+	summary = {
+		"strategy": strategyName,
+		"games": len(results),
+		"wins": len(wins),
+		"winPercent": 100 * len(wins) / len(results) if results else 0,
+		"averageGuesses": sum(wins) / len(wins) if wins else None,
+		"distribution": distribution,
+		"workers": workers,
+		"seconds": elapsed,
+		"gamesPerSecond": len(results) / elapsed if elapsed > 0 else None,
+	}
+	return summary, results
+
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Plays every word in the dictionary as the secret word with a strategy")
+	parser.add_argument("--words", default="FiveLetterWords.txt", help="the text word list with one word on each line")
+	parser.add_argument("--strategy", default="solver", choices=sorted(strategies), help="how to pick the guesses")
+	parser.add_argument("--sample", type=int, help="play a random sample of this many secret words instead of all of them")
+	parser.add_argument("--seed", type=int, default=0, help="the seed for sampling the secret words and for the strategy's picks")
+	parser.add_argument("--workers", type=int, help="the number of processes to play with. Defaults to the number of CPUs")
+	parser.add_argument("--max-guesses", type=int, default=6, help="the number of guesses the strategy gets")
+	parser.add_argument("--output", default="simulation.json", help="where to write the summary")
+	parser.add_argument("--timings", default="simulation.csv", help="where to write the result and time of each game")
+	arguments = parser.parse_args()
+
+	summary, results = simulate(arguments.words, arguments.strategy, arguments.sample, arguments.seed, arguments.workers, arguments.max_guesses)
+
+	with open(arguments.output, "w") as file:
+		json.dump(summary, file, indent=4)
+
+	with open(arguments.timings, "w", newline="") as file:
+		writer = csv.writer(file)
+		writer.writerow(["word", "guesses", "won", "seconds"])
+		writer.writerows(results)
+
+	print(f"Played {summary['games']} games in {summary['seconds']:.2f}s with {summary['workers']} workers")
+	print(f"Won {summary['winPercent']:.1f}% averaging {summary['averageGuesses']} guesses: {summary['distribution']}")
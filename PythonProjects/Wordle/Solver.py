@@ -0,0 +1,211 @@
+import argparse
+import json
+import zlib
+from typing import Tuple
+import numpy as np
+from Feedback import Feedback
+from FeedbackMatrix import FeedbackMatrix
+from WordIndex import WordIndex
+
+
+class Solver:
+	"""Suggests the guess that is expected to tell the most about the secret word
+
+	The best first guess and the best second guess after each pattern of it are cached on disk,
+	because scoring every guess against every answer is the slow part.
+	"""
+	def __init__(self, feedback: FeedbackMatrix, cachePath: str=None, sampleSize: int=384):
+		"""Initializes the Solver
+
+		Args:
+			feedback (FeedbackMatrix): The patterns of every guess against every answer
+			cachePath (str, optional): Where the opening moves are cached. Defaults to None for no cache.
+			sampleSize (int, optional): The most candidates to score each guess against when suggesting. Defaults to 384.
+		"""
+		self.feedback = feedback
+		"""The patterns of every guess against every answer"""
+
+		self.answerPatterns = np.ascontiguousarray(feedback.matrix.T)
+		"""The patterns of every guess for each answer, so the candidates can be picked out as rows"""
+
+		self.sampleSize = sampleSize
+		"""The most candidates to score each guess against when suggesting"""
+
+		self.guessWords = feedback.words(feedback.guesses)
+		"""The words that can be guessed in the order of the matrix rows"""
+
+		self.answerWords = feedback.words(feedback.answers)
+		"""The words that can be the secret word in the order of the matrix columns"""
+
+		self.patternCount = 3 ** feedback.answers.shape[1]
+		"""The number of different patterns a guess can get"""
+
+		self.isAnswer = np.isin(np.array(self.guessWords), np.array(self.answerWords))
+		"""Whether each guess could be the secret word"""
+
+		self.cachePath = cachePath
+		"""Where the opening moves are cached"""
+
+		self.opening = None
+		"""The best first guess"""
+
+		self.secondGuesses = None
+		"""The best second guess after the opening. secondGuesses[pattern] = guess"""
+
+		self.loadOpenings()
+
+	@classmethod
+	def open(cls, words: WordIndex, matrixPath: str="FeedbackMatrix.npz", cachePath: str="SolverCache.json") -> "Solver":
+		"""Creates a Solver for a word list, loading the matrix and opening moves from disk when they are up to date
+
+		Args:
+			words (WordIndex): The words that can be guessed and can be the secret word
+			matrixPath (str, optional): Where the feedback matrix is saved. Defaults to "FeedbackMatrix.npz".
+			cachePath (str, optional): Where the opening moves are cached. Defaults to "SolverCache.json".
+
+		Returns:
+			Solver: The solver for the words
+		"""
+		return cls(FeedbackMatrix.open(matrixPath, words), cachePath)
+
+	def checksum(self) -> int:
+		"""Returns a checksum of the words the solver was made for
+
+		Returns:
+			int: The crc32 of the guesses and answers
+		"""
+		return zlib.crc32(self.feedback.answers.tobytes(), zlib.crc32(self.feedback.guesses.tobytes()))
+
+	def loadOpenings(self):
+		"""Loads the opening moves from the cache, working them out and saving them if they are missing or stale"""
+		if (self.cachePath != None):
+			try:
+				with open(self.cachePath) as file:
+					cache = json.load(file)
+				if (cache["checksum"] == self.checksum()):
+					self.opening = cache["opening"]
+					self.secondGuesses = {int(pattern): guess for pattern, guess in cache["secondGuesses"].items()}
+					return
+			except (OSError, ValueError, KeyError):
+				pass
+
+		# work out the best first guess and the best guess after each of its patterns
+		allAnswers = np.arange(len(self.answerWords))
+		self.opening = self.bestGuess(allAnswers, exact=True)
+
+		openingRow = self.feedback.row(self.opening)
+		self.secondGuesses = {}
+		for pattern in np.unique(openingRow):
+			self.secondGuesses[int(pattern)] = self.bestGuess(allAnswers[openingRow == pattern], exact=True)
+
+		if (self.cachePath != None):
+			try:
+				with open(self.cachePath, "w") as file:
+					json.dump({"checksum": self.checksum(), "opening": self.opening,
+								"secondGuesses": {str(pattern): guess for pattern, guess in self.secondGuesses.items()}}, file)
+			except OSError:
+				pass
+
+	def candidates(self, history: list[Tuple[str, int]]) -> np.ndarray:
+		"""Finds the answers that agree with every guess so far
+
+		Args:
+			history (list[Tuple[str, int]]): The guesses so far and the pattern each one got
+
+		Returns:
+			np.ndarray: The indices of the answers that are still possible
+		"""
+		possible = np.ones(len(self.answerWords), dtype=bool)
+		for guess, pattern in history:
+			possible &= self.feedback.row(guess) == pattern
+		return np.flatnonzero(possible)
+
+	def entropies(self, candidates: np.ndarray, chunkSize: int=1024) -> np.ndarray:
+		"""Works out how much each guess is expected to tell about the secret word
+
+		Args:
+			candidates (np.ndarray): The indices of the answers that are still possible
+			chunkSize (int, optional): How many guesses to score at once. Bigger is faster but uses more memory. Defaults to 1024.
+
+		Returns:
+			np.ndarray: The expected information of each guess in bits
+		"""
+		# countLogs[n] = n * log2(n)
+		total = len(candidates)
+		sizes = np.arange(1, total + 1)
+		countLogs = np.concatenate(([0.0], sizes * np.log2(sizes)))
+
+		scores = np.empty(len(self.guessWords))
+		offsets = np.arange(chunkSize, dtype=np.int32) * self.patternCount
+		for start in range(0, len(self.guessWords), chunkSize):
+			patterns = self.answerPatterns[candidates, start:start + chunkSize].astype(np.int32)
+			guesses = patterns.shape[1]
+
+			# count how many candidates get each pattern for every guess in the chunk at once
+			patterns += offsets[:guesses]
+			counts = np.bincount(patterns.ravel(), minlength=guesses * self.patternCount).reshape(guesses, self.patternCount)
+			scores[start:start + guesses] = np.log2(total) - countLogs[counts].sum(axis=1) / total
+		return scores
+
+	def bestGuess(self, candidates: np.ndarray, exact: bool=False) -> str:
+		"""Picks the guess that is expected to tell the most about the secret word
+
+		Args:
+			candidates (np.ndarray): The indices of the answers that are still possible
+			exact (bool, optional): Whether to score against every candidate instead of a sample. Defaults to False.
+
+		Returns:
+			str: The best guess
+		"""
+		if (len(candidates) <= 2):
+			return self.answerWords[candidates[0]]
+
+		# with a lot of candidates a sample of them ranks the guesses almost the same for a lot less work
+		if (not exact and self.sampleSize != None and len(candidates) > self.sampleSize):
+			candidates = np.random.default_rng(len(candidates)).choice(candidates, self.sampleSize, replace=False)
+
+		# break ties with guesses that could win right away
+		scores = self.entropies(candidates) + self.isAnswer * 1e-6
+		return self.guessWords[int(np.argmax(scores))]
+
+	def suggest(self, history: list[Tuple[str, int]]) -> str:
+		"""Suggests the next guess
+
+		Args:
+			history (list[Tuple[str, int]]): The guesses so far and the pattern each one got
+
+		Returns:
+			str: The suggested guess or None if no answer agrees with the guesses
+		"""
+		history = [(guess.lower(), pattern) for guess, pattern in history]
+
+		if (not history):
+			return self.opening
+		if (len(history) == 1 and history[0][0] == self.opening and history[0][1] in self.secondGuesses):
+			return self.secondGuesses[history[0][1]]
+
+		candidates = self.candidates(history)
+		if (len(candidates) == 0):
+			return None
+		return self.bestGuess(candidates)
+
+	def suggestFromWords(self, words: list[str], secretWord: str) -> str:
+		"""Suggests the next guess from the words entered so far in a game
+
+		Args:
+			words (list[str]): The words entered so far
+			secretWord (str): The word the player is trying to guess
+
+		Returns:
+			str: The suggested guess or None if no answer agrees with the guesses
+		"""
+		return self.suggest([(word, Feedback.score(word.lower(), secretWord.lower())) for word in words])
+
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Precomputes the feedback matrix and opening moves used for hints")
+	parser.add_argument("words", nargs="?", default="FiveLetterWords.txt", help="the text word list with one word on each line")
+	arguments = parser.parse_args()
+
+	solver = Solver.open(WordIndex.open(arguments.words))
+	print(f"Opening with {solver.opening.upper()}, {len(solver.secondGuesses)} second guesses cached in {solver.cachePath}")
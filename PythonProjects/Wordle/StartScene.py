@@ -0,0 +1,106 @@
+from typing import Tuple
+import pygame
+from Button import Button
+from Style import Style
+from Surface import Surface
+from Text import Text
+from colors import *
+from Scene import Scene
+
+
+class StartScene(Scene):
+	"""The start screen with the buttons to log in or sign up
+	"""
+	def enter(self):
+		"""Creates the widgets of the screen"""
+		# create the startScreen		
+		self.startScreen = Surface((0, 0), self.wordle.size, self.wordle.backgroundColor)
+
+		# Create the title for the startScreen
+		self.title = Text((self.wordle.width / 2, 100), self.wordle.font, 75, "WORDLE", WHITE)
+
+		# Create the Log in button for the startScreen
+		self.logInButton = Button(Surface((self.wordle.width/ 4 - 75 + 5, 550), (150, 50), self.wordle.backgroundColor),
+							Style(Text((75, 25), self.wordle.font, 25, "LOG IN", DENIM),
+							fillColor=self.wordle.backgroundColor, borderColor=DENIM, borderRadius=5),
+
+                    		hoverStyle=Style(Text((75, 25), self.wordle.font, 26, "LOG IN", WHITE),
+							fillColor=DENIM, borderColor=DENIM, borderRadius=5))
+
+		# Create the sign up button for the startScreen
+		self.signUpButton = Button(Surface((self.wordle.width * 3 / 4 - 75 - 5, 550), (150, 50), self.wordle.backgroundColor),
+								Style(Text((75, 25), self.wordle.font, 24, "SIGN UP", ORCHID),
+								fillColor=self.wordle.backgroundColor, borderColor=ORCHID, borderRadius=5),
+
+								hoverStyle=Style(Text((75, 25), self.wordle.font, 25, "SIGN UP", WHITE),
+								fillColor=ORCHID, borderColor=ORCHID, borderRadius=5))
+
+		self.logInButton.register(self.hits)
+		self.signUpButton.register(self.hits)
+
+		# the whole window changes when the screen is shown
+		self.wordle.window.invalidate()
+
+	def update(self, events: list[pygame.event.Event], mousePos: Tuple[int, int]):
+		"""Handles the events of a frame
+
+		Args:
+			events (list[pygame.event.Event]): The events since the last frame
+			mousePos (Tuple[int, int]): The position of the mouse
+		"""
+		# loop through the events
+		for event in events:
+
+			# input can change anything on the screen so update all of it
+			if event.type == pygame.MOUSEBUTTONDOWN or event.type == pygame.KEYDOWN:
+				self.wordle.window.invalidate()
+
+			# Checks for the MOUSEDOWN event
+			if event.type == pygame.MOUSEBUTTONDOWN:
+				hit = self.hits.at(mousePos)
+
+				# if the mouse clicked the log in button
+				if (hit is self.logInButton):
+					self.switch("LogIn")
+					return
+
+				# if the mouse clicked the sign up button
+				elif (hit is self.signUpButton):
+					self.switch("SignUp")
+					return
+
+	def render(self, mousePos: Tuple[int, int]):
+		"""Draws the screen
+
+		Args:
+			mousePos (Tuple[int, int]): The position of the mouse
+		"""
+		# the background only changes when all of the screen is drawn
+		if (self.wordle.window.redrawAll):
+			# clear the screen
+			self.startScreen.clear()
+
+			# render the background rectangles
+			pygame.draw.rect(self.startScreen.display, TURQUOISE, (-20, -20, 300, 400), 2, 10)
+			pygame.draw.rect(self.startScreen.display, CYBERGRAPE, (205, 200, 500, 520), 2, 10)
+			pygame.draw.rect(self.startScreen.display, LIGHTGREEN, (-20, -20, 112, 600), 2, 10)
+
+
+			# render the title
+			self.startScreen.display.blit(self.title.display, self.title.rect)
+
+		# render the buttons
+
+		# render the log in button
+		self.logInButton.render(mousePos)
+		self.draw(self.logInButton, self.startScreen)
+
+		# render the sign up button
+		self.signUpButton.render(mousePos)
+		self.draw(self.signUpButton, self.startScreen)
+
+		# the widgets are drawn, the rest is blitting the screen onto the window
+		self.wordle.profiler.mark("render")
+
+		# render the screen
+		self.wordle.window.blitScreen(self.startScreen.display)
@@ -0,0 +1,323 @@
+import json
+import os
+import queue
+import threading
+import time
+from collections import deque
+from GameSession import GameSession
+from User import User
+from UserStore import UserStore
+
+
+class StatsJournal:
+	"""Appends the results of the users' games to a journal instead of rewriting the users every game
+
+	Writing a user can mean rewriting the whole database, so instead of updating them at the end of every game
+	the result is appended to the journal as one line. Once enough results pile up they are compacted into
+	the snapshot with a single write, along with a history row for each game and the running stats of each secret word.
+
+	Recording a result only puts it on a queue. A background writer appends the queued results to the journal
+	in batches, when the batch fills up or the flush interval passes, and does the compacting too,
+	so the game never waits on the disk.
+	"""
+	def __init__(self, users: UserStore, journalPath: str, compactEvery: int=32, queueSize: int=256, batchSize: int=32, flushInterval: float=0.5):
+		"""Initializes the StatsJournal, compacting any results left in the journal from the last run and starting the writer
+
+		Args:
+			users (UserStore): The snapshot the users are stored in
+			journalPath (str): The path of the journal file
+			compactEvery (int, optional): How many results can be in the journal before it gets compacted. Defaults to 32.
+			queueSize (int, optional): How many results can wait for the writer. Defaults to 256.
+			batchSize (int, optional): The most results the writer appends at once. Defaults to 32.
+			flushInterval (float, optional): The most seconds a result waits before it is appended. Defaults to 0.5.
+		"""
+		self.users = users
+		"""The snapshot the users are stored in"""
+
+		self.journalPath = journalPath
+		"""The path of the journal file"""
+
+		self.compactEvery = compactEvery
+		"""How many results can be in the journal before it gets compacted"""
+
+		self.batchSize = batchSize
+		"""The most results the writer appends at once"""
+
+		self.flushInterval = flushInterval
+		"""The most seconds a result waits before it is appended"""
+
+		self.snapshotLock = threading.Lock()
+		"""Held while the pending results are written to the snapshot so they aren't counted twice"""
+
+		self.journalLock = threading.Lock()
+		"""Held while the pending results are changed. It is never held while the disk is used, since recording a result takes it"""
+
+		self.pending = []
+		"""The results that aren't in the snapshot yet, including the ones still waiting for the writer"""
+
+		self.deltas = {}
+		"""The pending results of each user in the order they were recorded. deltas[username] = [result]"""
+
+		self.sequence = users.metadata().get('journalApplied', 0)
+		"""The sequence number of the last result that was recorded"""
+
+		self.written = self.sequence
+		"""The sequence number of the last result that was appended to the journal. Only the writer changes it"""
+
+		self.queue = queue.Queue(queueSize)
+		"""The results waiting for the writer. None tells the writer to stop"""
+
+		self.backlog = []
+		"""The results recorded while the queue was full. The writer gets to them once the queue is empty"""
+
+		self.counters = {'written': 0, 'flushes': 0, 'lastFlushSeconds': 0.0, 'maxFlushSeconds': 0.0, 'overflows': 0,
+						'compactions': 0, 'lastCompactSeconds': 0.0, 'lastLatencySeconds': 0.0, 'maxLatencySeconds': 0.0}
+		"""The counters and timings of the writer. The flush timings are the disk writes and the latencies are from recording a result until it is synced"""
+
+		self.recorded = {}
+		"""When each result waiting for the writer was recorded. recorded[sequence] = time.perf_counter()"""
+
+		self.latencies = deque(maxlen=1024)
+		"""The seconds from recording until syncing of the latest results, for the percentiles"""
+
+		# pick up the results that didn't make it into the snapshot last time
+		for record in self.readJournal():
+			if (record['sequence'] > self.sequence):
+				self.addPending(record)
+				self.sequence = self.written = record['sequence']
+		self.file = open(self.journalPath, "a")
+		"""The journal file the results are appended to. Only the writer uses it"""
+		self.compact()
+
+		self.writer = threading.Thread(target=self.writeLoop, daemon=True)
+		"""The thread that appends the queued results and compacts the journal"""
+		self.writer.start()
+
+	def readJournal(self) -> list[dict]:
+		"""Reads every result in the journal file, skipping a line that was only partly written
+
+		Returns:
+			list[dict]: The results in the order they were recorded
+		"""
+		records = []
+		try:
+			with open(self.journalPath) as file:
+				for line in file:
+					try:
+						records.append(json.loads(line))
+					except ValueError:
+						pass
+		except OSError:
+			pass
+		return records
+
+	def addPending(self, record: dict):
+		"""Adds a result to the ones waiting to be compacted
+
+		Args:
+			record (dict): The result
+		"""
+		self.pending.append(record)
+		self.deltas.setdefault(record['username'], []).append(record)
+
+	def find(self, username: str) -> dict:
+		"""Finds a user, including the results that haven't been compacted yet
+
+		Args:
+			username (str): The username of the user
+
+		Returns:
+			dict: The user's document or None if there isn't a user with the username
+		"""
+		with self.snapshotLock:
+			user = self.users.find(username)
+			if (user == None):
+				return None
+			with self.journalLock:
+				delta = self.deltas.get(username)
+				if (delta != None):
+					self.applyDelta(user, delta)
+			return user
+
+	def record(self, username: str, game: GameSession):
+		"""Queues the result of a finished game for the writer
+
+		Args:
+			username (str): The username of the player
+			game (GameSession): The finished game
+		"""
+		with self.journalLock:
+			self.sequence += 1
+			record = {'sequence': self.sequence, 'username': username, 'word': game.secretWord.lower(), 'guesses': len(game.guesses),
+					'seconds': round(game.duration, 1), 'result': game.result, 'finished': int(game.endTime or 0)}
+			self.recorded[self.sequence] = time.perf_counter()
+			self.addPending(record)
+
+			# once anything is in the backlog the newer results have to wait behind it too
+			if (not self.backlog):
+				try:
+					self.queue.put_nowait(record)
+					return
+				except queue.Full:
+					pass
+			self.counters['overflows'] += 1
+			self.backlog.append(record)
+
+	def append(self, records: list[dict]):
+		"""Appends results to the journal file and syncs it to the disk
+
+		Args:
+			records (list[dict]): The results in the order they were recorded
+		"""
+		start = time.perf_counter()
+		with self.journalLock:
+			stamps = [self.recorded.pop(record['sequence'], None) for record in records]
+
+		# the compaction may have already rewritten the journal with some of them
+		stamps = [stamp for record, stamp in zip(records, stamps) if record['sequence'] > self.written]
+		records = [record for record in records if record['sequence'] > self.written]
+		if (not records):
+			return
+
+		# only the writer uses the journal file, so the lock isn't held and recording a result never waits for the disk
+		self.file.write("".join(json.dumps(record) + "\n" for record in records))
+		self.file.flush()
+		os.fsync(self.file.fileno())
+		self.written = records[-1]['sequence']
+
+		end = time.perf_counter()
+		self.counters['written'] += len(records)
+		self.counters['flushes'] += 1
+		self.counters['lastFlushSeconds'] = end - start
+		self.counters['maxFlushSeconds'] = max(self.counters['maxFlushSeconds'], end - start)
+
+		# how long each result waited from being recorded until it was safe on the disk
+		latencies = [end - stamp for stamp in stamps if stamp != None]
+		if (latencies):
+			self.latencies.extend(latencies)
+			self.counters['lastLatencySeconds'] = max(latencies)
+			self.counters['maxLatencySeconds'] = max(self.counters['maxLatencySeconds'], max(latencies))
+
+	def writeLoop(self):
+		"""Appends the queued results in batches and compacts the journal until it is told to stop"""
+		running = True
+		while (running):
+			record = self.queue.get()
+			if (record == None):
+				break
+
+			# gather a batch until it fills up or the oldest result has waited long enough
+			batch = [record]
+			deadline = time.monotonic() + self.flushInterval
+			while (len(batch) < self.batchSize):
+				try:
+					record = self.queue.get(timeout=max(0, deadline - time.monotonic()))
+				except queue.Empty:
+					break
+				if (record == None):
+					running = False
+					break
+				batch.append(record)
+
+			self.append(batch)
+			if (self.queue.empty()):
+				self.appendBacklog()
+			if (len(self.pending) >= self.compactEvery):
+				self.compact()
+		self.appendBacklog()
+
+	def appendBacklog(self):
+		"""Appends the results that were recorded while the queue was full"""
+		with self.journalLock:
+			backlog = self.backlog
+			self.backlog = []
+		if (backlog):
+			self.append(backlog)
+
+	@staticmethod
+	def applyDelta(user: dict, delta: list[dict]):
+		"""Adds the pending results to a user's document, keeping their streaks and guess distribution up to date
+
+		Args:
+			user (dict): The user's document
+			delta (list[dict]): The user's results in the order they were recorded
+		"""
+		player = User.fromDocument(user)
+		for record in delta:
+			if (record['result'] == "win"):
+				player.win(record['guesses'])
+			else:
+				player.lose()
+		user.update(player.toDocument())
+
+	@staticmethod
+	def applyWord(word: dict, results: list[dict]):
+		"""Adds the pending results to the running stats of a secret word
+
+		Args:
+			word (dict): The word's stats
+			results (list[dict]): The results of the games the word was the secret word in
+		"""
+		for record in results:
+			word['plays'] += 1
+			if (record['result'] == "win"):
+				word['wins'] += 1
+				word['guesses'] += record['guesses']
+
+	def compact(self):
+		"""Writes the pending results into the snapshot and removes them from the journal"""
+		start = time.perf_counter()
+		with self.snapshotLock:
+			with self.journalLock:
+				batch = list(self.pending)
+				deltas = {username: list(delta) for username, delta in self.deltas.items()}
+			if (not batch):
+				return
+
+			words = {}
+			for record in batch:
+				words.setdefault(record['word'], []).append(record)
+
+			# update every user, the history, the words and the last applied result with one write
+			changes = {username: lambda user, delta=delta: self.applyDelta(user, delta) for username, delta in deltas.items()}
+			wordChanges = {word: lambda stats, results=results: self.applyWord(stats, results) for word, results in words.items()}
+			self.users.updateMany(changes, {'journalApplied': batch[-1]['sequence']}, batch, wordChanges)
+
+			# keep the results that were recorded while the snapshot was being written
+			with self.journalLock:
+				remaining = self.pending[len(batch):]
+				self.pending = []
+				self.deltas = {}
+				for record in remaining:
+					self.addPending(record)
+
+			# the results the writer hasn't got to yet are appended when it does
+			self.file.close()
+			with open(self.journalPath + ".tmp", "w") as file:
+				file.writelines(json.dumps(record) + "\n" for record in remaining if record['sequence'] <= self.written)
+			os.replace(self.journalPath + ".tmp", self.journalPath)
+			self.file = open(self.journalPath, "a")
+			self.written = max(self.written, batch[-1]['sequence'])
+
+		self.counters['compactions'] += 1
+		self.counters['lastCompactSeconds'] = time.perf_counter() - start
+
+	def metrics(self) -> dict:
+		"""Returns how the writer is keeping up
+
+		Returns:
+			dict: The queue depth, the number of results that aren't compacted, the writer's counters and timings,
+				and the p50, p95 and p99 seconds from recording a result until it is synced
+		"""
+		ordered = sorted(self.latencies)
+		last = len(ordered) - 1
+		percentiles = {f'p{round(percent * 100)}LatencySeconds': ordered[round(last * percent)] if ordered else 0.0 for percent in (0.5, 0.95, 0.99)}
+		return {'queueDepth': self.queue.qsize() + len(self.backlog), 'pending': len(self.pending), **self.counters, **percentiles}
+
+	def close(self):
+		"""Appends the queued results, stops the writer and compacts whatever is left"""
+		if (self.writer.is_alive()):
+			self.queue.put(None)
+			self.writer.join()
+		self.compact()
+		self.file.close()
@@ -1,5 +1,7 @@
 from typing import Tuple
 import pygame
+from FontRegistry import FontRegistry
+from TextRenderCache import TextRenderCache
 from colors import BLACK
 
 
@@ -7,6 +9,9 @@ class Text:
     """Represents a text object in pygame
     """
 
+    renderCache = TextRenderCache()
+    """The rendered strings shared by every text"""
+
     def __init__(self, pos: Tuple[int, int], font: str, fontSize: int, txt: str, color: Tuple[int, int, int]):
         """Initializes the text object
 
@@ -18,11 +23,14 @@ class Text:
                 color (Tuple[int, int, int]): The color of the text
         """
 
-        self.font = pygame.font.Font(font, fontSize)
-        """The font object used to style the text"""
+        self.fontName = font
+        """The path to the font file"""
 
-        self.display = self.font.render(txt, True, color)
-        """The surface that gets displayed"""
+        self.fontSize = fontSize
+        """The size of the font"""
+
+        self.font = FontRegistry.get(font, fontSize)
+        """The font object used to style the text"""
 
         self.pos = pos
         """The position of the text"""
@@ -30,6 +38,9 @@ class Text:
         self.color = color
         """The color of the text"""
 
+        self.display = self.renderText(txt)
+        """The surface that gets displayed"""
+
         self.rect = self.display.get_rect(center=(pos[0], pos[1]))
         """The Rect used for positioning"""
         
@@ -43,14 +54,35 @@ class Text:
     @text.setter
     def text(self, value: str):
         self._text = value
-        self.display = self.font.render(self._text, True, self.color)
+        self.display = self.renderText(self._text)
         self.rect = self.display.get_rect(center=(self.pos[0], self.pos[1]))
 
     def addText(self, value: str):
         self._text += value
-        self.display = self.font.render(self._text, True, self.color)
+        self.display = self.renderText(self._text)
         self.rect.size = self.display.get_size()
     def changeText(self, value: str):
         self._text = value
-        self.display = self.font.render(self._text, True, self.color)
+        self.display = self.renderText(self._text)
         self.rect.size = self.display.get_size()
+
+    def resize(self, fontSize: int):
+        """Changes the size of the font, keeping the text centered on its position
+
+        Args:
+            fontSize (int): The size of the font
+        """
+        self.fontSize = fontSize
+        self.font = FontRegistry.get(self.fontName, fontSize)
+        self.text = self._text
+
+    def renderText(self, value: str) -> pygame.Surface:
+        """Renders a string with the font and color of the text
+
+        Args:
+            value (str): The string to render
+
+        Returns:
+            pygame.Surface: The rendered string
+        """
+        return self.renderCache.render(self.font, self.fontName, self.fontSize, value, self.color)
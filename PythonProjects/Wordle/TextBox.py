@@ -7,6 +7,7 @@ from typing import Tuple
 import pygame
 from pygame.locals import *
 from Cursor import Cursor
+from HitIndex import HitIndex
 from Style import Style
 from Surface import Surface
 
@@ -44,10 +45,26 @@ class TextBox:
 
         self.cursor = Cursor(self.style.text, self.style.text.color)
         """The cursor that blinks"""
+
+        self.dirty = True
+        """Whether the text box looked different the last time it was rendered"""
+
+        self.lastState = None
+        """What the text box looked like the last time it was rendered"""
         
     def render(self):
         """Renders the textBox"""
 
+        # check to see if the text box looks different than last time
+        cursor = (self.cursor.isVisible(), tuple(self.cursor.rect.topleft)) if self.isSelected else None
+        state = (self.isSelected, self.style.text.text if self.style.text != None else None, cursor)
+        self.dirty = state != self.lastState
+        self.lastState = state
+
+        # the surface still has the last drawing when nothing changed
+        if (not self.dirty):
+            return
+
         # clear the surface
         self.surface.clear()
 
@@ -62,12 +79,11 @@ class TextBox:
                 pygame.draw.rect(self.surface.display, self.selectedStyle.borderColor, 
                                     self.rect, self.selectedStyle.borderWidth, self.selectedStyle.borderRadius)
             if (self.style.text != None):
-                text = self.style.text.text
+                display = self.style.text.display
                 if (self.hidden):
-                    self.style.text.changeText("•" * len(text))
+                    display = self.style.text.renderText("•" * len(self.style.text.text))
                 # renders the text on the screen
-                self.surface.display.blit(self.style.text.display, self.style.text.rect)
-                self.style.text.changeText(text)
+                self.surface.display.blit(display, self.style.text.rect.topleft)
 
             # render the cursor
             self.cursor.render(self.surface.display)
@@ -83,12 +99,11 @@ class TextBox:
                  self.rect, self.style.borderWidth, self.style.borderRadius)
 
             if (self.style.text != None):
-                text = self.style.text.text
+                display = self.style.text.display
                 if (self.hidden):
-                    self.style.text.changeText("•" * len(text))
+                    display = self.style.text.renderText("•" * len(self.style.text.text))
                 # renders the text on the screen
-                self.surface.display.blit(self.style.text.display, self.style.text.rect)
-                self.style.text.changeText(text)
+                self.surface.display.blit(display, self.style.text.rect.topleft)
 
     def insert(self, char: str):
         """Inserts a character into the text box
@@ -135,3 +150,22 @@ class TextBox:
 
         self.isSelected = False
         return False
+
+    def nextChange(self) -> float:
+        """Determines how long the text box looks the same when nothing is typed
+
+        Returns:
+            float: The seconds until the cursor blinks or None if the text box isn't selected
+        """
+        if (self.isSelected):
+            return self.cursor.nextBlink()
+        return None
+
+    def register(self, index: HitIndex, offset: Tuple[int, int]=(0, 0)):
+        """Adds the text box to a screen's hit index so clicks on it can be found
+
+        Args:
+            index (HitIndex): The hit index of the screen
+            offset (Tuple[int, int], optional): The position of the surface the text box is on. Defaults to (0, 0).
+        """
+        index.add(self, (self.surface.pos[0] + offset[0], self.surface.pos[1] + offset[1]), self.surface.size)
@@ -0,0 +1,90 @@
+from collections import OrderedDict
+from typing import Tuple
+import pygame
+
+
+class TextRenderCache:
+	"""Keeps the most recently rendered strings so the same string is only rendered once
+
+	The surfaces are shared between everything that renders the same string, so they should not be drawn on.
+	"""
+	def __init__(self, capacity: int=512):
+		"""Initializes the TextRenderCache
+
+		Args:
+			capacity (int, optional): The most rendered strings to keep. Defaults to 512.
+		"""
+		self.capacity = capacity
+		"""The most rendered strings to keep"""
+
+		self.surfaces = OrderedDict()
+		"""The rendered strings from least to most recently used. surfaces[(font, fontSize, text, color, antialias)] = surface"""
+
+		self.hits = 0
+		"""The number of times a string was already rendered"""
+
+		self.misses = 0
+		"""The number of times a string had to be rendered"""
+
+		self.evictions = 0
+		"""The number of rendered strings that were thrown out to make room"""
+
+	def render(self, font: pygame.font.Font, fontName: str, fontSize: int, text: str, color: Tuple[int, int, int], antialias: bool=True) -> pygame.Surface:
+		"""Returns the rendered string, rendering it if it isn't in the cache
+
+		Args:
+			font (pygame.font.Font): The font object used to render the string
+			fontName (str): The path to the font file
+			fontSize (int): The size of the font
+			text (str): The string to render
+			color (Tuple[int, int, int]): The color of the string
+			antialias (bool, optional): Whether the string has smooth edges. Defaults to True.
+
+		Returns:
+			pygame.Surface: The rendered string
+		"""
+		key = (fontName, fontSize, text, tuple(color), antialias)
+		surface = self.surfaces.get(key)
+
+		if (surface != None):
+			self.hits += 1
+			self.surfaces.move_to_end(key)
+			return surface
+
+		self.misses += 1
+		surface = font.render(text, antialias, color)
+		self.surfaces[key] = surface
+
+		# throw out the least recently used strings
+		while (len(self.surfaces) > self.capacity):
+			self.surfaces.popitem(last=False)
+			self.evictions += 1
+
+		return surface
+
+	def resize(self, capacity: int):
+		"""Changes the most rendered strings to keep
+
+		Args:
+			capacity (int): The most rendered strings to keep
+		"""
+		self.capacity = capacity
+		while (len(self.surfaces) > self.capacity):
+			self.surfaces.popitem(last=False)
+			self.evictions += 1
+
+	def stats(self) -> dict[str, int]:
+		"""Returns how well the cache is doing
+
+		Returns:
+			dict[str, int]: The number of hits, misses, evictions, cached strings and the capacity
+		"""
+		return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+				"size": len(self.surfaces), "capacity": self.capacity}
+
+	def clear(self):
+		"""Throws out all of the rendered strings and resets the counters"""
+		self.surfaces.clear()
+		self.hits = 0
+		self.misses = 0
+		self.evictions = 0
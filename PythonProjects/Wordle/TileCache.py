@@ -0,0 +1,64 @@
+from typing import Tuple
+import pygame
+from Button import Button
+from Style import Style
+from Surface import Surface
+from Text import Text
+from colors import WHITE
+
+
+class TileCache:
+	"""Renders each board tile once and reuses the finished surface on later frames
+	"""
+	def __init__(self, size: float, font: str, fontSize: int, backgroundColor: Tuple[int, int, int]):
+		"""Initializes the TileCache
+
+		Args:
+			size (float): The width and height of a tile
+			font (str): The font the letters on the tiles are
+			fontSize (int): The size of the font
+			backgroundColor (Tuple[int, int, int]): The background color behind the rounded corners of a tile
+		"""
+		self.size = size
+		"""The width and height of a tile"""
+
+		self.font = font
+		"""The font the letters on the tiles are"""
+
+		self.fontSize = fontSize
+		"""The size of the font"""
+
+		self.backgroundColor = backgroundColor
+		"""The background color behind the rounded corners of a tile"""
+
+		self.tiles = {}
+		"""The rendered tiles. tiles[(letter, fillColor, textColor)] = surface"""
+
+	def get(self, letter: str, fillColor: Tuple[int, int, int], textColor: Tuple[int, int, int]=WHITE) -> pygame.Surface:
+		"""Returns the rendered tile, rendering it the first time it is asked for
+
+		Args:
+			letter (str): The letter on the tile
+			fillColor (Tuple[int, int, int]): The fill color of the tile
+			textColor (Tuple[int, int, int], optional): The color of the letter. Defaults to WHITE.
+
+		Returns:
+			pygame.Surface: The rendered tile
+		"""
+		key = (letter, fillColor, textColor)
+		tile = self.tiles.get(key)
+
+		# render the tile the first time it is used
+		if (tile == None):
+			box = Button(Surface((0, 0), (self.size, self.size), self.backgroundColor),
+						Style(Text((self.size / 2, self.size / 2), self.font, self.fontSize, letter, textColor),
+						borderColor=WHITE, borderRadius=5, fillColor=fillColor))
+			box.render()
+			tile = box.surface.display
+			self.tiles[key] = tile
+
+		return tile
+
+	def clear(self):
+		"""Removes all of the rendered tiles"""
+		self.tiles.clear()
@@ -0,0 +1,103 @@
+from typing import Callable
+import pygame
+from Animation import Animation
+
+
+class Timeline:
+	"""Runs the animations and delays of a screen on the frame clock
+
+	The SceneManager updates the timeline once a frame, so nothing waits by blocking the loop
+	and the screen keeps handling input while an animation plays.
+	"""
+	def __init__(self, clock: Callable[[], int]=pygame.time.get_ticks):
+		"""Initializes the Timeline
+
+		Args:
+			clock (Callable[[], int], optional): Returns the time in milliseconds. Defaults to pygame.time.get_ticks.
+		"""
+		self.clock = clock
+		"""Returns the time in milliseconds"""
+
+		self.animations = []
+		"""The animations that haven't ended yet"""
+
+	def add(self, duration: float, onUpdate: Callable[[float], None]=None, onDone: Callable[[], None]=None, delay: float=0) -> Animation:
+		"""Adds an animation that starts after a delay
+
+		Args:
+			duration (float): How many seconds the animation lasts
+			onUpdate (Callable[[float], None], optional): Called every frame while the animation runs with how far through it is, from 0 to 1. Defaults to None.
+			onDone (Callable[[], None], optional): Called once the animation ends. Defaults to None.
+			delay (float, optional): How many seconds to wait before it starts. Defaults to 0.
+
+		Returns:
+			Animation: The animation, so it can be cancelled
+		"""
+		animation = Animation(self.clock() + round(delay * 1000), round(duration * 1000), onUpdate, onDone)
+		self.animations.append(animation)
+		return animation
+
+	def after(self, delay: float, callback: Callable[[], None]) -> Animation:
+		"""Calls a function after a delay
+
+		Args:
+			delay (float): How many seconds to wait
+			callback (Callable[[], None]): The function to call
+
+		Returns:
+			Animation: The delay, so it can be cancelled
+		"""
+		return self.add(delay, onDone=callback)
+
+	def cancel(self, animation: Animation):
+		"""Stops an animation without calling onDone
+
+		Args:
+			animation (Animation): The animation to stop. Nothing happens if it is None or already ended
+		"""
+		if (animation != None and not animation.done):
+			animation.done = True
+			self.animations.remove(animation)
+
+	def clear(self):
+		"""Stops every animation"""
+		for animation in self.animations:
+			animation.done = True
+		self.animations.clear()
+
+	def update(self):
+		"""Moves every animation that started to the current time and ends the ones that finished"""
+		now = self.clock()
+
+		# the callbacks can add animations so go through a copy
+		for animation in list(self.animations):
+			if (animation.done or now < animation.start):
+				continue
+
+			progress = animation.progress(now)
+			if (animation.onUpdate != None):
+				animation.onUpdate(progress)
+
+			if (progress >= 1):
+				animation.done = True
+				self.animations.remove(animation)
+				if (animation.onDone != None):
+					animation.onDone()
+
+	def nextChange(self) -> float:
+		"""Determines how long until an animation needs a frame
+
+		Returns:
+			float: The seconds until an animation starts or ends, 0 while one is playing, or None if there are none
+		"""
+		if (not self.animations):
+			return None
+
+		now = self.clock()
+		times = []
+		for animation in self.animations:
+			# an animation that is playing changes every frame
+			if (animation.onUpdate != None and animation.start <= now):
+				return 0
+			times.append(animation.start if animation.onUpdate != None else animation.end)
+		return max(0, (min(times) - now) / 1000)
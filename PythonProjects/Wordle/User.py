@@ -1,6 +1,6 @@
 
 class User:
-    def __init__(self, username: str, password: str, gamesWon: int = 0, gamesLost: int = 0):
+    def __init__(self, username: str, password: str, gamesWon: int = 0, gamesLost: int = 0, distribution: list[int] = None, currentStreak: int = 0, maxStreak: int = 0):
         """Creates a new User
 
         Args:
@@ -8,6 +8,9 @@ class User:
             password (str): The password for the user
             gamesWon (int): The number of games the user has won
             gamesLost (int): The number of games the user has lost
+            distribution (list[int]): The number of games the user has won with each number of guesses
+            currentStreak (int): The number of games in a row the user has won
+            maxStreak (int): The most games in a row the user has won
         """
         self.username = username
         """The username the user has"""
@@ -23,14 +26,59 @@ class User:
         self.winPercent = 100 * gamesWon // 1 if self.played == 0 else self.played
         """The percentage of games the user has won"""
 
-    def win(self):
-        """Increments the number of times the player has won"""
+        self.distribution = list(distribution) if distribution != None else [0] * 6
+        """The number of games the user has won with each number of guesses. distribution[guesses - 1] = games"""
+        self.currentStreak = currentStreak
+        """The number of games in a row the user has won"""
+        self.maxStreak = maxStreak
+        """The most games in a row the user has won"""
+
+    @classmethod
+    def fromDocument(cls, document: dict) -> "User":
+        """Creates a User from their document in the database
+
+        Args:
+            document (dict): The user's document
+
+        Returns:
+            User: The user
+        """
+        user = cls(document['username'], document['password'], document['gamesWon'], document['gamesLost'],
+                   document.get('distribution'), document.get('currentStreak', 0), document.get('maxStreak', 0))
+        user.winPercent = document.get('winPercent', user.winPercent)
+        return user
+
+    def toDocument(self) -> dict:
+        """Returns the user's document for the database
+
+        Returns:
+            dict: The user's document
+        """
+        return {'username': self.username, 'password': self.password, 'winPercent': self.winPercent, 'played': self.played,
+                'gamesWon': self.gamesWon, 'gamesLost': self.gamesLost, 'distribution': list(self.distribution),
+                'currentStreak': self.currentStreak, 'maxStreak': self.maxStreak}
+
+    def win(self, guesses: int = None):
+        """Increments the number of times the player has won
+
+        Args:
+            guesses (int): The number of guesses it took to win
+        """
         self.played += 1
         self.gamesWon += 1
         self.winPercent = 100 * self.gamesWon // self.played
 
+        if guesses != None:
+            # make room for games with more guesses than usual
+            while len(self.distribution) < guesses:
+                self.distribution.append(0)
+            self.distribution[guesses - 1] += 1
+        self.currentStreak += 1
+        self.maxStreak = max(self.maxStreak, self.currentStreak)
+
     def lose(self):
         """Increments the number of times the player has lost"""
         self.played += 1
         self.gamesLost += 1
         self.winPercent = 100 * self.gamesWon // self.played
+        self.currentStreak = 0
@@ -0,0 +1,259 @@
+import json
+import os
+import threading
+from typing import Callable
+from tinydb import TinyDB
+from UserStore import UserStore
+
+
+class UserRepository(UserStore):
+	"""The users stored in a TinyDB database with an index on their usernames
+
+	TinyDB reads and searches the whole file for every query, so the users are read once into a dictionary
+	keyed by username the first time one is looked up. Every write goes through the repository to keep it up to date.
+
+	TinyDB also rewrites the whole file for every write, so the history of finished games, which only grows, isn't kept in it.
+	Each game is appended to a history file as one line instead. The running stats of the words stay in the database
+	since there is at most one row for each word.
+	"""
+	def __init__(self, db: TinyDB, historyPath: str=None):
+		"""Initializes the UserRepository
+
+		Args:
+			db (TinyDB): The database the users are stored in
+			historyPath (str, optional): The file the history of finished games is appended to. Defaults to None to keep it in memory.
+		"""
+		self.db = db
+		"""The database the users are stored in"""
+
+		self.lock = threading.RLock()
+		"""Held while the database or the index is used"""
+
+		self.index = None
+		"""The users keyed by their username. None until it is first needed"""
+
+		self.historyPath = historyPath
+		"""The file the history of finished games is appended to. None keeps it in memory"""
+
+		self.history = []
+		"""The history of finished games when it is kept in memory"""
+
+		self.historyFile = None
+		"""The history file opened for appending. None until a game is added"""
+
+		# the journal sends a batch again if it stopped before the users were written, so remember where the history ends
+		self.lastSequence = self.readLastSequence()
+		"""The sequence number of the last journal result in the history"""
+
+	def readHistory(self) -> list[dict]:
+		"""Reads every finished game in the history, skipping a line that was only partly written
+
+		Returns:
+			list[dict]: The games in the order they were added
+		"""
+		if (self.historyPath == None):
+			return [dict(game) for game in self.history]
+
+		games = []
+		try:
+			with open(self.historyPath) as file:
+				for line in file:
+					try:
+						games.append(json.loads(line))
+					except ValueError:
+						pass
+		except OSError:
+			pass
+		return games
+
+	def readLastSequence(self) -> int:
+		"""Reads the sequence number of the last game in the history file without reading all of it
+
+		Returns:
+			int: The sequence number or 0 if there aren't any games
+		"""
+		if (self.historyPath == None):
+			return 0
+
+		try:
+			with open(self.historyPath, "rb") as file:
+				file.seek(0, os.SEEK_END)
+				file.seek(max(0, file.tell() - 4096))
+				lines = file.read().splitlines()
+		except OSError:
+			return 0
+
+		# the last line may have only been partly written
+		for line in reversed(lines):
+			try:
+				return json.loads(line).get('sequence', 0)
+			except ValueError:
+				pass
+		return 0
+
+	def appendHistory(self, games: list[dict]):
+		"""Appends finished games to the history, skipping the journal results that are already in it
+
+		Args:
+			games (list[dict]): The games in the order they were finished
+		"""
+		games = [dict(game) for game in games if game.get('sequence', self.lastSequence + 1) > self.lastSequence]
+		if (not games):
+			return
+		self.lastSequence = max(self.lastSequence, max(game.get('sequence', 0) for game in games))
+
+		if (self.historyPath == None):
+			self.history.extend(games)
+			return
+
+		if (self.historyFile == None):
+			self.historyFile = open(self.historyPath, "a+")
+			# start on a new line if the last one was only partly written
+			if (self.historyFile.tell() > 0):
+				self.historyFile.seek(self.historyFile.tell() - 1)
+				if (self.historyFile.read(1) != "\n"):
+					self.historyFile.write("\n")
+		self.historyFile.write("".join(json.dumps(game) + "\n" for game in games))
+		self.historyFile.flush()
+
+	def buildIndex(self):
+		"""Reads every user into the index"""
+		with self.lock:
+			self.index = {user['username']: dict(user) for user in self.db.all()}
+
+	def find(self, username: str) -> dict:
+		"""Finds a user by their username
+
+		Args:
+			username (str): The username of the user
+
+		Returns:
+			dict: A copy of the user's document or None if there isn't a user with the username
+		"""
+		with self.lock:
+			if (self.index == None):
+				self.buildIndex()
+			user = self.index.get(username)
+			return dict(user) if user != None else None
+
+	def exists(self, username: str) -> bool:
+		"""Determines whether a username is taken
+
+		Args:
+			username (str): The username to check
+
+		Returns:
+			bool: Whether there is a user with the username
+		"""
+		with self.lock:
+			if (self.index == None):
+				self.buildIndex()
+			return username in self.index
+
+	def insert(self, user: dict):
+		"""Adds a new user
+
+		Args:
+			user (dict): The user's document
+
+		Raises:
+			ValueError: If the username is already taken
+		"""
+		with self.lock:
+			if (self.exists(user['username'])):
+				raise ValueError(f"{user['username']} is already taken")
+			self.db.insert(user)
+			self.index[user['username']] = dict(user)
+
+	def updateMany(self, changes: dict[str, Callable[[dict], None]], metadata: dict=None, games: list[dict]=None,
+					wordChanges: dict[str, Callable[[dict], None]]=None):
+		"""Changes some of the users with one write to the database
+
+		Args:
+			changes (dict[str, Callable[[dict], None]]): The function that changes each user's document. changes[username] = function
+			metadata (dict, optional): Values to store with the users in the same write. Defaults to None.
+			games (list[dict], optional): History rows to append to the history file before the write. Defaults to None.
+			wordChanges (dict[str, Callable[[dict], None]], optional): The function that changes the stats of each word in the same write. Defaults to None.
+		"""
+		with self.lock:
+			if (self.index == None):
+				self.buildIndex()
+
+			# the games go first so a batch that is sent again skips them instead of losing them
+			if (games):
+				self.appendHistory(games)
+
+			# every table op of TinyDB rewrites the whole file, so the users, the words and the metadata
+			# are changed in the raw storage instead to write them all at once
+			state = self.db.storage.read() or {}
+			for user in state.get(self.db.default_table_name, {}).values():
+				change = changes.get(user.get('username'))
+				if (change != None):
+					change(user)
+					change(self.index[user['username']])
+			if (metadata != None):
+				state['metadata'] = {'1': {**state.get('metadata', {}).get('1', {}), **metadata}}
+
+			if (wordChanges):
+				table = state.setdefault('words', {})
+				words = {stats['word']: stats for stats in table.values()}
+				nextId = max(map(int, table), default=0) + 1
+				for word, change in wordChanges.items():
+					if (word not in words):
+						words[word] = table[str(nextId)] = {'word': word, 'plays': 0, 'wins': 0, 'guesses': 0}
+						nextId += 1
+					change(words[word])
+
+			self.db.storage.write(state)
+			self.db.clear_cache()
+
+	def games(self, username: str=None) -> list[dict]:
+		"""Returns the history of finished games
+
+		Args:
+			username (str, optional): Only return the games of this user. Defaults to None for every game.
+
+		Returns:
+			list[dict]: The games in the order they were added. Each has a username, word, guesses, seconds, result and finished
+		"""
+		with self.lock:
+			games = self.readHistory()
+		return [{key: value for key, value in game.items() if key != 'sequence'} for game in games if username == None or game['username'] == username]
+
+	def wordStats(self) -> dict[str, dict]:
+		"""Returns the running stats of every secret word that has been played
+
+		Returns:
+			dict[str, dict]: The plays, wins and total guesses of the wins for each word. wordStats()[word] = stats
+		"""
+		with self.lock:
+			words = self.db.table('words').all()
+		return {stats['word']: {key: stats[key] for key in ('plays', 'wins', 'guesses')} for stats in words}
+
+	def metadata(self) -> dict:
+		"""Returns the values stored with the users
+
+		Returns:
+			dict: The values written by updateMany
+		"""
+		with self.lock:
+			metadata = self.db.table('metadata').get(doc_id=1)
+		return dict(metadata) if metadata != None else {}
+
+	def all(self) -> list[dict]:
+		"""Returns every user
+
+		Returns:
+			list[dict]: A copy of every user's document
+		"""
+		with self.lock:
+			if (self.index == None):
+				self.buildIndex()
+			return [dict(user) for user in self.index.values()]
+
+	def close(self):
+		"""Closes the database and the history file"""
+		with self.lock:
+			if (self.historyFile != None):
+				self.historyFile.close()
+			self.db.close()
@@ -0,0 +1,96 @@
+from abc import ABC, abstractmethod
+from typing import Callable
+
+
+class UserStore(ABC):
+	"""Where the users are stored
+
+	Each user is a document with a username, password, winPercent, played, gamesWon, gamesLost,
+	distribution, currentStreak and maxStreak. Next to the users are a history row for every finished game
+	and the running stats of every secret word. The storage backends implement every method.
+	"""
+
+	@abstractmethod
+	def find(self, username: str) -> dict:
+		"""Finds a user by their username
+
+		Args:
+			username (str): The username of the user
+
+		Returns:
+			dict: A copy of the user's document or None if there isn't a user with the username
+		"""
+
+	@abstractmethod
+	def exists(self, username: str) -> bool:
+		"""Determines whether a username is taken
+
+		Args:
+			username (str): The username to check
+
+		Returns:
+			bool: Whether there is a user with the username
+		"""
+
+	@abstractmethod
+	def insert(self, user: dict):
+		"""Adds a new user
+
+		Args:
+			user (dict): The user's document
+
+		Raises:
+			ValueError: If the username is already taken
+		"""
+
+	@abstractmethod
+	def updateMany(self, changes: dict[str, Callable[[dict], None]], metadata: dict=None, games: list[dict]=None,
+					wordChanges: dict[str, Callable[[dict], None]]=None):
+		"""Changes some of the users all at once
+
+		Args:
+			changes (dict[str, Callable[[dict], None]]): The function that changes each user's document. changes[username] = function
+			metadata (dict, optional): Values to store with the users in the same write. Defaults to None.
+			games (list[dict], optional): History rows to add in the same write. A row from the journal keeps its sequence number
+				so a store that can't add it in the same write can tell whether it was already added. Defaults to None.
+			wordChanges (dict[str, Callable[[dict], None]], optional): The function that changes the stats of each word. Defaults to None.
+		"""
+
+	@abstractmethod
+	def games(self, username: str=None) -> list[dict]:
+		"""Returns the history of finished games
+
+		Args:
+			username (str, optional): Only return the games of this user. Defaults to None for every game.
+
+		Returns:
+			list[dict]: The games in the order they were added. Each has a username, word, guesses, seconds, result and finished
+		"""
+
+	@abstractmethod
+	def wordStats(self) -> dict[str, dict]:
+		"""Returns the running stats of every secret word that has been played
+
+		Returns:
+			dict[str, dict]: The plays, wins and total guesses of the wins for each word. wordStats()[word] = stats
+		"""
+
+	@abstractmethod
+	def metadata(self) -> dict:
+		"""Returns the values stored with the users
+
+		Returns:
+			dict: The values written by updateMany
+		"""
+
+	@abstractmethod
+	def all(self) -> list[dict]:
+		"""Returns every user
+
+		Returns:
+			list[dict]: A copy of every user's document
+		"""
+
+	@abstractmethod
+	def close(self):
+		"""Closes the store"""
@@ -6,13 +6,14 @@ from Screen import Screen
 class Window(Screen):
 	"""A window used for rendering content
 	"""
-	def __init__(self, size: Tuple[int, int], caption: str, backgroundColor: Tuple[int, int, int]):
+	def __init__(self, size: Tuple[int, int], caption: str, backgroundColor: Tuple[int, int, int], dirtyRects: bool=False):
 		"""Initializes the window
 
 		Args:
 			size (Tuple[int, int]): The size of the screen - size[0] being the width and size[1] being the height
 			caption (str): The caption to display on the window
 			backgroundColor (Tuple[int, int, int]): The background color for the window
+			dirtyRects (bool, optional): Whether only the regions that changed get updated. Defaults to False.
 		"""
 		Screen.__init__(self, size)
 		self.display = pygame.display.set_mode(self.size)
@@ -24,9 +25,58 @@ class Window(Screen):
 		self.backgroundColor = backgroundColor
 		"""The background color for the window"""
 
+		self.dirtyRects = dirtyRects
+		"""Whether only the regions that changed get updated"""
+
+		self.dirty = []
+		"""The regions of the window that changed since the last update"""
+
+		self.fullUpdate = True
+		"""Whether the whole window has to be updated next time"""
+
 		pygame.display.update()
 
 	def clear(self):
 		"""Clears the window
 		"""
-		self.display.fill(self.backgroundColor)
\ No newline at end of file
+		self.display.fill(self.backgroundColor)
+
+	def markDirty(self, rect: Rect):
+		"""Marks a region of the window that changed so it gets updated
+
+		Args:
+			rect (Rect): The region of the window that changed
+		"""
+		self.dirty.append(rect)
+
+	def invalidate(self):
+		"""Makes the whole window get updated next time"""
+		self.fullUpdate = True
+
+	@property
+	def redrawAll(self) -> bool:
+		"""Whether the scene has to draw all of its screen this frame instead of only the widgets that changed"""
+		return not self.dirtyRects or self.fullUpdate
+
+	def blitScreen(self, display: pygame.Surface):
+		"""Copies the screen of a scene onto the window, only where it changed unless all of it was drawn
+
+		Args:
+			display (pygame.Surface): The screen of the scene, the same size as the window
+		"""
+		if (self.redrawAll):
+			self.display.blit(display, (0, 0))
+		else:
+			for rect in self.dirty:
+				self.display.blit(display, rect, rect)
+
+	def update(self):
+		"""Updates the window with what has been drawn on it
+		"""
+		if (not self.dirtyRects or self.fullUpdate):
+			pygame.display.update()
+		elif (self.dirty):
+			pygame.display.update(self.dirty)
+
+		self.dirty = []
+		self.fullUpdate = False
@@ -0,0 +1,357 @@
+import argparse
+import mmap
+import os
+import random
+import struct
+import zlib
+from string import ascii_lowercase
+from typing import Iterable, Iterator
+
+
+class WordIndex:
+	"""The accepted words packed into one block of letters with bitmasks for searching them
+
+	Every word is stored as wordLength bytes in one sorted block instead of as its own string.
+	Word i is bit i of every bitmask, so a pattern query is a handful of big integer ANDs.
+	"""
+
+	magic = b"WDIX"
+	"""The first bytes of a compiled word index file"""
+	version = 1
+	"""The version of the compiled word index file format"""
+	header = struct.Struct("<4sHHII")
+	"""The header of a compiled word index file: magic, version, word length, number of words and the crc32 of the words"""
+	def __init__(self, words: Iterable[str], wordLength: int=5):
+		"""Initializes the WordIndex
+
+		Args:
+			words (Iterable[str]): The words to index. Words that aren't wordLength letters from a to z are left out
+			wordLength (int, optional): The number of letters in every word. Defaults to 5.
+		"""
+		self.wordLength = wordLength
+		"""The number of letters in every word"""
+
+		packed = set()
+		for word in words:
+			word = word.strip().lower()
+			if (len(word) == wordLength and all("a" <= letter <= "z" for letter in word)):
+				packed.add(word.encode("ascii"))
+
+		self.codes = b"".join(sorted(packed))
+		"""The sorted words packed together. Word i is codes[i * wordLength:(i + 1) * wordLength]"""
+
+		self.wordCount = len(packed)
+		"""The number of words in the index"""
+
+		self.positionMasks = None
+		"""positionMasks[position][letter] = the words that have the letter at the position. Built on the first search"""
+
+		self.letterMasks = None
+		"""letterMasks[letter] = the words that have the letter anywhere. Built on the first search"""
+
+	@classmethod
+	def fromFile(cls, path: str, wordLength: int=5) -> "WordIndex":
+		"""Creates a WordIndex from a text file with one word on each line
+
+		Args:
+			path (str): The path to the word list
+			wordLength (int, optional): The number of letters in every word. Defaults to 5.
+
+		Returns:
+			WordIndex: The index of the words in the file
+		"""
+		with open(path) as file:
+			return cls(file, wordLength)
+
+	@classmethod
+	def fromCodes(cls, codes: bytes, wordLength: int) -> "WordIndex":
+		"""Creates a WordIndex from words that are already sorted and packed together
+
+		Args:
+			codes (bytes): The sorted words packed together. Anything that can be sliced into bytes like an mmap works
+			wordLength (int): The number of letters in every word
+
+		Returns:
+			WordIndex: The index of the packed words
+		"""
+		index = cls([], wordLength)
+		index.codes = codes
+		index.wordCount = len(codes) // wordLength
+		return index
+
+	@classmethod
+	def load(cls, path: str) -> "WordIndex":
+		"""Memory maps a compiled word index file
+
+		Args:
+			path (str): The path to the compiled file
+
+		Raises:
+			ValueError: If the file isn't a compiled word index or its words don't match the checksum
+
+		Returns:
+			WordIndex: The index of the words in the file
+		"""
+		with open(path, "rb") as file:
+			data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+		try:
+			if (len(data) < cls.header.size):
+				raise ValueError(f"{path} is too short to be a word index")
+
+			magic, version, wordLength, wordCount, checksum = cls.header.unpack_from(data)
+			if (magic != cls.magic or version != cls.version):
+				raise ValueError(f"{path} is not a version {cls.version} word index")
+			if (wordLength == 0 or len(data) != cls.header.size + wordLength * wordCount):
+				raise ValueError(f"{path} has the wrong size for {wordCount} words")
+
+			with memoryview(data) as view:
+				if (zlib.crc32(view[cls.header.size:]) != checksum):
+					raise ValueError(f"{path} failed its checksum")
+		except ValueError:
+			# a broken file is read from the text list instead so let go of its map
+			data.close()
+			raise
+
+		return cls.fromCodes(MappedCodes(data, cls.header.size), wordLength)
+
+	@classmethod
+	def open(cls, path: str, wordLength: int=5) -> "WordIndex":
+		"""Loads a word list, using its compiled file next to it when it is up to date
+
+		The compiled file has the same name as the word list with a .bin extension.
+		If it is missing, stale or broken the text file is read instead and compiled for next time.
+
+		Args:
+			path (str): The path to the text word list
+			wordLength (int, optional): The number of letters in every word. Defaults to 5.
+
+		Returns:
+			WordIndex: The index of the words in the list
+		"""
+		compiledPath = os.path.splitext(path)[0] + ".bin"
+
+		try:
+			if (os.path.getmtime(compiledPath) >= os.path.getmtime(path)):
+				index = cls.load(compiledPath)
+				if (index.wordLength == wordLength):
+					return index
+				index.codes.close()
+		except (OSError, ValueError):
+			pass
+
+		# fall back to the text file
+		index = cls.fromFile(path, wordLength)
+		try:
+			index.compile(compiledPath)
+		except OSError:
+			pass
+		return index
+
+	def compile(self, path: str):
+		"""Writes the index to a compiled file that can be memory mapped
+
+		Args:
+			path (str): The path to write the compiled file to
+		"""
+		codes = bytes(self.codes)
+		temporaryPath = path + ".tmp"
+		with open(temporaryPath, "wb") as file:
+			file.write(self.header.pack(self.magic, self.version, self.wordLength, self.wordCount, zlib.crc32(codes)))
+			file.write(codes)
+		os.replace(temporaryPath, path)
+
+	def __len__(self) -> int:
+		return self.wordCount
+
+	def __getitem__(self, index: int) -> str:
+		if (index < 0):
+			index += self.wordCount
+		if (not 0 <= index < self.wordCount):
+			raise IndexError("word index out of range")
+
+		return self.codes[index * self.wordLength:(index + 1) * self.wordLength].decode("ascii")
+
+	def __iter__(self) -> Iterator[str]:
+		for index in range(self.wordCount):
+			yield self[index]
+
+	def __contains__(self, word: str) -> bool:
+		return self.indexOf(word) != -1
+
+	def indexOf(self, word: str) -> int:
+		"""Finds where a word is in the index with a binary search
+
+		Args:
+			word (str): The word to find
+
+		Returns:
+			int: The index of the word or -1 if it isn't an accepted word
+		"""
+		if (len(word) != self.wordLength or not word.isascii()):
+			return -1
+
+		code = word.lower().encode("ascii")
+		low = 0
+		high = self.wordCount
+		while (low < high):
+			middle = (low + high) // 2
+			if (self.codes[middle * self.wordLength:(middle + 1) * self.wordLength] < code):
+				low = middle + 1
+			else:
+				high = middle
+
+		if (low < self.wordCount and self.codes[low * self.wordLength:(low + 1) * self.wordLength] == code):
+			return low
+		return -1
+
+	def choice(self, rng: random.Random=random) -> str:
+		"""Picks a random word
+
+		Args:
+			rng (random.Random, optional): The random number generator to use. Defaults to the random module.
+
+		Returns:
+			str: The random word
+		"""
+		return self[rng.randrange(self.wordCount)]
+
+	def buildMasks(self):
+		"""Builds the bitmasks used for searching the words"""
+		positionBits = [{letter: bytearray((self.wordCount + 7) // 8) for letter in ascii_lowercase} for _ in range(self.wordLength)]
+		letterBits = {letter: bytearray((self.wordCount + 7) // 8) for letter in ascii_lowercase}
+
+		# set bit i for every letter of word i
+		for index in range(self.wordCount):
+			byte = index >> 3
+			bit = 1 << (index & 7)
+			for position in range(self.wordLength):
+				letter = chr(self.codes[index * self.wordLength + position])
+				positionBits[position][letter][byte] |= bit
+				letterBits[letter][byte] |= bit
+
+		self.positionMasks = [{letter: int.from_bytes(bits, "little") for letter, bits in position.items()} for position in positionBits]
+		self.letterMasks = {letter: int.from_bytes(bits, "little") for letter, bits in letterBits.items()}
+
+	def mask(self, known: dict[int, str]=None, misplaced: dict[int, str]=None, contains: str="", excludes: str="") -> int:
+		"""Finds the words that match a pattern
+
+		Args:
+			known (dict[int, str], optional): The letters at known positions. known[position] = letter. Defaults to None.
+			misplaced (dict[int, str], optional): Letters that are in the word but not at the position. misplaced[position] = letters. Defaults to None.
+			contains (str, optional): Letters that have to be somewhere in the word. Defaults to "".
+			excludes (str, optional): Letters that can't be anywhere in the word. Defaults to "".
+
+		Returns:
+			int: A bitmask with bit i set if word i matches
+		"""
+		if (self.positionMasks == None):
+			self.buildMasks()
+
+		mask = (1 << self.wordCount) - 1
+
+		for position, letter in (known or {}).items():
+			mask &= self.positionMasks[position].get(letter.lower(), 0)
+
+		for position, letters in (misplaced or {}).items():
+			for letter in letters.lower():
+				mask &= self.letterMasks.get(letter, 0) & ~self.positionMasks[position].get(letter, 0)
+
+		for letter in contains.lower():
+			mask &= self.letterMasks.get(letter, 0)
+
+		for letter in excludes.lower():
+			mask &= ~self.letterMasks.get(letter, 0)
+
+		return mask
+
+	def match(self, known: dict[int, str]=None, misplaced: dict[int, str]=None, contains: str="", excludes: str="") -> list[str]:
+		"""Returns the words that match a pattern
+
+		Args:
+			known (dict[int, str], optional): The letters at known positions. known[position] = letter. Defaults to None.
+			misplaced (dict[int, str], optional): Letters that are in the word but not at the position. misplaced[position] = letters. Defaults to None.
+			contains (str, optional): Letters that have to be somewhere in the word. Defaults to "".
+			excludes (str, optional): Letters that can't be anywhere in the word. Defaults to "".
+
+		Returns:
+			list[str]: The matching words in sorted order
+		"""
+		return [self[index] for index in self.indices(self.mask(known, misplaced, contains, excludes))]
+
+	def count(self, known: dict[int, str]=None, misplaced: dict[int, str]=None, contains: str="", excludes: str="") -> int:
+		"""Counts the words that match a pattern without decoding them
+
+		Args:
+			known (dict[int, str], optional): The letters at known positions. known[position] = letter. Defaults to None.
+			misplaced (dict[int, str], optional): Letters that are in the word but not at the position. misplaced[position] = letters. Defaults to None.
+			contains (str, optional): Letters that have to be somewhere in the word. Defaults to "".
+			excludes (str, optional): Letters that can't be anywhere in the word. Defaults to "".
+
+		Returns:
+			int: The number of matching words
+		"""
+		return bin(self.mask(known, misplaced, contains, excludes)).count("1")
+
+	@staticmethod
+	def indices(mask: int) -> list[int]:
+		"""Returns the indices of the set bits of a bitmask
+
+		Args:
+			mask (int): The bitmask
+
+		Returns:
+			list[int]: The indices of the set bits from lowest to highest
+		"""
+		bits = bin(mask)[:1:-1]
+		indices = []
+		index = bits.find("1")
+		while (index != -1):
+			indices.append(index)
+			index = bits.find("1", index + 1)
+		return indices
+
+
+class MappedCodes:
+	"""The packed words of a memory mapped word index file without its header
+	"""
+	def __init__(self, data: mmap.mmap, offset: int):
+		"""Initializes the MappedCodes
+
+		Args:
+			data (mmap.mmap): The memory mapped file
+			offset (int): Where the words start in the file
+		"""
+		self.data = data
+		"""The memory mapped file"""
+
+		self.offset = offset
+		"""Where the words start in the file"""
+
+	def __len__(self) -> int:
+		return len(self.data) - self.offset
+
+	def __getitem__(self, index):
+		if (isinstance(index, slice)):
+			return self.data[self.offset + index.start:self.offset + index.stop]
+		return self.data[self.offset + index]
+
+	def __bytes__(self) -> bytes:
+		return self.data[self.offset:]
+
+	def close(self):
+		"""Unmaps the file"""
+		self.data.close()
+
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Compiles a word list into a word index file that can be memory mapped")
+	parser.add_argument("words", help="the text word list with one word on each line")
+	parser.add_argument("output", nargs="?", help="where to write the compiled file. Defaults to the word list with a .bin extension")
+	parser.add_argument("--length", type=int, default=5, help="the number of letters in every word")
+	arguments = parser.parse_args()
+
+	output = arguments.output or os.path.splitext(arguments.words)[0] + ".bin"
+	index = WordIndex.fromFile(arguments.words, arguments.length)
+	index.compile(output)
+	print(f"Compiled {len(index)} words into {output}")
@@ -1,17 +1,34 @@
-import random
+import argparse
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Tuple
 import pygame
 from pygame.locals import *
 from Alert import Alert
+from AlertPool import AlertPool
+from Feedback import Feedback
+from FrameProfiler import FrameProfiler
+from GameSession import GameSession
 from Text import Text
-from TextBox import TextBox
 from colors import *
 from Window import Window
 from Surface import Surface
-from Button import Button
-from tinydb import TinyDB, Query
-from Style import Style
+from Keyboard import Keyboard
+from LogInScene import LogInScene
+from PasswordHasher import PasswordHasher
+from PlayScene import PlayScene
+from SceneManager import SceneManager
+from SignUpScene import SignUpScene
+from tinydb import TinyDB
+from Solver import Solver
+from SQLiteUserStore import SQLiteUserStore
+from StartScene import StartScene
+from StatsJournal import StatsJournal
+from TileCache import TileCache
 from User import User
+from UserRepository import UserRepository
+from UserStore import UserStore
+from WordIndex import WordIndex
 
 
 
@@ -40,995 +57,224 @@ class Wordle:
 	"""The background color for the game window"""
 	clock = pygame.time.Clock()
 	"""The clock for the game to keep track of the time between each frame"""
+	dirtyRendering = False
+	"""Whether only the regions of the window that changed get updated each frame"""
+	profiling = False
+	"""Whether the stages of each frame are timed. F3 shows the timings on the window"""
+	profilePath = "profile.csv"
+	"""Where the timings of every frame are saved when profiling. A .csv file or a .json trace for chrome://tracing"""
 	font = "HelveticaNeueBold.ttf"
 	"""The font for the game"""
 
-	acceptedWords = set(map(str.strip, open('FiveLetterWords.txt')))
-	"""The accepted words for the game in a set"""
+	boardPadding = 40
+	"""The space between the edge of the window and the board"""
+	boardMargin = 8
+	"""The space between the tiles on the board"""
+	boxSize = (width - boardPadding * 2 - boardMargin * 4) / 5
+	"""The width and height of a tile on the board"""
 
-	acceptedWordsList = list(map(str.strip, open('FiveLetterWords.txt')))
-	"""THe accepted words for the game in a list"""
+	acceptedWords = WordIndex.open('FiveLetterWords.txt')
+	"""The accepted words for the game"""
 
-	db = TinyDB('db.json')
-	"""The database that stores all of the information of the users on"""
+	acceptedWordsList = acceptedWords
+	"""The accepted words for the game. The index is also a sequence so it is used for picking the secret word"""
+
+	userStores = {"tinydb": ("db.json", "db.journal"), "sqlite": ("db.sqlite3", "db.sqlite3.journal")}
+	"""The database and journal of each place the users can be stored. Picked with --store or the WORDLE_STORE environment variable"""
+	defaultStore = "tinydb"
+	"""Where the users are stored when neither --store nor WORDLE_STORE picks a place"""
 	user = User("", "")
 	"""The user that is playing the game"""
+	passwords = PasswordHasher.open('PasswordCost.json')
+	"""Hashes and checks the passwords with the cost picked by running PasswordHasher.py"""
+	passwordWorker = ThreadPoolExecutor(1)
+	"""The thread the passwords are hashed on so the screens keep rendering"""
+	solverWorker = ThreadPoolExecutor(1)
+	"""The thread the solver for hints is loaded on so the screens keep rendering"""
 
 
 
-	def __init__(self):
+	def __init__(self, users: UserStore=None, journalPath: str=None):
 		"""Initializes the Game
-		"""
-		# Initializes pygame and creates the window
-		pygame.init()
-		self.window = Window(self.size, self.caption, self.backgroundColor)
-
-	def Start(self):
-		"""Shows the start screen for the game
-		"""
-		# create the startScreen		
-		startScreen = Surface((0, 0), self.size, self.backgroundColor)
-
-		# Create the title for the startScreen
-		title = Text((self.width / 2, 100), self.font, 75, "WORDLE", WHITE)
 
-		# Create the Log in button for the startScreen
-		logInButton = Button(Surface((self.width/ 4 - 75 + 5, 550), (150, 50), self.backgroundColor),
-							Style(Text((75, 25), self.font, 25, "LOG IN", DENIM),
-							fillColor=self.backgroundColor, borderColor=DENIM, borderRadius=5),
-
-                    		hoverStyle=Style(Text((75, 25), self.font, 26, "LOG IN", WHITE),
-							fillColor=DENIM, borderColor=DENIM, borderRadius=5))
-
-		# Create the sign up button for the startScreen
-		signUpButton = Button(Surface((self.width * 3 / 4 - 75 - 5, 550), (150, 50), self.backgroundColor),
-								Style(Text((75, 25), self.font, 24, "SIGN UP", ORCHID),
-								fillColor=self.backgroundColor, borderColor=ORCHID, borderRadius=5),
-
-								hoverStyle=Style(Text((75, 25), self.font, 25, "SIGN UP", WHITE),
-								fillColor=ORCHID, borderColor=ORCHID, borderRadius=5))
-
-		while True:
-			# run at 60 fps
-			self.clock.tick(60)
-
-			# clear the screen
-			startScreen.clear()
+		Args:
+			users (UserStore, optional): The database that stores all of the information of the users. Defaults to None for the store picked by the WORDLE_STORE environment variable.
+			journalPath (str, optional): Where the results of the games are journaled. Needed when users is given, otherwise the journal of the picked store is used. Defaults to None.
 
-			# get the position of the mouse for later use
-			mousePos = pygame.mouse.get_pos()
+		Raises:
+			ValueError: If users is given without a journalPath
+		"""
+		if (users == None):
+			users, journalPath = self.openStore(os.environ.get("WORDLE_STORE", self.defaultStore))
+		elif (journalPath == None):
+			raise ValueError("a journalPath is needed for the results of the games when the users are given")
 
-			# loop through the events
-			for event in pygame.event.get():
+		self.users = users
+		"""The database that stores all of the information of the users on"""
 
-				# Check for QUIT event
-				if event.type == pygame.QUIT:
-					return
+		self.stats = StatsJournal(users, journalPath)
+		"""The users with the results of their games appended to a journal instead of rewriting the database"""
 
-				# Checks for the MOUSEDOWN event
-				if event.type == pygame.MOUSEBUTTONDOWN:
-					# if the mouse clicked the log in button
-					if (logInButton.mouseIsHovering(mousePos)):
-						self.LogIn()
-						return
+		# Initializes pygame and creates the window
+		pygame.init()
+		self.window = Window(self.size, self.caption, self.backgroundColor, self.dirtyRendering)
 
-					# if the mouse clicked the sign up button
-					elif (signUpButton.mouseIsHovering(mousePos)):
-						self.SignUp()
-						return
+		# the rendered board tiles shared by every game
+		self.tileCache = TileCache(self.boxSize, self.font, 25, self.backgroundColor)
 
-			# render the background rectangles
-			pygame.draw.rect(startScreen.display, TURQUOISE, (-20, -20, 300, 400), 2, 10)
-			pygame.draw.rect(startScreen.display, CYBERGRAPE, (205, 200, 500, 520), 2, 10)
-			pygame.draw.rect(startScreen.display, LIGHTGREEN, (-20, -20, 112, 600), 2, 10)
+		self.keyboard = Keyboard(self.size, 175, (5, 7), self.font, self.backgroundColor)
+		"""The keyboard shared by every game"""
 
+		self.alerts = AlertPool((self.width / 2 - 350 / 2, 80), (350, 100), (145, 50), self.font, self.backgroundColor)
+		"""The alerts for hints and the results of logging in or signing up"""
 
-			# render the title
-			startScreen.display.blit(title.display, title.rect)
+		self.notAWordAlert = Alert(Surface((self.width / 2 - 125, 40), (250, 75), self.backgroundColor),
+								Text((125, 75 / 2), self.font, 25, "Not in Word List", BLACK), closable=False)
+		"""The alert that shows for a moment when a guess isn't in the word list"""
 
+		self.solver = self.solverWorker.submit(Solver.open, self.acceptedWords)
+		"""Resolves to the solver used for hints. It starts loading in the background when the game starts"""
 
+		self.profiler = FrameProfiler(self.profiling, self.profilePath, font=self.font)
+		"""Times the stages of each frame"""
 
+		self.scenes = SceneManager(self.window, self.clock, {"Start": StartScene, "LogIn": LogInScene, "SignUp": SignUpScene, "Play": PlayScene},
+								profiler=self.profiler)
+		"""Runs the screens of the game one at a time"""
 
+	@classmethod
+	def openStore(cls, store: str) -> Tuple[UserStore, str]:
+		"""Opens the database of a place the users can be stored
 
-			# render the buttons
+		Args:
+			store (str): "tinydb" for db.json or "sqlite" for db.sqlite3
 
-			# render the log in button
-			logInButton.render(mousePos)
-			startScreen.display.blit(logInButton.surface.display, logInButton.surface.pos)
+		Raises:
+			ValueError: If the store isn't one of userStores
 
-			# render the sign up button
-			signUpButton.render(mousePos)
-			startScreen.display.blit(signUpButton.surface.display, signUpButton.surface.pos)
+		Returns:
+			Tuple[UserStore, str]: [0] the database, [1] where its journal goes
+		"""
+		if (store not in cls.userStores):
+			raise ValueError(f"{store} isn't a user store. Pick one of {', '.join(cls.userStores)}")
 
-			# render the screen
-			self.window.display.blit(startScreen.display, startScreen.pos)
+		path, journalPath = cls.userStores[store]
+		if (store == "sqlite"):
+			return SQLiteUserStore(path), journalPath
+		return UserRepository(TinyDB(path), os.path.splitext(path)[0] + ".history"), journalPath
 
-			# update
-			pygame.display.update()
+	def Start(self):
+		"""Shows the start screen for the game
+		"""
+		self.scenes.run(self, "Start")
 
 	def LogIn(self):
 		""" Shows the log in screen for the game
 		"""
-		# create the log in screen
-		logInScreen = Surface((0, 0), self.size, self.backgroundColor)
-		
-
-		# Create the header for the screen
+		self.scenes.run(self, "LogIn")
 
-		# create the header
-		header = Surface((0, 0), (self.width, 50), CYBERGRAPE)
-
-		# create the button to go back to the home page that doubles as the title
-		titleButton = Button(Surface((header.width / 2 - 75, 2), (150, 50), CYBERGRAPE),
-								Style(Text((150 / 2, 50 / 2), self.font, 25, "WORDLE", WHITE),
-								fillColor=CYBERGRAPE))
-
-
-
-		# Create the title for the screen
-		title = Text((self.width / 2, 125), self.font, 75, "LOG IN", WHITE)
-
-		# Create the Username label for the screen
-		usernameLbl = Text((self.width / 4 + 20, 225), self.font, 30, "USERNAME", WHITE)
-
-		# Create the username text box for the screen
-		usernameTxt = TextBox(Surface((self.width / 4 - 30, 250), (300, 35), self.backgroundColor),
-								Style(Text((10, 35 / 2), self.font, 20, "", WHITE),
-                    			borderColor=TURQUOISE, borderRadius=5),
-
-                   		 		selectedStyle=Style(borderColor=TURQUOISE, borderWidth=4, borderRadius=5))
-
-		# Create the Password label for the screen
-		passwordLbl = Text((self.width / 4 + 20, 325), self.font, 30, "PASSWORD", WHITE)
-
-		# Create the password text box for the screen
-		passwordTxt = TextBox(Surface((self.width / 4 - 30, 350), (300, 35), self.backgroundColor),
-                        		Style(Text((10, 35 / 2), self.font, 20, "", WHITE),
-								borderColor=TURQUOISE, borderRadius=5),
-
-                        		selectedStyle=Style(borderColor=TURQUOISE, borderWidth=4, borderRadius=5), hidden=True)
-
-		# Create the login button for the screen
-		logInButton = Button(Surface((self.width / 2 + 20, 415), (150, 50), self.backgroundColor),
-                       			Style(Text((75, 25), self.font, 25, "LOG IN", DENIM),
-                                borderColor=DENIM, borderRadius=5),
-
-								hoverStyle=Style(Text((75, 25), self.font, 26, "LOG IN", WHITE),
-                         fillColor=DENIM, borderRadius=5))
-
-
-		# Create the keyboard
-		keyboard = self.createKeyboard(175, (5, 7))
-		
-		# create the potential alert message for the screen
-		alert = Alert(Surface((-1, -1), (0, 0), self.backgroundColor), Text((0, 0), None, 0, "", (0, 0, 0)))
-
-		while True:
-			# run at 60 fps
-			self.clock.tick(60)
-
-			# clear the screen
-			logInScreen.clear()
-
-			# get the position of the mouse for later use
-			mousePos = pygame.mouse.get_pos()
-
-			# loop through the events
-			for event in pygame.event.get():
-
-				# Check for QUIT event
-				if event.type == pygame.QUIT:
-					return
-
-				# Checks for the MOUSEDOWN event
-				if event.type == pygame.MOUSEBUTTONDOWN:
-					# if the mouse clicked the Title button go back to start
-					if (titleButton.mouseIsHovering(mousePos)):
-						self.Start()
-						return
-
-					# if the mouse clicked the log in button
-					elif (logInButton.mouseIsHovering(mousePos)):
-						
-						verification = self.verifyLogin(usernameTxt.style.text.text, passwordTxt.style.text.text)
-						if (verification[0]):
-							self.Play()
-							return
-						# Show a message window
-						alert = verification[1]
-
-					elif (alert.mouseClickClose(mousePos)):
-						alert = Alert(Surface((-1, -1), (0, 0), self.backgroundColor), Text((0, 0), None, 0, "", (0, 0, 0)))
-
-
-					keyboardClicked = False
-					# check to see if the user clicked on the keyboard
-					for key in keyboard:
-						if (keyboard[key].mouseIsHovering(mousePos)):
-							keyboardClicked = True
-							# if the key is the enter button encrement the current word
-							if (key == "ENTER"):
-								# jump to the password text box
-								if (usernameTxt.isSelected):
-									usernameTxt.isSelected = False
-									passwordTxt.isSelected = True
-								# attempt to log in
-								elif(passwordTxt.isSelected):
-									verification = self.verifyLogin(
-										usernameTxt.style.text.text, passwordTxt.style.text.text)
-									if (verification[0]):
-										self.Play()
-										return
-									# Show a message window
-									alert = verification[1]
-							# if the key is the back button delete the last character of the current word
-							elif (key == "BACK"):
-								# if username text box is selected -> backspace
-								if (usernameTxt.isSelected):
-									usernameTxt.backSpace()
-								# if password text box is selected -> backspace
-								elif (passwordTxt.isSelected):
-									passwordTxt.backSpace()
-							# else just add the word if the length is less than 5
-							else:
-								# if the username text box is selected -> insert the character 
-								if (usernameTxt.isSelected):
-									usernameTxt.insert(key)
-								# if the password text box is selected -> insert the character
-								elif (passwordTxt.isSelected):
-									passwordTxt.insert(key)
-
-					if not keyboardClicked:
-						# check if the mouse hit the username text box
-						usernameTxt.mouseClick(mousePos)
-
-						# check if th mouse hit the password text box
-						passwordTxt.mouseClick(mousePos)
-
-
-				# Checks for the KEYDOWN event
-				if event.type == pygame.KEYDOWN:
-					# if the return key is pressed
-					if event.key == pygame.K_RETURN:
-						# jump to the password text box
-						if (usernameTxt.isSelected):
-							usernameTxt.isSelected = False
-							passwordTxt.isSelected = True
-						# attempt to log in
-						elif(passwordTxt.isSelected):
-							verification = self.verifyLogin(usernameTxt.style.text.text, passwordTxt.style.text.text)
-							if (verification[0]):
-								self.Play()
-								return
-							# Show a message window
-							alert = verification[1]
-
-					# if the tab key is pressed
-					elif event.key == pygame.K_TAB:
-						# jump to the password text box
-						if (usernameTxt.isSelected):
-							usernameTxt.isSelected = False
-							passwordTxt.isSelected = True
-						# jump to the username text box
-						else:
-							passwordTxt.isSelected = False
-							usernameTxt.isSelected = True
-
-					# if the key is the backspace
-					elif event.key == pygame.K_BACKSPACE:
-						# if username text box is selected -> backspace
-						if (usernameTxt.isSelected):
-							usernameTxt.backSpace()
-						# if password text box is selected -> backspace
-						elif (passwordTxt.isSelected):
-							passwordTxt.backSpace()
-					else:
-						# if the username text box is selevted -> insert the character
-						if (usernameTxt.isSelected):
-							usernameTxt.insert(event.unicode)
-						# if the password text box is selevted -> insert the character
-						elif (passwordTxt.isSelected):
-							passwordTxt.insert(event.unicode)
-				
-
-
-			# create the rectangles
-			pygame.draw.rect(logInScreen.display, LIGHTGREEN, (-33, 69, 320, 700), 2, 10)
-			pygame.draw.rect(logInScreen.display, ORCHID, (130, 200, 600, 600), 2, 10)
-			pygame.draw.rect(logInScreen.display, CYBERGRAPE, (-33, 500, 600, 300), 2, 10)
-
-			# render the header
-			titleButton.render()
-			header.display.blit(titleButton.surface.display, titleButton.surface.pos)
-			logInScreen.display.blit(header.display, header.pos)
-
-			# render the title
-			logInScreen.display.blit(title.display, title.rect)
-
-			# render the username label
-			logInScreen.display.blit(usernameLbl.display, usernameLbl.rect)
-
-			# render the username Text box
-			usernameTxt.render()
-			logInScreen.display.blit(usernameTxt.surface.display, usernameTxt.surface.pos)
-
-			# render the password label
-			logInScreen.display.blit(passwordLbl.display, passwordLbl.rect)
-			
-			# render the password Text Box
-			passwordTxt.render()
-			logInScreen.display.blit(passwordTxt.surface.display, passwordTxt.surface.pos)
-
-			# render the login button
-			logInButton.render(mousePos)
-			logInScreen.display.blit(logInButton.surface.display, logInButton.surface.pos)
-
-			# render the keyboard
-			for key in keyboard:
-				keyboard[key].render(mousePos)
-				logInScreen.display.blit(keyboard[key].surface.display, keyboard[key].surface.pos)
-			
-
-
-			# render the alert
-			alert.render(mousePos)
-			logInScreen.display.blit(alert.surface.display, alert.surface.pos)
-
-			# render the screen
-			self.window.display.blit(logInScreen.display, logInScreen.pos)
-
-			# update
-			pygame.display.update()
-		
 	def SignUp(self):
 		""" Shows the sign up screen for the game
 		"""
-		# create the log in screen
-		signUpScreen = Surface((0, 0), self.size, self.backgroundColor)
-		
-		# Create the header for the screen
-
-		# create the header
-		header = Surface((0, 0), (self.width, 50), CYBERGRAPE)
-
-		# create the button to go back to the home page that doubles as the title
-		titleButton = Button(Surface((header.width / 2 - 75, 2), (150, 50), CYBERGRAPE),
-								Style(Text((150 / 2, 50 / 2), self.font, 25, "WORDLE", WHITE),
-								fillColor=CYBERGRAPE))
-
-
-
-		# Create the title for the screen
-		title = Text((self.width / 2, 100), self.font, 75, "SIGN UP", WHITE)
-
-
-
-		# Create the Username label for the screen
-		usernameLbl = Text((self.width / 4 + 20, 180), self.font, 25, "USERNAME", WHITE)
-
-		# Create the username text box for the screen
-		usernameTxt = TextBox(Surface((self.width / 4 - 30, 200), (300, 30), self.backgroundColor),
-								Style(Text((10, 30 / 2), self.font, 15, "", WHITE),
-                    			borderColor=LIGHTGREEN, borderRadius=5),
-
-                   		 		selectedStyle=Style(borderColor=LIGHTGREEN, borderWidth=4, borderRadius=5))
+		self.scenes.run(self, "SignUp")
 
+	def Play(self):
+		"""Plays the game"""
+		self.scenes.run(self, "Play")
 
+	def markDirty(self, widget, offset: Tuple[int, int]=(0, 0)):
+		"""Marks where the widget is on the window as dirty if it changed the last time it was rendered
 
+		Args:
+			widget (Button | TextBox | Alert): The widget that was rendered
+			offset (Tuple[int, int], optional): The position of the surface the widget is on. Defaults to (0, 0).
+		"""
+		if (widget.dirty):
+			self.window.markDirty(Rect(widget.surface.pos[0] + offset[0], widget.surface.pos[1] + offset[1], widget.surface.width, widget.surface.height))
 
-		# Create the Password label for the screen
-		passwordLbl = Text((self.width / 4 + 20, 270), self.font, 25, "PASSWORD", WHITE)
-
-		# Create the password text box for the screen
-		passwordTxt = TextBox(Surface((self.width / 4 - 30, 290), (300, 30), self.backgroundColor),
-                        		Style(Text((10, 30 / 2), self.font, 15, "", WHITE),
-                                borderColor=LIGHTGREEN, borderRadius=5),
-
-                        		selectedStyle=Style(borderColor=LIGHTGREEN, borderWidth=4, borderRadius=5), hidden=True)
-
-		# Create the verify Password label for the screen
-		verifyPasswordLbl = Text((self.width / 4 + 70, 360), self.font, 25, "VERIFY PASSWORD", WHITE)
-
-		# Create the verify password text box for the screen
-		verifyPasswordTxt = TextBox(Surface((self.width / 4 - 30, 380), (300, 30), self.backgroundColor),
-                        		Style(Text((10, 30 / 2), self.font, 15, "", WHITE),
-                                borderColor=LIGHTGREEN, borderRadius=5),
-
-                       			selectedStyle=Style(borderColor=LIGHTGREEN, borderWidth=4, borderRadius=5), hidden=True)
-
-		# Create the login button for the screen
-		signUpButton = Button(Surface((self.width / 2 + 20, 440), (150, 50), self.backgroundColor),
-                       			Style(Text((75, 25), self.font, 25, "SIGN UP", ORCHID),
-                                borderColor=ORCHID, borderRadius=5),
-
-								hoverStyle=Style(Text((75, 25), self.font, 26, "SIGN UP", WHITE),
-                         		fillColor=ORCHID, borderRadius=5))
-
-
-		# Create the keyboard
-		keyboard = self.createKeyboard(175, (5, 7))
-
-	 	# create the potential alert message for the screen
-		alert = Alert(Surface((-1, -1), (0, 0), self.backgroundColor), Text((0, 0), None, 0, "", (0, 0, 0)))
-
-		while True:
-			# run at 60 fps
-			self.clock.tick(60)
-
-			# clear the screen
-			signUpScreen.clear()
-
-			# get the position of the mouse for later use
-			mousePos = pygame.mouse.get_pos()
-
-			# loop through the events
-			for event in pygame.event.get():
-
-				# Check for QUIT event
-				if event.type == pygame.QUIT:
-					return
-
-				# Checks for the MOUSEDOWN event
-				if event.type == pygame.MOUSEBUTTONDOWN:
-					# if the mouse clicked the log in button
-					if (titleButton.mouseIsHovering(mousePos)):
-						self.Start()
-						return
-					elif (signUpButton.mouseIsHovering(mousePos)):
-
-						newUserSuccess = self.createNewUser(usernameTxt.style.text.text, passwordTxt.style.text.text, verifyPasswordTxt.style.text.text)
-						if (newUserSuccess[0]):
-							self.Play()
-							return
-						# Show a message window
-						alert = newUserSuccess[1]
-
-					# if the mouse clicks the close button on the alert
-					elif (alert.mouseClickClose(mousePos)):
-						alert = Alert(Surface((-1, -1), (0, 0), self.backgroundColor), Text((0, 0), None, 0, "", (0, 0, 0)))
-
-					keyboardClicked = False
-					# check to see if the user clicked on the keyboard
-					for key in keyboard:
-						if (keyboard[key].mouseIsHovering(mousePos)):
-							keyboardClicked = True
-							# if the key is the enter button encrement the current word
-							if (key == "ENTER"):
-								# jump to the password text box
-								if (usernameTxt.isSelected):
-									usernameTxt.isSelected = False
-									verifyPasswordTxt.isSelected = False
-									passwordTxt.isSelected = True
-								# jump to the verify password text box
-								elif(passwordTxt.isSelected):
-									passwordTxt.isSelected = False
-									verifyPasswordTxt.isSelected = True
-								# Sign up
-								else:
-									newUserSuccess = self.createNewUser(
-										usernameTxt.style.text.text, passwordTxt.style.text.text, verifyPasswordTxt.style.text.text)
-									if (newUserSuccess[0]):
-										self.Play()
-										return
-									# Show a message window
-									alert = newUserSuccess[1]
-							# if the key is the back button delete the last character of the current word
-							elif (key == "BACK"):
-								# if username text box is selected -> backspace
-								if (usernameTxt.isSelected):
-									usernameTxt.backSpace()
-								# if password text box is selected -> backspace
-								elif (passwordTxt.isSelected):
-									passwordTxt.backSpace()
-								# if verify password text box is selected -> backspace
-								elif (verifyPasswordTxt.isSelected):
-									verifyPasswordTxt.backSpace()
-							# else just add the word if the length is less than 5
-							else:
-								# if the username text box is selevted -> insert the character
-								if (usernameTxt.isSelected):
-									usernameTxt.insert(key)
-								# if the password text box is selevted -> insert the character
-								elif (passwordTxt.isSelected):
-									passwordTxt.insert(key)
-								# if verify password text box is selected -> insert the character
-								elif (verifyPasswordTxt.isSelected):
-									verifyPasswordTxt.insert(key)
-
-					if not keyboardClicked:
-						# check if the mouse hit the username text box
-						usernameTxt.mouseClick(mousePos)
-
-						# check if th mouse hit the password text box
-						passwordTxt.mouseClick(mousePos)
-
-						# check if the mouse hit the verify password text box
-						verifyPasswordTxt.mouseClick(mousePos)
-
-
-				# Checks for the KEYDOWN event
-				if event.type == pygame.KEYDOWN:
-					# if the return key is pressed
-					if event.key == pygame.K_RETURN:
-						# jump to the password text box
-						if (usernameTxt.isSelected):
-							usernameTxt.isSelected = False
-							verifyPasswordTxt.isSelected = False
-							passwordTxt.isSelected = True
-						# jump to the verify password text box
-						elif(passwordTxt.isSelected):
-							passwordTxt.isSelected = False
-							verifyPasswordTxt.isSelected = True
-						# Sign up
-						else:
-							newUserSuccess = self.createNewUser(usernameTxt.style.text.text, passwordTxt.style.text.text, verifyPasswordTxt.style.text.text)
-							if (newUserSuccess[0]):
-								self.Play()
-								return
-							# Show a message window
-							alert = newUserSuccess[1]
-							
-					# if the tab key is pressed
-					elif event.key == pygame.K_TAB:
-						# jump to the password text box
-						if (usernameTxt.isSelected):
-							usernameTxt.isSelected = False
-							passwordTxt.isSelected = True
-						elif (passwordTxt.isSelected):
-							usernameTxt.isSelected = False
-							passwordTxt.isSelected = False
-							verifyPasswordTxt.isSelected = True
-						# jump to the username text box
-						else:
-							verifyPasswordTxt.isSelected = False
-							passwordTxt.isSelected = False
-							usernameTxt.isSelected = True
-
-					# if the key is the backspace
-					elif event.key == pygame.K_BACKSPACE:
-						# if username text box is selected -> backspace
-						if (usernameTxt.isSelected):
-							usernameTxt.backSpace()
-						# if password text box is selected -> backspace
-						elif (passwordTxt.isSelected):
-							passwordTxt.backSpace()
-						# if verify password text box is selected -> backspace
-						elif (verifyPasswordTxt.isSelected):
-							verifyPasswordTxt.backSpace()
-					else:
-						# if the username text box is selevted -> insert the character
-						if (usernameTxt.isSelected):
-							usernameTxt.insert(event.unicode)
-						# if the password text box is selevted -> insert the character
-						elif (passwordTxt.isSelected):
-							passwordTxt.insert(event.unicode)
-						# if verify password text box is selected -> insert the character
-						elif (verifyPasswordTxt.isSelected):
-							verifyPasswordTxt.insert(event.unicode)
-				
-
-
-			# create the rectangles
-			pygame.draw.rect(signUpScreen.display, TURQUOISE, (-33, 69, 320, 700), 2, 10)
-			pygame.draw.rect(signUpScreen.display, DENIM, (130, 200, 600, 600), 2, 10)
-			pygame.draw.rect(signUpScreen.display, CYBERGRAPE, (-33, 500, 600, 300), 2, 10)
-
-			# render the header
-			titleButton.render()
-			header.display.blit(titleButton.surface.display, titleButton.surface.pos)
-			signUpScreen.display.blit(header.display, header.pos)
-
-			# render the title
-			signUpScreen.display.blit(title.display, title.rect)
-
-			# render the username label
-			signUpScreen.display.blit(usernameLbl.display, usernameLbl.rect)
-
-			# render the username Text box
-			usernameTxt.render()
-			signUpScreen.display.blit(usernameTxt.surface.display, usernameTxt.surface.pos)
-
-			# render the password label
-			signUpScreen.display.blit(passwordLbl.display, passwordLbl.rect)
-
-			# render the password Text Box
-			passwordTxt.render()
-			signUpScreen.display.blit(passwordTxt.surface.display, passwordTxt.surface.pos)
-
-			# render the password label
-			signUpScreen.display.blit(verifyPasswordLbl.display, verifyPasswordLbl.rect)
-
-			# render the password Text Box
-			verifyPasswordTxt.render()
-			signUpScreen.display.blit(verifyPasswordTxt.surface.display, verifyPasswordTxt.surface.pos)
-
-			# render the login button
-			signUpButton.render(mousePos)
-			signUpScreen.display.blit(signUpButton.surface.display, signUpButton.surface.pos)
-
-			# render the keyboard
-			for key in keyboard:
-				keyboard[key].render(mousePos)
-				signUpScreen.display.blit(
-					keyboard[key].surface.display, keyboard[key].surface.pos)
-
-			# render the alert
-			alert.render(mousePos)
-			signUpScreen.display.blit(alert.surface.display, alert.surface.pos)
-
-			# render the screen
-			self.window.display.blit(signUpScreen.display, signUpScreen.pos)
-
-			# update
-			pygame.display.update()
+	def distributionBars(self, top: int, guesses: int = None) -> list[Tuple[Text, pygame.Rect, Tuple[int, int, int], Text]]:
+		"""Lays out the bars of the user's guess distribution for the end screen
 
-	def Play(self):
-		"""Plays the game"""
-		# create the game in screen
-		gameScreen = Surface((0, 0), self.size, self.backgroundColor)
-		gameover = False
-		win = False
+		Args:
+			top (int): Where the first bar goes on the end screen
+			guesses (int, optional): The number of guesses of the game that was just won, so its bar is highlighted. Defaults to None.
 
-		# Create the header for the screen
+		Returns:
+			list[Tuple[Text, pygame.Rect, Tuple[int, int, int], Text]]: The label, bar, color and count of each number of guesses
+		"""
+		bars = []
+		most = max(max(self.user.distribution), 1)
+		for i, count in enumerate(self.user.distribution):
+			y = top + i * 14
 
-		# create the header
-		header = Surface((0, 0), (self.width, 50), CYBERGRAPE)
+			# every bar is wide enough to fit its count
+			width = 20 + (200 * count) // most
+			bar = pygame.Rect(45, y, width, 12)
+			color = GREEN if i + 1 == guesses else DARKGRAY
 
-		# create the button to go back to the home page that doubles as the title
-		titleButton = Button(Surface((header.width / 2 - 75, 2), (150, 50), CYBERGRAPE),
-                       Style(Text((150 / 2, 50 / 2), self.font, 25, "WORDLE", WHITE),
-                             fillColor=CYBERGRAPE))
+			label = Text((35, y + 6), self.font, 10, str(i + 1), LIGHTGRAY)
+			countTxt = Text((45 + width - 8, y + 6), self.font, 10, str(count), WHITE)
+			bars.append((label, bar, color, countTxt))
+		return bars
 
-		# the words for the game
-		secretWord = random.choice(self.acceptedWordsList).upper()
-		words = [""] * 6
-		currentWord = 0
-		greenLetters = ""
-		yellowLetters = ""
-		blackLetters = ""
+	def tileColors(self, states: list[int]) -> list[Tuple[int, int, int]]:
+		"""Returns the colors of the tiles for the letters of an entered word
 
-		keyboard = self.createKeyboard(175, (5, 7))
+		Args:
+			states (list[int]): The state of each letter. Feedback.green, Feedback.yellow or Feedback.gray
 
+		Returns:
+			list[Tuple[int, int, int]]: The fill color of each letter. GREEN, YELLOW or DARKGRAY
+		"""
+		colors = {Feedback.green: GREEN, Feedback.yellow: YELLOW, Feedback.gray: DARKGRAY}
+		return [colors[state] for state in states]
 
-		alert = Alert(Surface((-1, -1), (0, 0), self.backgroundColor), Text((0, 0), None, 0, "", (0, 0, 0)))
+	def getHint(self, game: GameSession) -> Alert:
+		"""Suggests the next guess from the words guessed so far
 
-		notAWordAlert = Alert(Surface((-1, -1), (0, 0),
-		              self.backgroundColor), Text((0, 0), None, 0, "", (0, 0, 0)))
+		Args:
+			game (GameSession): The game being played
 
-		displayAlertTime = pygame.time.get_ticks()
+		Returns:
+			Alert: The alert that shows the suggested guess, or that the solver is still loading or couldn't be loaded
+		"""
+		# don't block the screen while the solver loads
+		if (not self.solver.done()):
+			return self.alerts.get("Simple", "Thinking...")
+		# the word list or the caches couldn't be read
+		if (self.solver.exception() != None):
+			return self.alerts.get("Simple", "Hint unavailable")
 
+		hint = self.solver.result().suggest(list(zip(game.guesses, game.feedback)))
+		if (hint == None):
+			return self.alerts.get("Simple", "No word fits")
+		return self.alerts.get("Simple", f"Try {hint.upper()}")
 
-		# create the endscreen
-		endScreen = Surface((self.width / 2 - 150, self.height / 2 - 200), (300, 400), self.backgroundColor)
-
-		statsTxt = Text((150, 125), self.font, 15, "STATISTICS", WHITE)
-
-		winPercent = Text((100 - 5, 175), self.font, 35, "100", WHITE)
-		winPercentTxt = Text((100 - 2, 200), self.font, 10, "WIN %", LIGHTGRAY)
-
-		played = Text((200 + 5, 175), self.font, 35, "5", WHITE)
-		playedTxt = Text((200 + 7, 200), self.font, 10, "played", LIGHTGRAY)
-
-		gamesWon = Text((100 - 5, 275), self.font, 35, "5", WHITE)
-		gamesWonTxt = Text((100 - 3, 300), self.font, 10, "games won", LIGHTGRAY)
-
-
-		gamesLost = Text((200 + 5, 275), self.font, 35, "0", WHITE)
-		gamesLostTxt = Text((200 + 7, 300), self.font, 10, "games lost", LIGHTGRAY)
-
-
-		# display the play agian button
-		playAgainBtn = Button(Surface((10, 340), (125, 50), self.backgroundColor),
-								Style(Text((125 / 2, 25), self.font, 15, "PLAY AGAIN", DENIM), borderColor=DENIM, borderRadius=5),
-								hoverStyle=Style(Text((125 / 2, 25), self.font, 17, "PLAY AGAIN", WHITE), fillColor=DENIM, borderRadius=5))
-		
-
-		# display the exit button
-		exitBtn = Button(Surface((165, 340), (125, 50), self.backgroundColor),
-								Style(Text((125 / 2, 25), self.font, 15, "EXIT", LIGHTRED), borderColor=LIGHTRED, borderRadius=5),
-								hoverStyle=Style(Text((125 / 2, 25), self.font, 17, "EXIT", WHITE), fillColor=LIGHTRED, borderRadius=5))
-		
-
-		while True:
-			# run at 60 fps
-			self.clock.tick(60)
-
-
-			# check for game over
-			if (not gameover and words[currentWord - 1] == secretWord):
-				pygame.time.delay(2000)
-				gameover = True
-				win = True
-
-				# update the statistics
-				self.user.win()
-				self.db.update({'winPercent': self.user.winPercent, 'played': self.user.played,
-				               'gamesWon': self.user.gamesWon, 'gamesLost': self.user.gamesLost}, Query()['username'] == self.user.username)
-				winPercent.text = str(self.user.winPercent)
-				played.text = str(self.user.played)
-				gamesWon.text = str(self.user.gamesWon)
-				gamesLost.text = str(self.user.gamesLost)
-			elif (not gameover and currentWord == 6):
-				pygame.time.delay(2000)
-				gameover = True
-
-				# update the statistics
-				self.user.lose()
-				self.db.update({'winPercent': self.user.winPercent, 'played': self.user.played,
-				               'gamesWon': self.user.gamesWon, 'gamesLost': self.user.gamesLost}, Query()['username'] == self.user.username)
-				winPercent.text = str(self.user.winPercent)
-				played.text = str(self.user.played)
-				gamesWon.text = str(self.user.gamesWon)
-				gamesLost.text = str(self.user.gamesLost)
-
-
-			
-
-			# clear the screen
-			gameScreen.clear()
-
-			# get the position of the mouse for later use
-			mousePos = pygame.mouse.get_pos()
-
-			# loop through the events
-			for event in pygame.event.get():
-
-				# Check for QUIT event
-				if event.type == pygame.QUIT:
-					return
-
-				# Checks for the MOUSEDOWN event
-				if event.type == pygame.MOUSEBUTTONDOWN:
-					# if the mouse clicked the Title button go back to start
-					if (titleButton.mouseIsHovering(mousePos)):
-						self.Start()
-						return
-
-					# if the mouse clicked the close button on the alert
-					elif (alert.mouseClickClose(mousePos)):
-						alert = Alert(Surface((-1, -1), (0, 0),
-						              self.backgroundColor), Text((0, 0), None, 0, "", (0, 0, 0)))
-					
-					# Check to see if the mouse clicked on the keyboard
-					elif (not gameover):
-						# loop throught the keys and check to see if the mouse clicked them
-						for key in keyboard:
-							if (keyboard[key].mouseIsHovering(mousePos)):
-								# if the key is the enter button encrement the current word
-								if (key == "ENTER"):
-									if (len(words[currentWord]) == 5):
-										if (words[currentWord].lower() in self.acceptedWords):
-											currentWord += 1
-										else:
-											notAWordAlert = Alert(Surface((self.width / 2 - 125, 40), (250, 75), self.backgroundColor), Text((125, 75 / 2), self.font, 25, "Not in Word List", BLACK))
-											notAWordAlert.closeButton = Button(Surface((0, 0), (0, 0), self.backgroundColor), Style())
-											displayAlertTime = pygame.time.get_ticks()
-								# if the key is the back button delete the last character of the current word
-								elif (key == "BACK"):
-									words[currentWord] = words[currentWord][:-1]
-								# else just add the word if the length is less than 5
-								elif (len(words[currentWord]) < 5):
-									words[currentWord] += key
-
-					# Check to see if the mouse clicked the play again button
-					elif (playAgainBtn.mouseIsHovering((mousePos[0] - endScreen.pos[0], mousePos[1] - endScreen.pos[1]))):
-						self.Play()
-						return
-					
-					# Check to see if the mouse clicked the eixt button
-					elif (exitBtn.mouseIsHovering((mousePos[0] - endScreen.pos[0], mousePos[1] - endScreen.pos[1]))):
-						self.Start()
-						return
-
-				# Checks for the KEYDOWN event
-				if event.type == pygame.KEYDOWN and not gameover:
-					# if the return key is pressed
-					if event.key == pygame.K_RETURN:
-						if (len(words[currentWord]) == 5):
-							if (words[currentWord].lower() in self.acceptedWords):
-								currentWord += 1
-							else:
-								notAWordAlert = Alert(Surface((self.width / 2 - 125, 40), (250, 75), self.backgroundColor), Text((125, 75 / 2), self.font, 25, "Not in Word List", BLACK))
-								notAWordAlert.closeButton = Button(Surface((0, 0), (0, 0), self.backgroundColor), Style())
-								displayAlertTime = pygame.time.get_ticks()
-					# if the backspace key is pressed
-					elif event.key == pygame.K_BACKSPACE:
-						words[currentWord] = words[currentWord][:-1]
-					# else just add to the word if the length is less than 5
-					elif (len(words[currentWord]) < 5):
-						words[currentWord] += event.unicode.upper()
-
-			# create the aesthetic lines
-			pygame.draw.rect(gameScreen.display, LIGHTGREEN,
-			                 (250, 400, 280, 700), 2, 10)
-			pygame.draw.rect(gameScreen.display, ORCHID, 
-							 (-100, 150, 275, 600), 2, 10)
-			pygame.draw.rect(gameScreen.display, CYBERGRAPE,
-			                 (-33, 500, 600, 300), 2, 10)
-			pygame.draw.rect(gameScreen.display, DENIM,
-                     (100, -30, 600, 280), 2, 10)
-							 
-
-			# render the header
-			titleButton.render()
-			header.display.blit(titleButton.surface.display, titleButton.surface.pos)
-			gameScreen.display.blit(header.display, header.pos)
-
-
-			# Create the word boxes
-			wordsHeight = 400
-			padding = 40
-			margin = 8
-			boxSize = (wordsHeight - padding * 2 - margin * 4) / 5
-			for i in range(0, len(words)):
-				# make sure the word has been entered
-				if (i < currentWord):
-
-					# created a copy of the words
-					text = words[i]
-					copyOfSecretWord = secretWord
-					word = {}
-					for j in range(0, 5):
-						word.update({j: text[j]})
-					
-					# loop through and check to see if we should turn any letters green
-					for j in word.copy():
-						# if the letters are in the correct spot
-						if word[j] == copyOfSecretWord[j]:
-							# add it to greenletters
-							if (text[j] not in greenLetters):
-								greenLetters += text[j]
-
-							# create the box
-							box = Button(Surface((padding + j * (boxSize + margin), i * (boxSize + margin) + 75), (boxSize, boxSize), self.backgroundColor), Style(Text(
-								(boxSize / 2, boxSize / 2), self.font, 25, text[j], WHITE), borderColor=WHITE, borderRadius=5, fillColor=GREEN))
-							box.render()
-							gameScreen.display.blit(box.surface.display, box.surface.pos)
-
-							# delete the letter from the copy of the words
-							copyOfSecretWord = copyOfSecretWord[:j] + " " + copyOfSecretWord[j + 1:]
-							word.pop(j)
-					
-					# loop throuhg and check to see if we should turn any yellow
-					for j in word.copy():
-						fillcolor = DARKGRAY
-
-						# if the letters are in the word
-						if (word[j] in copyOfSecretWord):
-							# add it to yellowletters
-							if (text[j] not in yellowLetters):
-								yellowLetters += text[j]
-							
-							# change the fillcolor
-							fillcolor = YELLOW
-
-							# delete the letter from the copy of the words
-							index = copyOfSecretWord.index(word[j])
-							copyOfSecretWord = copyOfSecretWord[:index] + " " + copyOfSecretWord[index + 1:]
-							word.pop(j)
-						# else the letters are not in the word
-						elif (text[j] not in blackLetters):
-							blackLetters += text[j]
-						
-						# render the box
-						box = Button(Surface((padding + j * (boxSize + margin), i * (boxSize + margin) + 75), (boxSize, boxSize), self.backgroundColor), Style(Text(
-								(boxSize / 2, boxSize / 2), self.font, 25, text[j], WHITE), borderColor=WHITE, borderRadius=5, fillColor=fillcolor))
-						box.render()
-						gameScreen.display.blit(box.surface.display, box.surface.pos)
-
-				else:
-					textColor = WHITE
-					if i == currentWord and len(words[i]) == 5 and words[i].lower() not in self.acceptedWords:
-						textColor = LIGHTRED
-
-
-					for j in range(0, 5):
-						# get the text from the words
-						text = words[i][j] if j < len(words[i]) else ""
-
-						# render the box
-						box = Button(Surface((padding + j * (boxSize + margin), i * (boxSize + margin) + 75), (boxSize, boxSize), self.backgroundColor), Style(Text(
-								(boxSize / 2, boxSize / 2), self.font, 25, text, textColor), borderColor=WHITE, borderRadius=5, fillColor=self.backgroundColor))
-						box.render()
-						gameScreen.display.blit(box.surface.display, box.surface.pos)
-
-			
-
-			# render the keyboard
-			for key in keyboard:
-				if (key in greenLetters):
-					keyboard[key].style.fillColor = GREEN
-					keyboard[key].hoverStyle.fillColor = DARKGREEN
-				elif (key in yellowLetters):
-					keyboard[key].style.fillColor = YELLOW
-					keyboard[key].hoverStyle.fillColor = DARKYELLOW
-				elif (key in blackLetters):
-					keyboard[key].style.fillColor = DARKGRAY
-					keyboard[key].hoverStyle.fillColor = DARKERGRAY
-
-				
-				keyboard[key].render(mousePos)
-				gameScreen.display.blit(keyboard[key].surface.display, keyboard[key].surface.pos)
-			
-
-			# display the end screen if game over
-			if (gameover):
-				endScreen.clear()
-
-				# display the title
-				if (win):
-					text = Text((endScreen.width / 2, 60), self.font, 50, "VICTORY!", LIGHTGREEN)
-				else:
-					text = Text((endScreen.width / 2, 50), self.font, 50, "DEFEAT", (255, 0, 0))
-					word = Text((endScreen.width / 2, 80), self.font, 15, f"The word was {secretWord}", GRAY)
-					endScreen.display.blit(word.display, word.rect)
-
-
-				pygame.draw.line(endScreen.display, LIGHTGRAY, (30, 105), (endScreen.width - 30, 105))
-
-				# display the statistics
-				endScreen.display.blit(statsTxt.display, statsTxt.rect)
-
-				endScreen.display.blit(winPercent.display, winPercent.rect)
-				endScreen.display.blit(winPercentTxt.display, winPercentTxt.rect)
-
-				endScreen.display.blit(played.display, played.rect)
-				endScreen.display.blit(playedTxt.display, playedTxt.rect)
-
-				endScreen.display.blit(gamesWon.display, gamesWon.rect)
-				endScreen.display.blit(gamesWonTxt.display, gamesWonTxt.rect)
-
-				endScreen.display.blit(gamesLost.display, gamesLost.rect)
-				endScreen.display.blit(gamesLostTxt.display, gamesLostTxt.rect)
-
-				endScreen.display.blit(text.display, text.rect)
-
-
-
-				# render play again button
-				playAgainBtn.render((mousePos[0] - endScreen.pos[0], mousePos[1] - endScreen.pos[1]))
-				endScreen.display.blit(playAgainBtn.surface.display, playAgainBtn.surface.pos)
-
-				# render exit button
-				exitBtn.render((mousePos[0] - endScreen.pos[0], mousePos[1] - endScreen.pos[1]))
-				endScreen.display.blit(exitBtn.surface.display, exitBtn.surface.pos)
-				
-
-				# create a layover to hide the other screen
-				layOver = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-				layOver.fill((0, 0, 0, 128))
-				gameScreen.display.blit(layOver, (0,0))
-				gameScreen.display.blit(endScreen.display, endScreen.pos)
-
-			# render the alert
-			alert.render(mousePos)
-			gameScreen.display.blit(alert.surface.display, alert.surface.pos)
-
-			if (pygame.time.get_ticks() - displayAlertTime < 2000):
-				# render the not a word alert
-				notAWordAlert.render(mousePos)
-				gameScreen.display.blit(notAWordAlert.surface.display, notAWordAlert.surface.pos)
+	def verifyLogin(self, username: str, password: str) -> Future:
+		"""Starts verifying the login username and password in the background
 
+		Args:
+			username (str): The username to compare the password to
+			password (str): The password for the username
 
-			# render the screen
-			self.window.display.blit(gameScreen.display, gameScreen.pos)
+		Returns:
+			Future: Resolves to whether it was a success, the error, the alert type and the alert font size
+		"""
+		return self.scenes.wakeWhenDone(self.passwordWorker.submit(self.checkLogin, username, password))
 
-			# update
-			pygame.display.update()
-		
-	def verifyLogin(self, username: str, password: str) -> Tuple[bool, Alert]:
-		"""Verifies the login username and password
+	def checkLogin(self, username: str, password: str) -> Tuple[bool, str, str, int]:
+		"""Verifies the login username and password, upgrading the stored password if it was hashed with old settings
 
 		Args:
 			username (str): The username to compare the password to
 			password (str): The password for the username
 
 		Returns:
-			Tuple[bool, Alert]: [0] whether it was a success or not, [1] the alert to display on fail
+			Tuple[bool, str, str, int]: [0] whether it was a success or not, [1] the error, [2] the alert type, [3] the alert font size
 		"""
 
 
-		user = self.db.search(Query()['username'] == username)
+		user = self.stats.find(username)
 
 
 		error = ""
@@ -1041,22 +287,26 @@ class Wordle:
 			error = "PASSWORD is a required field."
 		# If the username doesn't exist in the database
 		elif not user:
+			# check the password anyway so a missing username takes as long as a wrong password
+			self.passwords.verify(password, self.passwords.dummyHash)
 			error = "USERNAME is an invalid field."
 			type = "Danger"
-		elif user[0]['password'] != password:
+		elif not self.passwords.verify(password, user['password']):
 			error = "WRONG PASSWORD.              "
 			type = "Danger"
 		# Else the verification was successful
 		else:
-			self.user = User(user[0]['username'], user[0]['password'], user[0]['gamesWon'], user[0]['gamesLost'])
-			return [True, Alert(Surface((self.width / 2 - 350 / 2, 80), (350, 100), self.backgroundColor),
-                      Text((145, 50), self.font, 18, "Success!", BLACK), "Success")]
+			# hash passwords that were stored as plaintext or with old settings
+			if (self.passwords.needsRehash(user['password'])):
+				user['password'] = self.passwords.hash(password, replaces=user['password'])
+				self.users.updateMany({username: lambda document: document.update(password=user['password'])})
+			self.user = User.fromDocument(user)
+			return (True, "Success!", "Success", 18)
 
-		return [False, Alert(Surface((self.width / 2 - 350 / 2, 80), (350, 100), self.backgroundColor),
-									 Text((145, 50), self.font, 18, error, BLACK), type)]
+		return (False, error, type, 18)
 
-	def createNewUser(self, username: str, password: str, verifyPassword: str) -> Tuple[bool, Alert]:
-		"""Creates a new user with the given username and password
+	def createNewUser(self, username: str, password: str, verifyPassword: str) -> Future:
+		"""Starts creating a new user with the given username and password in the background
 
 		Args:
 			username (str): the username for the user
@@ -1064,7 +314,20 @@ class Wordle:
 			verifyPassword (str): The password verification for the user
 
 		Returns:
-			Tuple[bool, Alert]: [0] whether it was a success or not, [1] the alert to display on fail
+			Future: Resolves to whether it was a success, the error, the alert type and the alert font size
+		"""
+		return self.scenes.wakeWhenDone(self.passwordWorker.submit(self.checkNewUser, username, password, verifyPassword))
+
+	def checkNewUser(self, username: str, password: str, verifyPassword: str) -> Tuple[bool, str, str, int]:
+		"""Creates a new user with the given username and password, storing a hash of the password
+
+		Args:
+			username (str): the username for the user
+			password (str): The password for the user
+			verifyPassword (str): The password verification for the user
+
+		Returns:
+			Tuple[bool, str, str, int]: [0] whether it was a success or not, [1] the error, [2] the alert type, [3] the alert font size
 		"""
 		error = ""
 		type = "Warning"
@@ -1083,63 +346,46 @@ class Wordle:
 		elif password != verifyPassword:
 			error = "PASSWORDS don't match."
 		# If there is another user with the same username don't allow it
-		elif self.db.search(Query()['username'] == username):
+		elif self.users.exists(username):
 			error = "USERNAME is already taken."
 
 		# After all the validation return true and add the new user
 		else:
-			self.user = User(username, password)
-			self.db.insert({'username': self.user.username, 'password': self.user.password, 'winPercent': self.user.winPercent, 'played': self.user.played, 'gamesWon': self.user.gamesWon, 'gamesLost': self.user.gamesLost})
-			return [True, None]
+			user = User(username, self.passwords.hash(password))
+			try:
+				self.users.insert(user.toDocument())
+			except ValueError:
+				# someone else took the username while the password was being hashed
+				return (False, "USERNAME is already taken.", type, fontSize)
+			self.user = user
+			return (True, "", "Success", fontSize)
 
-		return[False, Alert(Surface((self.width / 2 - 350 / 2, 80), (350, 100), self.backgroundColor),
-									Text((145, 50), self.font, fontSize, error, BLACK), type)]
+		return (False, error, type, fontSize)
 
-	def createKeyboard(self, keyboardHeight: int, margin: Tuple[int, int]) -> dict[str, Button]:
-		"""Returns a keyboard with the specified hieght at the bottom of the screen
+	def messageAlert(self, message: str, type: str, fontSize: int = 18) -> Alert:
+		"""Shows the alert with the result of logging in or signing up
 
 		Args:
-			keyBoardHeight (int): the height of the keyboard
-			margin (Tuple[int, int]): The space between the keys. margin[0] is x and margin[1] is y.
+			message (str): The message to show
+			type (str): The type of alert
+			fontSize (int, optional): The size of the message. Defaults to 18.
 
 		Returns:
-			Dict(str, Button): The keyboard. Dict[letter] = button
+			Alert: The alert
 		"""
+		return self.alerts.get(type, message, fontSize)
 
-		keyboard = {}
-
-		keyHeight = (keyboardHeight - margin[1] * 3) / 3
-		keyWidth = (self.width - margin[0] * 11) / 10
-
-
-		qRow = "QWERTYUIOP"
-		for i, letter in enumerate(qRow):
-			keyboard.update({letter: Button(Surface((i * keyWidth + (i + 1) * margin[0], self.height - keyboardHeight), (keyWidth, keyHeight), self.backgroundColor),
-						Style(Text((keyWidth / 2, keyHeight / 2), self.font, 14, letter, WHITE), borderRadius=3, fillColor=LIGHTGRAY),
-						hoverStyle = Style(Text((keyWidth / 2, keyHeight / 2), self.font, 15, letter, WHITE), borderRadius=3, fillColor=GRAY))})
-
-		aRow = "ASDFGHJKL"
-		for i, letter in enumerate(aRow):
-			keyboard.update({letter: Button(Surface((i * keyWidth + ((i + 1) * margin[0] + margin[0] / 2) + (keyWidth / 2), self.height - keyboardHeight * 2 / 3), (keyWidth, keyHeight), self.backgroundColor),
-						Style(Text((keyWidth / 2, keyHeight / 2), self.font, 14, letter, WHITE), borderRadius=3, fillColor=LIGHTGRAY),
-						hoverStyle = Style(Text((keyWidth / 2, keyHeight / 2), self.font, 15, letter, WHITE), borderRadius=3, fillColor=GRAY))})
-
-		zRow = "ZXCVBNM"
-		keyboard.update({"ENTER": Button(Surface((margin[0] + 2, self.height - keyboardHeight / 3), (keyWidth * 3 / 2, keyHeight), self.backgroundColor),
-						Style(Text((keyWidth * 3 / 4, keyHeight / 2), self.font, 12, "ENTER", WHITE), borderRadius=3, fillColor=LIGHTGRAY),
-						hoverStyle = Style(Text((keyWidth * 3 / 4, keyHeight / 2), self.font, 13, "ENTER", WHITE), borderRadius=3, fillColor=GRAY))})
-		for i, letter in enumerate(zRow):
-			keyboard.update({letter: Button(Surface((i * keyWidth + ((i + 1) * margin[0] + margin[0] * 3 / 2) + keyWidth * 3 / 2, self.height - keyboardHeight / 3), (keyWidth, keyHeight), self.backgroundColor),
-						Style(Text((keyWidth / 2, keyHeight / 2), self.font, 14, letter, WHITE), borderRadius=3, fillColor=LIGHTGRAY),
-						hoverStyle = Style(Text((keyWidth / 2, keyHeight / 2), self.font, 15, letter, WHITE), borderRadius=3, fillColor=GRAY))})
-
-		keyboard.update({"BACK": Button(Surface((keyWidth * 17 / 2 + margin[0] * 9 + 3, self.height - keyboardHeight / 3), (keyWidth * 3 / 2, keyHeight), self.backgroundColor),
-					Style(Text((keyWidth * 3 / 4, keyHeight / 2), self.font, 12, "BACK", WHITE), borderRadius=3, fillColor=LIGHTGRAY),
-					hoverStyle = Style(Text((keyWidth * 3 / 4, keyHeight / 2), self.font, 13, "BACK", WHITE), borderRadius=3, fillColor=GRAY))})
 
-		return keyboard
 
 
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Plays Wordle")
+	parser.add_argument("--store", choices=sorted(Wordle.userStores), default=os.environ.get("WORDLE_STORE", Wordle.defaultStore),
+						help="where the users are stored. Defaults to the WORDLE_STORE environment variable or tinydb")
+	arguments = parser.parse_args()
 
-wordle = Wordle()
-wordle.Start()
\ No newline at end of file
+	wordle = Wordle(*Wordle.openStore(arguments.store))
+	wordle.Start()
+	wordle.profiler.close()
+	wordle.stats.close()
+	wordle.users.close()
\ No newline at end of file
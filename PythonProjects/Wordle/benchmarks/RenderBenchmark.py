@@ -0,0 +1,299 @@
+import os
+import sys
+
+# render without a real window and run from the game's folder so the fonts and word lists are found
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+gameFolder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(gameFolder)
+sys.path.insert(0, gameFolder)
+
+import argparse
+import json
+import platform
+import tempfile
+import time
+import tracemalloc
+from typing import Tuple
+import pygame
+from tinydb import TinyDB
+from tinydb.storages import MemoryStorage
+from FontRegistry import FontRegistry
+from GameSession import GameSession
+from Text import Text
+from User import User
+from UserRepository import UserRepository
+from Wordle import Wordle
+
+
+class RenderBenchmark:
+	"""Plays scripted frames of the screens without a real window and measures how fast they render
+
+	Each scenario shows a screen and feeds it the same events every run, once timing every frame
+	and once with tracemalloc counting what each frame allocates. The users live in memory so nothing is written to the database.
+	"""
+
+	scenarios = ("LogIn", "SignUp", "Play")
+	"""The screens that can be benchmarked"""
+
+	secretWord = "PROUD"
+	"""The secret word of the benchmarked game. None of the guesses get it"""
+
+	guesses = ("CRANE", "SLATE", "DUMPY", "FIGHT", "WRONG")
+	"""The words guessed at the start of the benchmarked game"""
+
+	def __init__(self, frames: int=600):
+		"""Initializes the RenderBenchmark, swapping the game's users for ones kept in memory
+
+		Args:
+			frames (int, optional): How many frames each scenario runs. Defaults to 600.
+		"""
+		self.frames = frames
+		"""How many frames each scenario runs"""
+
+		# keep the results of the benchmarked games out of the real database
+		self.folder = tempfile.TemporaryDirectory()
+		"""Where the journal of the users kept in memory goes"""
+
+		self.wordle = Wordle(UserRepository(TinyDB(storage=MemoryStorage)), os.path.join(self.folder.name, "db.journal"))
+		"""The game that is benchmarked"""
+		self.wordle.user = User("bench", "password")
+
+		# let the solver finish loading so its thread doesn't slow down the timed frames
+		self.wordle.solver.result()
+
+	@staticmethod
+	def click(pos: Tuple[float, float]) -> Tuple[list[pygame.event.Event], Tuple[float, float]]:
+		"""Returns a frame where the mouse clicks
+
+		Args:
+			pos (Tuple[float, float]): Where the mouse clicks
+
+		Returns:
+			Tuple[list[pygame.event.Event], Tuple[float, float]]: The events and the position of the mouse
+		"""
+		return [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1)], pos
+
+	@staticmethod
+	def press(key: int, unicode: str="", mousePos: Tuple[float, float]=(-1, -1)) -> Tuple[list[pygame.event.Event], Tuple[float, float]]:
+		"""Returns a frame where a key is pressed
+
+		Args:
+			key (int): The key
+			unicode (str, optional): The character the key types. Defaults to "".
+			mousePos (Tuple[float, float], optional): The position of the mouse. Defaults to (-1, -1).
+
+		Returns:
+			Tuple[list[pygame.event.Event], Tuple[float, float]]: The events and the position of the mouse
+		"""
+		return [pygame.event.Event(pygame.KEYDOWN, key=key, unicode=unicode, mod=0)], mousePos
+
+	def type(self, text: str) -> list[Tuple[list[pygame.event.Event], Tuple[float, float]]]:
+		"""Returns a frame for each character typed
+
+		Args:
+			text (str): The text to type
+
+		Returns:
+			list[Tuple[list[pygame.event.Event], Tuple[float, float]]]: The frames
+		"""
+		return [self.press(ord(character.lower()), character) for character in text]
+
+	def center(self, widget) -> Tuple[float, float]:
+		"""Finds the middle of a widget or key
+
+		Args:
+			widget (Button | TextBox | str): The widget or the name of a key on the keyboard
+
+		Returns:
+			Tuple[float, float]: The middle of it on the window
+		"""
+		if (isinstance(widget, str)):
+			pos, size = self.wordle.keyboard.keys[widget]
+		else:
+			pos, size = widget.surface.pos, widget.surface.size
+		return (pos[0] + size[0] / 2, pos[1] + size[1] / 2)
+
+	def keyboardFrames(self) -> list[Tuple[list[pygame.event.Event], Tuple[float, float]]]:
+		"""Returns frames that move the mouse over each letter, click it and then click BACK
+
+		Returns:
+			list[Tuple[list[pygame.event.Event], Tuple[float, float]]]: The frames
+		"""
+		frames = []
+		for letter in "QWERTYUIOPASDFGHJKLZXCVBNM":
+			frames.append(([], self.center(letter)))
+			frames.append(self.click(self.center(letter)))
+			frames.append(([], self.center("BACK")))
+			frames.append(self.click(self.center("BACK")))
+		return frames
+
+	def script(self, name: str) -> list[Tuple[list[pygame.event.Event], Tuple[float, float]]]:
+		"""Shows a scenario's screen and returns the frames played once before the keyboard frames repeat
+
+		Args:
+			name (str): The scenario. One of scenarios
+
+		Returns:
+			list[Tuple[list[pygame.event.Event], Tuple[float, float]]]: The events and the position of the mouse of each frame
+		"""
+		self.wordle.scenes.show(self.wordle, name)
+		scene = self.wordle.scenes.scene
+		frames = []
+
+		if (name == "Play"):
+			scene.game = GameSession(self.secretWord, self.wordle.acceptedWords)
+			scene.secretWord = scene.game.secretWord
+			for guess in self.guesses:
+				frames += self.type(guess) + [self.press(pygame.K_RETURN)]
+
+			# a word that isn't in the word list shows the alert
+			frames += self.type("ABCDE") + [self.press(pygame.K_RETURN)] + [self.press(pygame.K_BACKSPACE)] * 5
+		else:
+			boxes = [scene.usernameTxt, scene.passwordTxt] + ([scene.verifyPasswordTxt] if name == "SignUp" else [])
+			for box, text in zip(boxes, ("bench", "password", "password")):
+				frames += [self.click(self.center(box))] + self.type(text)
+
+		return frames
+
+	def run(self, name: str, traced: bool) -> dict:
+		"""Plays a scenario for the number of frames
+
+		Args:
+			name (str): The scenario. One of scenarios
+			traced (bool): Whether to count the memory each frame allocates
+
+		Returns:
+			dict: The seconds of each frame, and the bytes each frame allocated and kept if traced
+		"""
+		fontLoads = FontRegistry.misses
+		textRenders = Text.renderCache.misses
+		frames = self.script(name)
+		keyboard = self.keyboardFrames()
+
+		seconds = []
+		allocated = []
+		if (traced):
+			tracemalloc.start()
+			startBytes = tracemalloc.get_traced_memory()[0]
+
+		for i in range(self.frames):
+			# the guesses are only played once so the game never ends
+			events, mousePos = frames[i] if i < len(frames) else keyboard[(i - len(frames)) % len(keyboard)]
+			if (traced):
+				tracemalloc.reset_peak()
+				before = tracemalloc.get_traced_memory()[0]
+
+			start = time.perf_counter()
+			self.wordle.scenes.frame(self.wordle, events, mousePos)
+			seconds.append(time.perf_counter() - start)
+
+			if (traced):
+				allocated.append(tracemalloc.get_traced_memory()[1] - before)
+
+		result = {"seconds": seconds, "fontLoads": FontRegistry.misses - fontLoads, "textRenders": Text.renderCache.misses - textRenders}
+		if (traced):
+			result["allocated"] = allocated
+			result["retainedBytes"] = tracemalloc.get_traced_memory()[0] - startBytes
+			tracemalloc.stop()
+		return result
+
+	def measure(self, name: str) -> dict:
+		"""Times a scenario and then counts what it allocates
+
+		Args:
+			name (str): The scenario. One of scenarios
+
+		Returns:
+			dict: The frames per second, frame time percentiles, allocations per frame and the fonts and strings it loaded
+		"""
+		timed = self.run(name, False)
+		traced = self.run(name, True)
+
+		ordered = sorted(timed["seconds"])
+		last = len(ordered) - 1
+		return {
+			"frames": self.frames,
+			"fps": round(self.frames / sum(timed["seconds"]), 1),
+			"frameMsP50": round(ordered[round(last * 0.5)] * 1000, 3),
+			"frameMsP95": round(ordered[round(last * 0.95)] * 1000, 3),
+			"frameMsP99": round(ordered[round(last * 0.99)] * 1000, 3),
+			"allocatedBytesPerFrame": round(sum(traced["allocated"]) / self.frames),
+			"maxAllocatedBytes": max(traced["allocated"]),
+			"retainedBytes": traced["retainedBytes"],
+			"fontLoads": timed["fontLoads"],
+			"textRenders": timed["textRenders"],
+		}
+
+	def close(self):
+		"""Closes the window and the users kept in memory"""
+		self.wordle.scenes.scene.exit()
+		self.wordle.stats.close()
+		self.wordle.users.close()
+		self.folder.cleanup()
+		pygame.quit()
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+	"""Finds the metrics that got worse than the baseline by more than the tolerance
+
+	Args:
+		results (dict): The results of this run
+		baseline (dict): The results of an earlier run
+		tolerance (float): How much worse a metric can get before it counts, as a fraction
+
+	Returns:
+		list[str]: A description of each regression
+	"""
+	# whether a bigger number is better for each metric that is checked
+	metrics = {"fps": True, "frameMsP95": False, "allocatedBytesPerFrame": False, "fontLoads": False, "textRenders": False}
+
+	regressions = []
+	for name, result in results["scenarios"].items():
+		base = baseline.get("scenarios", {}).get(name)
+		if (base == None):
+			continue
+		for metric, biggerIsBetter in metrics.items():
+			if (metric not in base):
+				continue
+			now, before = result[metric], base[metric]
+			if (biggerIsBetter and now < before * (1 - tolerance)) or (not biggerIsBetter and now > before * (1 + tolerance) and now - before > 1):
+				regressions.append(f"{name} {metric} went from {before} to {now}")
+	return regressions
+
+
+if __name__ == "__main__":
+	benchmarks = os.path.join(gameFolder, "benchmarks")
+	parser = argparse.ArgumentParser(description="Renders the screens headless with scripted events and compares the results to a baseline")
+	parser.add_argument("scenarios", nargs="*", default=list(RenderBenchmark.scenarios), help="the screens to benchmark")
+	parser.add_argument("--frames", type=int, default=600, help="how many frames each screen runs")
+	parser.add_argument("--output", default=os.path.join(benchmarks, "RenderResults.json"), help="where to write the results")
+	parser.add_argument("--baseline", default=os.path.join(benchmarks, "RenderBaseline.json"), help="the results to compare against")
+	parser.add_argument("--tolerance", type=float, default=0.25, help="how much worse a metric can get before it is a regression")
+	parser.add_argument("--save-baseline", action="store_true", help="save the results as the new baseline")
+	arguments = parser.parse_args()
+
+	benchmark = RenderBenchmark(arguments.frames)
+	results = {"python": platform.python_version(), "pygame": pygame.version.ver, "scenarios": {}}
+	for name in arguments.scenarios:
+		results["scenarios"][name] = benchmark.measure(name)
+		summary = results["scenarios"][name]
+		print(f"{name}: {summary['fps']} fps, p95 {summary['frameMsP95']} ms, {summary['allocatedBytesPerFrame']} bytes allocated per frame, "
+			f"{summary['fontLoads']} font loads, {summary['textRenders']} text renders")
+	benchmark.close()
+
+	with open(arguments.output, "w") as file:
+		json.dump(results, file, indent=4)
+
+	if (arguments.save_baseline):
+		with open(arguments.baseline, "w") as file:
+			json.dump(results, file, indent=4)
+		print(f"Saved the baseline to {arguments.baseline}")
+	elif (os.path.exists(arguments.baseline)):
+		with open(arguments.baseline) as file:
+			regressions = compare(results, json.load(file), arguments.tolerance)
+		for regression in regressions:
+			print(f"Regression: {regression}")
+		if (regressions):
+			sys.exit(1)
+		print(f"No regressions against {arguments.baseline}")
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# the game's modules import each other from the game's folder
+gameFolder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, gameFolder)
@@ -0,0 +1,54 @@
+import numpy as np
+from Feedback import Feedback
+from FeedbackMatrix import FeedbackMatrix
+
+
+words = ["crane", "slate", "speed", "abide", "erase", "geese", "eerie", "llama", "allay", "sassy", "asses", "proud"]
+
+
+def test_statesWithDuplicateLetters():
+	G, Y, B = Feedback.green, Feedback.yellow, Feedback.gray
+
+	# only as many letters are colored as the answer has
+	assert Feedback.states("speed", "abide") == [B, B, Y, B, Y]
+	assert Feedback.states("geese", "erase") == [B, Y, B, G, G]
+	assert Feedback.states("eerie", "geese") == [Y, G, B, B, G]
+	assert Feedback.states("llama", "allay") == [Y, G, Y, B, Y]
+	assert Feedback.states("sassy", "asses") == [Y, Y, G, Y, B]
+
+
+def test_encodeDecode():
+	for pattern in range(3 ** 5):
+		assert Feedback.encode(Feedback.decode(pattern)) == pattern
+	assert Feedback.score("proud", "proud") == Feedback.solved()
+
+
+def test_matrixAgreesWithScore():
+	feedback = FeedbackMatrix.build(words)
+
+	for i, guess in enumerate(words):
+		for j, answer in enumerate(words):
+			assert feedback.matrix[i, j] == Feedback.score(guess, answer), (guess, answer)
+
+
+def test_matrixSmallChunks():
+	letters = FeedbackMatrix.toArray(words)
+	assert np.array_equal(FeedbackMatrix.scoreMany(letters, letters, chunkSize=5), FeedbackMatrix.build(words).matrix)
+
+
+def test_rowOfWordOutsideMatrix():
+	feedback = FeedbackMatrix.build(words[:4], words)
+	assert list(feedback.row("geese")) == [Feedback.score("geese", answer) for answer in words]
+
+
+def test_saveAndOpen(tmp_path):
+	path = str(tmp_path / "matrix.npz")
+	feedback = FeedbackMatrix.build(words)
+	feedback.save(path)
+
+	loaded = FeedbackMatrix.open(path, words)
+	assert np.array_equal(loaded.matrix, feedback.matrix)
+
+	# a matrix for other words is built again
+	other = FeedbackMatrix.open(path, words[:3])
+	assert other.matrix.shape == (3, 3)
@@ -0,0 +1,52 @@
+import pytest
+from Feedback import Feedback
+from GameSession import GameSession
+
+
+words = {"crane", "slate", "speed", "abide", "proud", "geese"}
+
+
+def test_win():
+	game = GameSession("abide", words)
+
+	assert game.guess("speed") == Feedback.score("speed", "abide")
+	assert not game.isOver
+	assert game.result == None
+	assert game.guess("ABIDE") == Feedback.solved()
+	assert game.isWon
+	assert game.result == "win"
+	assert game.guesses == ["SPEED", "ABIDE"]
+	assert game.endTime != None
+
+	with pytest.raises(ValueError):
+		game.guess("crane")
+
+
+def test_lose():
+	game = GameSession("proud", words, maxGuesses=2)
+	game.guess("crane")
+	game.guess("slate")
+
+	assert game.isOver
+	assert not game.isWon
+	assert game.result == "lose"
+
+
+def test_rejectsUnknownWords():
+	game = GameSession("proud", words)
+
+	with pytest.raises(ValueError):
+		game.guess("zzzzz")
+	with pytest.raises(ValueError):
+		game.guess("prou")
+	assert game.guesses == []
+
+
+def test_letters():
+	game = GameSession("abide", words)
+	game.guess("speed")
+
+	# only one of the Es was in the word
+	assert game.yellowLetters == "ED"
+	assert game.blackLetters == "SPE"
+	assert game.greenLetters == ""
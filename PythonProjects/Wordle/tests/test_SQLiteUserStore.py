@@ -0,0 +1,34 @@
+import json
+from tinydb import TinyDB
+from SQLiteUserStore import SQLiteUserStore
+from StatsJournal import StatsJournal
+from User import User
+from UserRepository import UserRepository
+
+
+def test_migrateFromTinyDB(tmp_path):
+	source = UserRepository(TinyDB(str(tmp_path / "db.json")), str(tmp_path / "db.history"))
+	source.insert(User("tyler", "hash").toDocument())
+	source.insert(User("kate", "hash").toDocument())
+
+	records = [{'sequence': 1, 'username': "tyler", 'word': "crane", 'guesses': 3, 'seconds': 20.0, 'result': "win", 'finished': 1700000001},
+			{'sequence': 2, 'username': "kate", 'word': "crane", 'guesses': 6, 'seconds': 95.5, 'result': "lose", 'finished': 1700000002}]
+	with open(tmp_path / "db.journal", "w") as file:
+		file.writelines(json.dumps(record) + "\n" for record in records)
+	StatsJournal(source, str(tmp_path / "db.journal")).close()
+
+	target = SQLiteUserStore(str(tmp_path / "users.sqlite"))
+	assert target.importUsers(source.all(), source.games(), source.wordStats()) == 2
+
+	for user in source.all():
+		assert target.find(user['username']) == user
+	assert target.exists("kate")
+	assert not target.exists("nobody")
+	assert [(game['username'], game['word'], game['result']) for game in target.games()] == [("tyler", "crane", "win"), ("kate", "crane", "lose")]
+	assert target.games("kate")[0]['guesses'] == 6
+	assert target.wordStats()['crane'] == {'plays': 2, 'wins': 1, 'guesses': 3}
+
+	# running it again doesn't add anyone or copy the history twice
+	assert target.importUsers(source.all(), source.games(), source.wordStats()) == 0
+	assert len(target.games()) == 2
+	target.close()
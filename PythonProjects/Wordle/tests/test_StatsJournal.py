@@ -0,0 +1,105 @@
+import json
+from tinydb import TinyDB
+from GameSession import GameSession
+from StatsJournal import StatsJournal
+from User import User
+from UserRepository import UserRepository
+
+
+def openRepository(folder) -> UserRepository:
+	return UserRepository(TinyDB(str(folder / "db.json")), str(folder / "db.history"))
+
+
+def result(sequence: int, username: str, word: str, guesses: int, outcome: str) -> dict:
+	return {'sequence': sequence, 'username': username, 'word': word, 'guesses': guesses, 'seconds': 12.5, 'result': outcome, 'finished': 1700000000 + sequence}
+
+
+def writeJournal(path, records: list[dict], partial: str=""):
+	with open(path, "w") as file:
+		file.writelines(json.dumps(record) + "\n" for record in records)
+		file.write(partial)
+
+
+def test_recordAndClose(tmp_path):
+	users = openRepository(tmp_path)
+	users.insert(User("tyler", "hash").toDocument())
+	journal = StatsJournal(users, str(tmp_path / "db.journal"), compactEvery=100)
+
+	game = GameSession("crane", {"crane", "slate"})
+	game.guess("slate")
+	game.guess("crane")
+	journal.record("tyler", game)
+
+	# the result counts before it is compacted
+	assert journal.find("tyler")['gamesWon'] == 1
+	journal.close()
+
+	users = openRepository(tmp_path)
+	assert users.find("tyler")['gamesWon'] == 1
+	assert users.find("tyler")['distribution'][1] == 1
+	assert users.metadata()['journalApplied'] == 1
+	assert users.wordStats()['crane'] == {'plays': 1, 'wins': 1, 'guesses': 2}
+	assert [game['word'] for game in users.games("tyler")] == ["crane"]
+	assert (tmp_path / "db.journal").read_text() == ""
+
+
+def test_replayAfterCrash(tmp_path):
+	users = openRepository(tmp_path)
+	users.insert(User("tyler", "hash").toDocument())
+	users.insert(User("kate", "hash").toDocument())
+
+	# the game stopped with three results in the journal and the last one only partly written
+	records = [result(1, "tyler", "crane", 3, "win"), result(2, "kate", "crane", 6, "lose"), result(3, "tyler", "slate", 4, "win")]
+	writeJournal(tmp_path / "db.journal", records, json.dumps(result(4, "kate", "slate", 2, "win"))[:20])
+	users.close()
+
+	users = openRepository(tmp_path)
+	journal = StatsJournal(users, str(tmp_path / "db.journal"))
+	journal.close()
+
+	users = openRepository(tmp_path)
+	tyler, kate = users.find("tyler"), users.find("kate")
+	assert (tyler['gamesWon'], tyler['gamesLost'], tyler['currentStreak']) == (2, 0, 2)
+	assert (kate['gamesWon'], kate['gamesLost'], kate['currentStreak']) == (0, 1, 0)
+	assert users.metadata()['journalApplied'] == 3
+	assert users.wordStats()['crane'] == {'plays': 2, 'wins': 1, 'guesses': 3}
+	assert [game['word'] for game in users.games()] == ["crane", "crane", "slate"]
+
+	# opening it again doesn't count them twice
+	StatsJournal(users, str(tmp_path / "db.journal")).close()
+	users = openRepository(tmp_path)
+	assert users.find("tyler")['gamesWon'] == 2
+	assert len(users.games()) == 3
+
+
+def test_replaySkipsAppliedResults(tmp_path):
+	users = openRepository(tmp_path)
+	users.insert(User("tyler", "hash").toDocument())
+	users.updateMany({}, {'journalApplied': 1})
+
+	# the game stopped after the snapshot was written but before the journal was rewritten
+	writeJournal(tmp_path / "db.journal", [result(1, "tyler", "crane", 3, "win"), result(2, "tyler", "slate", 5, "win")])
+	StatsJournal(users, str(tmp_path / "db.journal")).close()
+
+	users = openRepository(tmp_path)
+	assert users.find("tyler")['gamesWon'] == 1
+	assert users.metadata()['journalApplied'] == 2
+
+
+def test_replayAfterHistoryWasAppended(tmp_path):
+	users = openRepository(tmp_path)
+	users.insert(User("tyler", "hash").toDocument())
+	records = [result(1, "tyler", "crane", 3, "win"), result(2, "tyler", "slate", 5, "win")]
+
+	# the game stopped after the history was appended but before the users were written
+	with open(tmp_path / "db.history", "w") as file:
+		file.writelines(json.dumps(record) + "\n" for record in records)
+	writeJournal(tmp_path / "db.journal", records)
+	users.close()
+
+	users = openRepository(tmp_path)
+	StatsJournal(users, str(tmp_path / "db.journal")).close()
+
+	users = openRepository(tmp_path)
+	assert users.find("tyler")['gamesWon'] == 2
+	assert [game['word'] for game in users.games()] == ["crane", "slate"]
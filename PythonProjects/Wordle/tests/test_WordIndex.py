@@ -0,0 +1,90 @@
+import random
+import pytest
+from WordIndex import WordIndex
+
+
+words = ["crane", "slate", "Proud", "speed", "abide", "erase", "geese", "toolong", "ab1de", "crane"]
+
+
+def test_packsAndSorts():
+	index = WordIndex(words)
+
+	# words that aren't 5 lowercase letters are left out and duplicates are kept once
+	assert list(index) == ["abide", "crane", "erase", "geese", "proud", "slate", "speed"]
+	assert len(index) == 7
+	assert index[-1] == "speed"
+	assert "PROUD" in index
+	assert "ab1de" not in index
+	assert index.indexOf("geese") == 3
+	assert index.indexOf("zzzzz") == -1
+	with pytest.raises(IndexError):
+		index[7]
+
+
+def test_masksMatchBruteForce():
+	index = WordIndex(words)
+	rng = random.Random(1)
+	for _ in range(200):
+		known = {rng.randrange(5): rng.choice("aceps")} if rng.random() < 0.5 else {}
+		misplaced = {rng.randrange(5): rng.choice("aer")} if rng.random() < 0.5 else {}
+		contains = rng.choice(["", "e", "ea"])
+		excludes = rng.choice(["", "s", "ot"])
+
+		expected = [word for word in index
+					if all(word[position] == letter for position, letter in known.items())
+					and all(letter in word and word[position] != letter for position, letters in misplaced.items() for letter in letters)
+					and all(letter in word for letter in contains)
+					and not any(letter in word for letter in excludes)]
+		assert index.match(known, misplaced, contains, excludes) == expected
+		assert index.count(known, misplaced, contains, excludes) == len(expected)
+
+
+def test_compileAndLoad(tmp_path):
+	path = str(tmp_path / "words.bin")
+	index = WordIndex(words)
+	index.compile(path)
+
+	loaded = WordIndex.load(path)
+	assert loaded.wordLength == 5
+	assert list(loaded) == list(index)
+	assert loaded.match(contains="e", excludes="s") == index.match(contains="e", excludes="s")
+	loaded.codes.close()
+
+
+def test_loadRejectsBadChecksum(tmp_path):
+	path = str(tmp_path / "words.bin")
+	WordIndex(words).compile(path)
+
+	# flip a letter of the last word
+	with open(path, "r+b") as file:
+		file.seek(-1, 2)
+		letter = file.read(1)
+		file.seek(-1, 2)
+		file.write(bytes([letter[0] ^ 1]))
+
+	with pytest.raises(ValueError):
+		WordIndex.load(path)
+
+
+def test_loadRejectsWrongSize(tmp_path):
+	path = str(tmp_path / "words.bin")
+	WordIndex(words).compile(path)
+	with open(path, "ab") as file:
+		file.write(b"x")
+
+	with pytest.raises(ValueError):
+		WordIndex.load(path)
+
+
+def test_openFallsBackToText(tmp_path):
+	textPath = tmp_path / "words.txt"
+	textPath.write_text("\n".join(words))
+	(tmp_path / "words.bin").write_bytes(b"not an index")
+
+	index = WordIndex.open(str(textPath))
+	assert list(index) == list(WordIndex(words))
+
+	# the text file was compiled for next time
+	loaded = WordIndex.load(str(tmp_path / "words.bin"))
+	assert list(loaded) == list(index)
+	loaded.codes.close()